@@ -1,12 +1,14 @@
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config
-from sqlalchemy import pool, text
+from sqlalchemy import text
 from alembic import context
 import os
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Make shared migration helpers (alembic/migration_utils.py) importable
+sys.path.append(str(Path(__file__).resolve().parent))
 
 from src.config import settings
 from src.database import Base
@@ -28,10 +30,11 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Resolved once; include_object runs for every object autogenerate inspects
+_TARGET_SCHEMA = settings.DATABASE_SCHEMA
+
 def include_object(object, name, type_, reflected, compare_to):
-    if type_ == "table" and hasattr(object, "schema"):
-        return object.schema == settings.DATABASE_SCHEMA
-    return True
+    return type_ != "table" or getattr(object, "schema", None) == _TARGET_SCHEMA
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -41,7 +44,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         include_object=include_object,
-        version_table_schema=settings.DATABASE_SCHEMA,
+        version_table_schema=_TARGET_SCHEMA,
     )
 
     with context.begin_transaction():
@@ -50,28 +53,40 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    # A single warm, pre-pinged connection is reused for the schema bootstrap
+    # and every migration instead of reconnecting per checkout.
+    configuration["sqlalchemy.pool_size"] = "1"
+    configuration["sqlalchemy.max_overflow"] = "0"
+    configuration["sqlalchemy.pool_pre_ping"] = "true"
     
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.DATABASE_SCHEMA}"))
-        connection.commit()
-        
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            include_object=include_object,
-            version_table_schema=settings.DATABASE_SCHEMA,
-            compare_type=True,
-            compare_server_default=True,
-        )
+    try:
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                include_object=include_object,
+                version_table_schema=_TARGET_SCHEMA,
+                compare_type=True,
+                compare_server_default=True,
+            )
 
-        with context.begin_transaction():
-            context.run_migrations()
+            # Schema bootstrap and migrations share one transaction, except that a
+            # revision using autocommit_block() (the CONCURRENTLY index builds)
+            # commits everything before it and the run continues in a new
+            # transaction afterwards. synchronous_commit is set for the session so
+            # it survives those commits; skipping the WAL flush wait is safe here
+            # since a crash mid-run just means re-running alembic.
+            with context.begin_transaction():
+                connection.execute(text("SET synchronous_commit = off"))
+                connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {_TARGET_SCHEMA}"))
+                context.run_migrations()
+    finally:
+        connectable.dispose()
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,63 @@
+"""
+Shared helpers for Alembic migration scripts.
+
+Kept outside ``alembic/versions`` so Alembic does not try to load this module
+as a revision file. ``env.py`` puts this directory on ``sys.path``.
+"""
+import csv
+import io
+from typing import Any, Dict, Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# Above this many rows COPY beats multi-row INSERT ... VALUES
+COPY_THRESHOLD = 10_000
+
+
+def bulk_seed(table: sa.sql.TableClause, rows: Sequence[Dict[str, Any]]) -> None:
+    """Insert seed rows (dicts keyed by column name) into ``table``.
+
+    Rows go through ``op.bulk_insert`` so the seed is also emitted as plain
+    INSERTs in offline (``--sql``) mode. Large seeds on a live connection are
+    loaded with ``COPY ... FROM STDIN`` instead.
+    """
+    if not rows:
+        return
+
+    if len(rows) <= COPY_THRESHOLD or context.is_offline_mode():
+        op.bulk_insert(table, list(rows))
+        return
+
+    columns = [column.name for column in table.c]
+    buffer = io.StringIO()
+    # None is written as an unquoted empty field, which COPY reads as NULL
+    csv.writer(buffer).writerows([row.get(column) for column in columns] for row in rows)
+    buffer.seek(0)
+    # COPY needs the driver (psycopg2) cursor; Alembic has no COPY construct
+    cursor = op.get_bind().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.schema}.{table.name} ({', '.join(columns)}) FROM STDIN WITH CSV",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def attach_updated_at_trigger(table: str, schema: str = "sentinel") -> None:
+    """Keep ``table.updated_at`` current on every UPDATE via the shared trigger function.
+
+    Requires ``sentinel.update_updated_at_column()`` (created in 45e5719c7fbc).
+    """
+    op.execute(f"""
+        CREATE TRIGGER update_{table}_updated_at
+        BEFORE UPDATE ON {schema}.{table}
+        FOR EACH ROW
+        EXECUTE FUNCTION {schema}.update_updated_at_column();
+    """)
+
+
+def detach_updated_at_trigger(table: str, schema: str = "sentinel") -> None:
+    """Drop the trigger created by :func:`attach_updated_at_trigger`."""
+    op.execute(f"DROP TRIGGER IF EXISTS update_{table}_updated_at ON {schema}.{table}")
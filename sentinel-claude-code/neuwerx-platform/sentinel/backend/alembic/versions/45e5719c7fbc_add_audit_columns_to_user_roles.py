@@ -9,6 +9,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from migration_utils import attach_updated_at_trigger, detach_updated_at_trigger
+
 # revision identifiers, used by Alembic.
 revision = '45e5719c7fbc'
 down_revision = '5d08be7e2a62'
@@ -17,18 +19,12 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add created_at and updated_at columns to user_roles table
-    op.add_column('user_roles', 
-        sa.Column('created_at', sa.DateTime(timezone=True), 
-                  server_default=sa.text('now()'), nullable=False),
-        schema='sentinel'
-    )
-    
-    op.add_column('user_roles', 
-        sa.Column('updated_at', sa.DateTime(timezone=True), 
-                  server_default=sa.text('now()'), nullable=False),
-        schema='sentinel'
-    )
+    # Add created_at and updated_at columns to user_roles table in one ALTER TABLE
+    op.execute("""
+        ALTER TABLE sentinel.user_roles
+            ADD COLUMN created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    """)
     
     # Create an update trigger for updated_at column
     op.execute("""
@@ -39,18 +35,13 @@ def upgrade() -> None:
             RETURN NEW;
         END;
         $$ language 'plpgsql';
-        
-        CREATE TRIGGER update_user_roles_updated_at 
-        BEFORE UPDATE ON sentinel.user_roles 
-        FOR EACH ROW 
-        EXECUTE FUNCTION sentinel.update_updated_at_column();
     """)
+    attach_updated_at_trigger('user_roles')
 
 
 def downgrade() -> None:
     # Drop the trigger first
-    op.execute("DROP TRIGGER IF EXISTS update_user_roles_updated_at ON sentinel.user_roles")
+    detach_updated_at_trigger('user_roles')
     
     # Drop the columns
-    op.drop_column('user_roles', 'updated_at', schema='sentinel')
-    op.drop_column('user_roles', 'created_at', schema='sentinel')
\ No newline at end of file
+    op.execute("ALTER TABLE sentinel.user_roles DROP COLUMN updated_at, DROP COLUMN created_at")
\ No newline at end of file
@@ -17,13 +17,26 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Create role_type enum explicitly so the column below can skip the CREATE TYPE probe
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_type
+                WHERE typname = 'role_type' AND typnamespace = 'sentinel'::regnamespace
+            ) THEN
+                CREATE TYPE sentinel.role_type AS ENUM ('system', 'custom');
+            END IF;
+        END $$;
+    """)
+    
     # Create roles table
     op.create_table('roles',
         sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('name', sa.String(length=100), nullable=False),
         sa.Column('display_name', sa.String(length=255), nullable=True),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('type', sa.Enum('system', 'custom', name='role_type', schema='sentinel'), nullable=False),
+        sa.Column('type', postgresql.ENUM('system', 'custom', name='role_type', schema='sentinel', create_type=False), nullable=False),
         sa.Column('parent_role_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('is_assignable', sa.Boolean(), nullable=True, default=True),
         sa.Column('priority', sa.Integer(), nullable=True, default=0),
@@ -0,0 +1,31 @@
+"""attach updated_at triggers to group join tables
+
+Revision ID: a3f1c9e2b7d4
+Revises: ccdf5d077792
+Create Date: 2026-10-17 09:40:03.904512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_utils import attach_updated_at_trigger, detach_updated_at_trigger
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9e2b7d4'
+down_revision = 'ccdf5d077792'
+branch_labels = None
+depends_on = None
+
+# Tables that gained updated_at in c85556e31b52 without a trigger
+TABLES = ('user_groups', 'group_roles')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        attach_updated_at_trigger(table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        detach_updated_at_trigger(table)
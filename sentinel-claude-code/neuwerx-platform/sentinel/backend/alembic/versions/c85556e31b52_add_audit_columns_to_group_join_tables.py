@@ -18,15 +18,20 @@ depends_on = None
 
 def upgrade() -> None:
     # Add created_at and updated_at to sentinel.user_groups and sentinel.group_roles
-    op.add_column('user_groups', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')), schema='sentinel')
-    op.add_column('user_groups', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')), schema='sentinel')
-    op.add_column('group_roles', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')), schema='sentinel')
-    op.add_column('group_roles', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()')), schema='sentinel')
+    # One ALTER TABLE per table so both columns are added in a single pass
+    op.execute("""
+        ALTER TABLE sentinel.user_groups
+            ADD COLUMN created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+    """)
+    op.execute("""
+        ALTER TABLE sentinel.group_roles
+            ADD COLUMN created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            ADD COLUMN updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+    """)
 
 
 def downgrade() -> None:
     # Remove created_at and updated_at
-    op.drop_column('user_groups', 'created_at', schema='sentinel')
-    op.drop_column('user_groups', 'updated_at', schema='sentinel')
-    op.drop_column('group_roles', 'created_at', schema='sentinel')
-    op.drop_column('group_roles', 'updated_at', schema='sentinel')
\ No newline at end of file
+    op.execute("ALTER TABLE sentinel.user_groups DROP COLUMN created_at, DROP COLUMN updated_at")
+    op.execute("ALTER TABLE sentinel.group_roles DROP COLUMN created_at, DROP COLUMN updated_at")
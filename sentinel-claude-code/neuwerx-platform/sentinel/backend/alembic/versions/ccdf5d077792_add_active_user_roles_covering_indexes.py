@@ -0,0 +1,41 @@
+"""add active user_roles covering indexes
+
+Revision ID: ccdf5d077792
+Revises: 72cd861f3c60
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ccdf5d077792'
+down_revision = '72cd861f3c60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial covering indexes for the RBAC lookups, which only ever read active
+    # assignments: "roles for a user" and "users holding a role". INCLUDE lets
+    # both be answered with index-only scans.
+    # user_roles already holds data, so build CONCURRENTLY (outside the migration
+    # transaction) to avoid blocking writes while the indexes are created.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_roles_user_active
+            ON sentinel.user_roles (user_id) INCLUDE (role_id, expires_at)
+            WHERE is_active
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_roles_role_active
+            ON sentinel.user_roles (role_id) INCLUDE (user_id)
+            WHERE is_active
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sentinel.ix_user_roles_role_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sentinel.ix_user_roles_user_active")
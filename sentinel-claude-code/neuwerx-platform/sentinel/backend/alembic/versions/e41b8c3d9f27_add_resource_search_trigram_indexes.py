@@ -0,0 +1,40 @@
+"""add resource search trigram indexes
+
+Revision ID: e41b8c3d9f27
+Revises: a3f1c9e2b7d4
+Create Date: 2026-10-17 15:22:09.640381
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41b8c3d9f27'
+down_revision = 'a3f1c9e2b7d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Resource search is "name ILIKE '%q%' OR code ILIKE '%q%'"; trigram GIN
+    # indexes serve unanchored ILIKE, so each arm becomes a bitmap index scan
+    # instead of a full scan of resources.
+    # Build CONCURRENTLY (outside the migration transaction) to avoid blocking writes.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_resources_name_trgm
+            ON sentinel.resources USING gin (name gin_trgm_ops)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_resources_code_trgm
+            ON sentinel.resources USING gin (code gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sentinel.ix_resources_code_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS sentinel.ix_resources_name_trgm")
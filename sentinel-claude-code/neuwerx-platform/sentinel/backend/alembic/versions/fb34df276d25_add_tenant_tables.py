@@ -9,6 +9,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from migration_utils import bulk_seed
+
 # revision identifiers, used by Alembic.
 revision = 'fb34df276d25'
 down_revision = None
@@ -20,18 +22,34 @@ def upgrade() -> None:
     # Create sentinel schema if it doesn't exist
     op.execute("CREATE SCHEMA IF NOT EXISTS sentinel")
     
-    # Create enum types
-    op.execute("CREATE TYPE sentinel.tenant_type AS ENUM ('root', 'sub_tenant')")
-    op.execute("CREATE TYPE sentinel.isolation_mode AS ENUM ('shared', 'dedicated')")
+    # Create enum types in one round-trip; PostgreSQL has no CREATE TYPE IF NOT EXISTS,
+    # so guard each one to keep reruns after a partial failure idempotent
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_type
+                WHERE typname = 'tenant_type' AND typnamespace = 'sentinel'::regnamespace
+            ) THEN
+                CREATE TYPE sentinel.tenant_type AS ENUM ('root', 'sub_tenant');
+            END IF;
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_type
+                WHERE typname = 'isolation_mode' AND typnamespace = 'sentinel'::regnamespace
+            ) THEN
+                CREATE TYPE sentinel.isolation_mode AS ENUM ('shared', 'dedicated');
+            END IF;
+        END $$;
+    """)
     
     # Create tenants table
     op.create_table('tenants',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('code', sa.String(length=50), nullable=False),
-        sa.Column('type', postgresql.ENUM('root', 'sub_tenant', name='tenant_type', schema='sentinel'), nullable=False),
+        sa.Column('type', postgresql.ENUM('root', 'sub_tenant', name='tenant_type', schema='sentinel', create_type=False), nullable=False),
         sa.Column('parent_tenant_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('isolation_mode', postgresql.ENUM('shared', 'dedicated', name='isolation_mode', schema='sentinel'), nullable=False),
+        sa.Column('isolation_mode', postgresql.ENUM('shared', 'dedicated', name='isolation_mode', schema='sentinel', create_type=False), nullable=False),
         sa.Column('settings', postgresql.JSON(astext_type=sa.Text()), nullable=True),
         sa.Column('features', postgresql.ARRAY(sa.Text()), nullable=True),
         sa.Column('tenant_metadata', postgresql.JSON(astext_type=sa.Text()), nullable=True),
@@ -50,23 +68,34 @@ def upgrade() -> None:
     op.create_index('idx_tenants_is_active', 'tenants', ['is_active'], schema='sentinel')
     
     # Insert platform tenant
-    op.execute("""
-        INSERT INTO sentinel.tenants (
-            id, name, code, type, parent_tenant_id, 
-            isolation_mode, settings, features, tenant_metadata, is_active
-        ) VALUES (
-            '00000000-0000-0000-0000-000000000000'::uuid,
-            'Sentinel Platform',
-            'PLATFORM',
-            'root',
-            NULL,
-            'dedicated',
-            '{}',
-            '{}',
-            '{"description": "Root platform tenant for system administration"}',
-            true
-        )
-    """)
+    tenants = sa.table(
+        'tenants',
+        sa.column('id', sa.String),
+        sa.column('name', sa.String),
+        sa.column('code', sa.String),
+        sa.column('type', sa.String),
+        sa.column('parent_tenant_id', sa.String),
+        sa.column('isolation_mode', sa.String),
+        sa.column('settings', sa.String),
+        sa.column('features', sa.String),
+        sa.column('tenant_metadata', sa.String),
+        sa.column('is_active', sa.Boolean),
+        schema='sentinel'
+    )
+    bulk_seed(tenants, [
+        {
+            'id': '00000000-0000-0000-0000-000000000000',
+            'name': 'Sentinel Platform',
+            'code': 'PLATFORM',
+            'type': 'root',
+            'parent_tenant_id': None,
+            'isolation_mode': 'dedicated',
+            'settings': '{}',
+            'features': '{}',
+            'tenant_metadata': '{"description": "Root platform tenant for system administration"}',
+            'is_active': True,
+        },
+    ])
 
 
 def downgrade() -> None:
@@ -0,0 +1,195 @@
+"""
+Shared bulk-seeding helpers for the seed scripts
+
+seed_tenants.py and seed_simple_logistics.py supply their own row lists and
+use these helpers to write them. Each helper is a single set-based statement,
+so a seed costs the same number of round-trips however many rows it has.
+All work goes through one small connection pool.
+"""
+
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Add backend root to Python path for imports
+backend_root = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_root))
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import settings
+from src.database import database_url
+
+# Seeds run one transaction at a time, so a single pooled connection is enough
+seed_engine = create_async_engine(
+    database_url,
+    pool_size=1,
+    max_overflow=0,
+    connect_args={
+        "server_settings": {
+            "search_path": f"{settings.DATABASE_SCHEMA},public"
+        }
+    }
+)
+
+SeedSession = async_sessionmaker(bind=seed_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def _json(value) -> Optional[str]:
+    """Encode a payload for a json column; None stays NULL."""
+    return None if value is None else orjson.dumps(value).decode()
+
+
+async def bulk_upsert_tenants(session: AsyncSession, rows: List[dict]) -> Dict[str, Tuple[uuid.UUID, bool]]:
+    """Insert missing tenants in one statement and return {code: (id, created)}.
+
+    Each row needs ``name`` and ``code`` and may set ``id``, ``type``,
+    ``isolation_mode``, ``parent_code``, ``settings``, ``features`` and
+    ``metadata`` (or an already encoded ``metadata_json``). Existing codes
+    are left untouched. Rows whose ``parent_code`` does not resolve are
+    skipped and absent from the result. Parents must already exist; they are
+    not visible within the same call.
+    """
+    if not rows:
+        return {}
+
+    now = datetime.now(timezone.utc)
+    result = await session.execute(
+        text("""
+            WITH input AS (
+                SELECT * FROM unnest(
+                    CAST(:ids AS uuid[]), CAST(:names AS text[]), CAST(:codes AS text[]),
+                    CAST(:types AS text[]), CAST(:parent_codes AS text[]),
+                    CAST(:isolation_modes AS text[]), CAST(:settings AS text[]),
+                    CAST(:features AS text[]), CAST(:metadata AS text[])
+                ) AS t(id, name, code, type, parent_code, isolation_mode, settings, features, metadata)
+            ),
+            inserted AS (
+                INSERT INTO sentinel.tenants (
+                    id, name, code, type, parent_tenant_id, isolation_mode,
+                    settings, features, tenant_metadata, is_active, created_at, updated_at
+                )
+                SELECT i.id, i.name, i.code, CAST(i.type AS sentinel.tenant_type), p.id,
+                       CAST(i.isolation_mode AS sentinel.isolation_mode), CAST(i.settings AS json),
+                       ARRAY(SELECT json_array_elements_text(CAST(i.features AS json))),
+                       CAST(i.metadata AS json), true, :now, :now
+                FROM input i
+                LEFT JOIN sentinel.tenants p ON p.code = i.parent_code
+                WHERE i.parent_code IS NULL OR p.id IS NOT NULL
+                ON CONFLICT (code) DO NOTHING
+                RETURNING id, code
+            )
+            SELECT id, code, true AS created FROM inserted
+            UNION ALL
+            SELECT id, code, false FROM sentinel.tenants
+            WHERE code = ANY(CAST(:codes AS text[]))
+              AND code NOT IN (SELECT code FROM inserted)
+        """),
+        {
+            "ids": [row.get("id") or uuid.uuid4() for row in rows],
+            "names": [row["name"] for row in rows],
+            "codes": [row["code"] for row in rows],
+            "types": [row.get("type", "root") for row in rows],
+            "parent_codes": [row.get("parent_code") for row in rows],
+            "isolation_modes": [row.get("isolation_mode", "shared") for row in rows],
+            "settings": [_json(row.get("settings", {})) for row in rows],
+            "features": [_json(row.get("features", [])) for row in rows],
+            "metadata": [
+                row["metadata_json"] if "metadata_json" in row else _json(row.get("metadata", {}))
+                for row in rows
+            ],
+            "now": now
+        }
+    )
+    return {code: (tenant_id, created) for tenant_id, code, created in result.all()}
+
+
+async def bulk_upsert_users(session: AsyncSession, rows: List[tuple], password_hash: str) -> frozenset:
+    """Insert missing users in one statement and return the emails that were created.
+
+    Rows are ``(tenant_code, email, username, attributes_json)``. Tenant IDs
+    are resolved server-side by joining on code. Users are deduplicated by
+    email in the statement itself, since the users table has no unique
+    constraint to conflict on.
+    """
+    if not rows:
+        return frozenset()
+
+    now = datetime.now(timezone.utc)
+    result = await session.execute(
+        text("""
+            INSERT INTO sentinel.users (
+                id, tenant_id, email, username, password_hash, is_active,
+                attributes, created_at, updated_at
+            )
+            SELECT u.id, t.id, u.email, u.username, :password_hash, true,
+                   CAST(u.attributes AS json), :now, :now
+            FROM unnest(
+                CAST(:ids AS uuid[]), CAST(:tenant_codes AS text[]), CAST(:emails AS text[]),
+                CAST(:usernames AS text[]), CAST(:attributes AS text[])
+            ) AS u(id, tenant_code, email, username, attributes)
+            JOIN sentinel.tenants t ON t.code = u.tenant_code
+            WHERE NOT EXISTS (SELECT 1 FROM sentinel.users x WHERE x.email = u.email)
+            RETURNING email
+        """),
+        {
+            "ids": [uuid.uuid4() for _ in rows],
+            "tenant_codes": [tenant_code for tenant_code, _, _, _ in rows],
+            "emails": [email for _, email, _, _ in rows],
+            "usernames": [username for _, _, username, _ in rows],
+            "attributes": [attributes for _, _, _, attributes in rows],
+            "password_hash": password_hash,
+            "now": now
+        }
+    )
+    return frozenset(result.scalars())
+
+
+async def drop_secondary_indexes(session: AsyncSession, table: str) -> List[str]:
+    """Drop the plain secondary indexes on sentinel.<table>, returning their definitions.
+
+    Indexes backing constraints and unique indexes are kept, since they enforce
+    the primary key and deduplication during the load.
+    """
+    result = await session.execute(
+        text("""
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            WHERE i.schemaname = 'sentinel'
+              AND i.tablename = :table
+              AND i.indexdef NOT LIKE 'CREATE UNIQUE INDEX%'
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint c
+                  WHERE c.conname = i.indexname
+                    AND c.connamespace = 'sentinel'::regnamespace
+              )
+        """),
+        {"table": table}
+    )
+    indexes = result.all()
+    for index_name, _ in indexes:
+        await session.execute(text(f'DROP INDEX sentinel."{index_name}"'))
+    return [index_def for _, index_def in indexes]
+
+
+async def recreate_indexes(index_defs: Iterable[str]) -> None:
+    """Rebuild dropped indexes without blocking writes; must run after the load ends.
+
+    Indexes that still exist (the load rolled back its DROP) are skipped, so
+    this is safe to call whether the load committed or failed.
+    """
+    index_defs = list(index_defs)
+    if not index_defs:
+        return
+
+    async with seed_engine.connect() as connection:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        for index_def in index_defs:
+            await connection.execute(
+                text(index_def.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1))
+            )
@@ -14,12 +14,41 @@ Generates a comprehensive report showing:
 
 import os
 import re
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
 from enum import Enum
 
+import orjson
+
+try:
+    import xxhash
+
+    def _content_hash(data: bytes) -> str:
+        return xxhash.xxh3_64(data).hexdigest()
+except ImportError:  # xxhash is optional; blake2b is slower but always available
+    import hashlib
+
+    def _content_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+# FastAPI route decorators: @router.post("/", ...) or @router.get("/{id}", ...)
+_ROUTE_RE = re.compile(r'@router\.(get|post|put|patch|delete)\(\s*["\']([^"\']+)["\']')
+# Handler definition following a route decorator
+_FUNC_RE = re.compile(r'^(?:async\s+)?def\s+(\w+)', re.MULTILINE)
+# Path parameters such as {id} or {user_id}
+_PARAM_RE = re.compile(r'\{[^}]+\}')
+# Top-level spec sections: "### 1. Authentication & Token Management APIs"
+_SPEC_SECTION_RE = re.compile(r'^### (\d+\.[^\n]*)', re.MULTILINE)
+# Endpoint sub-headers ("#### 1.1 User Login") and ```http METHOD /path``` blocks
+_SPEC_ITEM_RE = re.compile(
+    r'^#### \d+\.\d+\s+(.+)$|```http\n(GET|POST|PUT|PATCH|DELETE)\s+(/[^\n]*)\n```',
+    re.MULTILINE
+)
+
 
 class ImplementationStatus(Enum):
     MATCHES = "✅ Implemented & Matches Spec"
@@ -28,6 +57,10 @@ class ImplementationStatus(Enum):
     MISSING = "❌ Missing (in spec but not implemented)"
 
 
+# Display strings materialized once for the summary and report loops
+_STATUS_STRINGS = {status: status.value for status in ImplementationStatus}
+
+
 @dataclass
 class APIEndpoint:
     method: str
@@ -37,6 +70,22 @@ class APIEndpoint:
     source: str  # "spec" or "implementation"
     status: ImplementationStatus = None
 
+    def __post_init__(self):
+        # Normalized path segments, tokenized once for key building and fuzzy matching.
+        # Plain attribute rather than a field so it stays out of the JSON report.
+        self._tokens: Tuple[str, ...] = tuple(APIAuditor._normalize_path(self.path).split('/'))
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Shallow dict of primitives for the JSON report (cheaper than asdict)."""
+        return {
+            "method": self.method,
+            "path": self.path,
+            "description": self.description,
+            "module": self.module,
+            "source": self.source,
+            "status": _STATUS_STRINGS[self.status] if self.status else None
+        }
+
 
 @dataclass
 class ModuleAudit:
@@ -48,6 +97,18 @@ class ModuleAudit:
     impl_endpoints: List[APIEndpoint]
     audit_results: Dict[str, ImplementationStatus]
 
+    def to_dict(self) -> Dict[str, object]:
+        """Dict of primitives for the JSON report (cheaper than asdict)."""
+        return {
+            "module_name": self.module_name,
+            "module_number": self.module_number,
+            "api_file": self.api_file,
+            "spec_section": self.spec_section,
+            "spec_endpoints": [ep.to_dict() for ep in self.spec_endpoints],
+            "impl_endpoints": [ep.to_dict() for ep in self.impl_endpoints],
+            "audit_results": {key: _STATUS_STRINGS[status] for key, status in self.audit_results.items()}
+        }
+
 
 class APIAuditor:
     def __init__(self, backend_root: str):
@@ -68,18 +129,77 @@ class APIAuditor:
             8: ("Service Accounts", "service_accounts.py", "11. Service Account Management APIs")
         }
         
+        # One directory listing instead of an exists() stat per module file
+        self._api_files: Dict[str, str] = {}
+        if self.api_dir.is_dir():
+            with os.scandir(self.api_dir) as entries:
+                self._api_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        
+        # Parsed endpoints from previous runs, keyed by file path and content hash.
+        # The hash of this script is stored too, so parser changes invalidate the cache.
+        self.cache_file = self.backend_root / ".api_audit_cache.json"
+        self._parser_hash = _content_hash(Path(__file__).read_bytes())
+        self._parse_cache: Dict[str, Dict] = self._load_parse_cache()
+        
         self.audit_results: List[ModuleAudit] = []
 
+    def _load_parse_cache(self) -> Dict[str, Dict]:
+        """Load the parse cache written by a previous run of this same parser, if any."""
+        try:
+            cache = orjson.loads(self.cache_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("parser") != self._parser_hash:
+            return {}
+        return cache.get("files", {})
+
+    def _save_parse_cache(self) -> None:
+        """Persist the parse cache for the next run."""
+        self.cache_file.write_bytes(orjson.dumps({"parser": self._parser_hash, "files": self._parse_cache}))
+
+    def _cached_parse(self, file_path: Path, data: bytes) -> Tuple[str, Optional[object]]:
+        """Return (content hash, cached parse result or None) for a file's contents."""
+        digest = _content_hash(data)
+        entry = self._parse_cache.get(str(file_path))
+        if entry and entry["hash"] == digest:
+            return digest, entry["result"]
+        return digest, None
+
+    @staticmethod
+    def _endpoint_fields(endpoint: APIEndpoint) -> Dict[str, str]:
+        """Constructor arguments needed to rebuild an endpoint from the cache."""
+        return {
+            "method": endpoint.method,
+            "path": endpoint.path,
+            "description": endpoint.description,
+            "module": endpoint.module,
+            "source": endpoint.source
+        }
+
     def parse_spec_file(self) -> Dict[str, List[APIEndpoint]]:
         """Parse the API specification file and extract endpoints by section."""
         if not self.specs_file.exists():
             raise FileNotFoundError(f"API specs file not found: {self.specs_file}")
         
-        content = self.specs_file.read_text()
+        data = self.specs_file.read_bytes()
+        digest, cached = self._cached_parse(self.specs_file, data)
+        if cached is not None:
+            return {
+                section: [APIEndpoint(**fields) for fields in endpoints]
+                for section, endpoints in cached.items()
+            }
+        
+        content = data.decode('utf-8')
+        section_slices = self._index_spec_sections(content)
         sections = {}
         
         for module_num, (module_name, _, spec_section) in self.modules.items():
-            section_endpoints = self._extract_endpoints_from_section(content, spec_section)
+            bounds = section_slices.get(spec_section)
+            if bounds is None:
+                print(f"Warning: Section '{spec_section}' not found in specs")
+                section_endpoints = []
+            else:
+                section_endpoints = self._extract_endpoints_from_section(content, *bounds)
             sections[spec_section] = [
                 APIEndpoint(
                     method=ep["method"],
@@ -90,90 +210,80 @@ class APIAuditor:
                 ) for ep in section_endpoints
             ]
         
+        self._parse_cache[str(self.specs_file)] = {
+            "hash": digest,
+            "result": {
+                section: [self._endpoint_fields(ep) for ep in endpoints]
+                for section, endpoints in sections.items()
+            }
+        }
         return sections
 
-    def _extract_endpoints_from_section(self, content: str, section_name: str) -> List[Dict]:
-        """Extract API endpoints from a specific section of the spec file."""
+    def _index_spec_sections(self, content: str) -> Dict[str, Tuple[int, int]]:
+        """Map each top-level section title to the (start, end) offsets of its body."""
+        headers = list(_SPEC_SECTION_RE.finditer(content))
+        section_slices = {}
+        
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+            section_slices.setdefault(header.group(1).strip(), (header.end(), end))
+        
+        return section_slices
+
+    def _extract_endpoints_from_section(self, content: str, start: int, end: int) -> List[Dict]:
+        """Extract API endpoints from the content[start:end] section of the spec file."""
         endpoints = []
+        description = None
         
-        # Find section start
-        section_pattern = rf"### {re.escape(section_name)}"
-        section_match = re.search(section_pattern, content)
-        if not section_match:
-            print(f"Warning: Section '{section_name}' not found in specs")
-            return endpoints
-        
-        # Extract section content until next main section
-        section_start = section_match.end()
-        next_section_pattern = r"\n### \d+\."
-        next_section_match = re.search(next_section_pattern, content[section_start:])
-        
-        if next_section_match:
-            section_content = content[section_start:section_start + next_section_match.start()]
-        else:
-            section_content = content[section_start:]
-        
-        # Extract HTTP method and path patterns
-        # Look for patterns like: POST /auth/login, GET /users/{id}, etc.
-        endpoint_pattern = r"```http\n(GET|POST|PUT|PATCH|DELETE)\s+(/[^\n]*)\n```"
-        endpoint_matches = re.findall(endpoint_pattern, section_content, re.MULTILINE)
-        
-        for method, path in endpoint_matches:
-            # Try to find description from nearby text
-            description = self._extract_endpoint_description(section_content, method, path)
+        # Scan the section in place; each endpoint takes the nearest preceding sub-header
+        for match in _SPEC_ITEM_RE.finditer(content, start, end):
+            header, method, path = match.groups()
+            if header is not None:
+                description = header.strip()
+                continue
+            
             endpoints.append({
                 "method": method,
                 "path": path.strip(),
-                "description": description
+                "description": description or f"{method} {path.strip()}"
             })
         
         return endpoints
 
-    def _extract_endpoint_description(self, section_content: str, method: str, path: str) -> str:
-        """Extract description for an endpoint from surrounding context."""
-        # Look for headers like #### 1.1 User Login before the endpoint
-        pattern = rf"####.*?```http\n{method}\s+{re.escape(path)}"
-        match = re.search(pattern, section_content, re.DOTALL)
-        
-        if match:
-            header_match = re.search(r"#### \d+\.\d+\s+(.+)", match.group(0))
-            if header_match:
-                return header_match.group(1).strip()
-        
-        return f"{method} {path}"
-
     def parse_implementation_files(self) -> Dict[str, List[APIEndpoint]]:
         """Parse implemented API files and extract endpoints."""
-        implementations = {}
-        
-        for module_num, (module_name, api_file, spec_section) in self.modules.items():
-            file_path = self.api_dir / api_file
-            if not file_path.exists():
-                print(f"Warning: Implementation file not found: {file_path}")
-                implementations[spec_section] = []
-                continue
-            
-            endpoints = self._extract_endpoints_from_file(file_path, module_name)
-            implementations[spec_section] = endpoints
+        # Files are independent, so overlap the reads and regex scans
+        with ThreadPoolExecutor(max_workers=min(8, len(self.modules))) as executor:
+            results = list(executor.map(self._parse_one_impl, self.modules.values()))
         
-        return implementations
+        return dict(results)
+
+    def _parse_one_impl(self, module: Tuple[str, str, str]) -> Tuple[str, List[APIEndpoint]]:
+        """Parse a single module's implementation file."""
+        module_name, api_file, spec_section = module
+        if api_file not in self._api_files:
+            print(f"Warning: Implementation file not found: {self.api_dir / api_file}")
+            return spec_section, []
+        
+        return spec_section, self._extract_endpoints_from_file(Path(self._api_files[api_file]), module_name)
 
     def _extract_endpoints_from_file(self, file_path: Path, module_name: str) -> List[APIEndpoint]:
         """Extract endpoints from a FastAPI implementation file."""
-        content = file_path.read_text()
-        endpoints = []
+        data = file_path.read_bytes()
+        digest, cached = self._cached_parse(file_path, data)
+        if cached is not None:
+            return [APIEndpoint(**fields) for fields in cached]
         
-        # Pattern to match FastAPI route decorators
-        # @router.post("/", ...) or @router.get("/{id}", ...)
-        route_pattern = r'@router\.(get|post|put|patch|delete)\(\s*["\']([^"\']+)["\']'
+        content = data.decode('utf-8')
+        endpoints = []
         
-        matches = re.findall(route_pattern, content, re.MULTILINE)
+        matches = list(_ROUTE_RE.finditer(content))
         
-        for method, path in matches:
-            # Try to extract function name or description
-            # Look for the function definition after the decorator
-            func_pattern = rf'@router\.{method}\([^)]*\)[^)]*\)\s*\n(?:async\s+)?def\s+(\w+)'
-            func_match = re.search(func_pattern, content)
+        for index, match in enumerate(matches):
+            method, path = match.groups()
+            # The handler is the first def between this decorator and the next one
+            next_start = matches[index + 1].start() if index + 1 < len(matches) else len(content)
+            func_match = _FUNC_RE.search(content, match.end(), next_start)
             
             description = func_match.group(1) if func_match else f"{method.upper()} {path}"
             
@@ -185,6 +295,10 @@ class APIAuditor:
                 source="implementation"
             ))
         
+        self._parse_cache[str(file_path)] = {
+            "hash": digest,
+            "result": [self._endpoint_fields(ep) for ep in endpoints]
+        }
         return endpoints
 
     def compare_endpoints(self, spec_endpoints: List[APIEndpoint], 
@@ -192,20 +306,23 @@ class APIAuditor:
         """Compare specification endpoints with implementation endpoints."""
         results = {}
         
-        # Create lookup sets for easier comparison
-        spec_set = {(ep.method, self._normalize_path(ep.path)) for ep in spec_endpoints}
-        impl_set = {(ep.method, self._normalize_path(ep.path)) for ep in impl_endpoints}
+        # Index both sides once by (method, normalized path tuple); exact hits are
+        # dict lookups and fuzzy matching only scans endpoints of the same shape
+        spec_by_key = self._index_endpoints(spec_endpoints)
+        impl_by_key = self._index_endpoints(impl_endpoints)
+        spec_by_shape = self._group_by_shape(spec_by_key)
+        impl_by_shape = self._group_by_shape(impl_by_key)
         
         # Check spec endpoints against implementation
         for spec_ep in spec_endpoints:
             key = f"{spec_ep.method} {spec_ep.path}"
-            normalized_key = (spec_ep.method, self._normalize_path(spec_ep.path))
+            normalized_key = self._endpoint_key(spec_ep)
             
-            if normalized_key in impl_set:
+            if normalized_key in impl_by_key:
                 results[key] = ImplementationStatus.MATCHES
             else:
                 # Check for similar paths (might be modified)
-                similar = self._find_similar_endpoint(spec_ep, impl_endpoints)
+                similar = self._find_similar_endpoint(normalized_key, impl_by_shape)
                 if similar:
                     results[key] = ImplementationStatus.MODIFIED
                 else:
@@ -214,49 +331,60 @@ class APIAuditor:
         # Check for endpoints in implementation but not in spec
         for impl_ep in impl_endpoints:
             key = f"{impl_ep.method} {impl_ep.path}"
-            normalized_key = (impl_ep.method, self._normalize_path(impl_ep.path))
+            normalized_key = self._endpoint_key(impl_ep)
             
-            if normalized_key not in spec_set:
+            if normalized_key not in spec_by_key:
                 # Check if it's similar to any spec endpoint
-                similar = self._find_similar_endpoint(impl_ep, spec_endpoints)
+                similar = self._find_similar_endpoint(normalized_key, spec_by_shape)
                 if not similar:
                     results[key] = ImplementationStatus.ADDED
         
         return results
 
-    def _normalize_path(self, path: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_path(path: str) -> str:
         """Normalize API path for comparison (handle parameter variations)."""
-        # Replace {id} with {.*} for pattern matching
-        # Replace {user_id} with {.*}, etc.
-        normalized = re.sub(r'\{[^}]+\}', '{param}', path)
-        return normalized.strip('/')
+        # Replace {id} with {param} for pattern matching
+        # Replace {user_id} with {param}, etc.
+        return _PARAM_RE.sub('{param}', path).strip('/')
+
+    def _endpoint_key(self, endpoint: APIEndpoint) -> Tuple[str, Tuple[str, ...]]:
+        """Build the (method, normalized path segments) lookup key for an endpoint."""
+        return endpoint.method, endpoint._tokens
+
+    def _index_endpoints(self, endpoints: List[APIEndpoint]) -> Dict[Tuple[str, Tuple[str, ...]], APIEndpoint]:
+        """Index endpoints by lookup key, keeping the first endpoint for each key."""
+        index = {}
+        for endpoint in endpoints:
+            index.setdefault(self._endpoint_key(endpoint), endpoint)
+        return index
+
+    def _group_by_shape(self, index: Dict[Tuple[str, Tuple[str, ...]], APIEndpoint]) -> Dict[Tuple[str, int], List[Tuple]]:
+        """Group indexed endpoints by (method, segment count) for fuzzy matching."""
+        shapes = {}
+        for (method, parts), endpoint in index.items():
+            shapes.setdefault((method, len(parts)), []).append((parts, endpoint))
+        return shapes
 
-    def _find_similar_endpoint(self, target: APIEndpoint, candidates: List[APIEndpoint]) -> APIEndpoint:
+    def _find_similar_endpoint(self, target_key: Tuple[str, Tuple[str, ...]],
+                               candidates_by_shape: Dict[Tuple[str, int], List[Tuple]]) -> APIEndpoint:
         """Find similar endpoint with fuzzy matching."""
-        target_norm = self._normalize_path(target.path)
+        method, target_parts = target_key
         
-        for candidate in candidates:
-            if (target.method == candidate.method and 
-                self._paths_similar(target_norm, self._normalize_path(candidate.path))):
+        for parts, candidate in candidates_by_shape.get((method, len(target_parts)), []):
+            if self._paths_similar(target_parts, parts):
                 return candidate
         
         return None
 
-    def _paths_similar(self, path1: str, path2: str) -> bool:
-        """Check if two normalized paths are similar."""
-        # Simple similarity check - same base path structure
-        parts1 = path1.split('/')
-        parts2 = path2.split('/')
-        
-        if len(parts1) != len(parts2):
-            return False
-        
-        # Allow parameter differences
-        for p1, p2 in zip(parts1, parts2):
-            if p1 != p2 and not ('{param}' in p1 or '{param}' in p2):
-                return False
-        
-        return True
+    def _paths_similar(self, parts1: Tuple[str, ...], parts2: Tuple[str, ...]) -> bool:
+        """Check if two normalized path segment tuples are similar."""
+        # Same base path structure, allowing parameter differences
+        return len(parts1) == len(parts2) and all(
+            p1 == p2 or '{param}' in p1 or '{param}' in p2
+            for p1, p2 in zip(parts1, parts2)
+        )
 
     def run_audit(self) -> None:
         """Run the complete API audit process."""
@@ -292,76 +420,82 @@ class APIAuditor:
         
         # Generate comprehensive report
         self._generate_report()
+        self._save_parse_cache()
 
     def _print_module_summary(self, audit: ModuleAudit) -> None:
         """Print summary for a single module audit."""
         total_spec = len(audit.spec_endpoints)
         total_impl = len(audit.impl_endpoints)
         
-        status_counts = {}
-        for status in ImplementationStatus:
-            status_counts[status] = sum(1 for s in audit.audit_results.values() if s == status)
+        status_counts = Counter(audit.audit_results.values())
         
         print(f"  📊 Spec endpoints: {total_spec}, Implementation endpoints: {total_impl}")
-        for status, count in status_counts.items():
+        for status in ImplementationStatus:
+            count = status_counts[status]
             if count > 0:
-                print(f"  {status.value}: {count}")
+                print(f"  {_STATUS_STRINGS[status]}: {count}")
 
     def _generate_report(self) -> None:
         """Generate comprehensive audit report."""
         report_path = self.backend_root / "API_IMPLEMENTATION_STATUS.md"
         
-        with open(report_path, 'w') as f:
-            f.write("# API Implementation Status Report\n\n")
-            f.write("Generated by API Audit Tool\n\n")
-            f.write("## Summary\n\n")
-            
-            # Overall statistics
-            total_spec_endpoints = sum(len(audit.spec_endpoints) for audit in self.audit_results)
-            total_impl_endpoints = sum(len(audit.impl_endpoints) for audit in self.audit_results)
-            
-            f.write(f"- **Total Spec Endpoints**: {total_spec_endpoints}\n")
-            f.write(f"- **Total Implementation Endpoints**: {total_impl_endpoints}\n\n")
-            
-            # Status summary
-            overall_status_counts = {}
-            for audit in self.audit_results:
-                for status in audit.audit_results.values():
-                    overall_status_counts[status] = overall_status_counts.get(status, 0) + 1
-            
-            f.write("### Overall Status Distribution\n\n")
-            for status, count in overall_status_counts.items():
-                f.write(f"- {status.value}: {count}\n")
+        parts: List[str] = []
+        
+        parts.append("# API Implementation Status Report\n\n")
+        parts.append("Generated by API Audit Tool\n\n")
+        parts.append("## Summary\n\n")
+        
+        # Overall statistics
+        total_spec_endpoints = sum(len(audit.spec_endpoints) for audit in self.audit_results)
+        total_impl_endpoints = sum(len(audit.impl_endpoints) for audit in self.audit_results)
+        
+        parts.append(f"- **Total Spec Endpoints**: {total_spec_endpoints}\n")
+        parts.append(f"- **Total Implementation Endpoints**: {total_impl_endpoints}\n\n")
+        
+        # Status summary
+        overall_status_counts = Counter(
+            status for audit in self.audit_results for status in audit.audit_results.values()
+        )
+        
+        parts.append("### Overall Status Distribution\n\n")
+        for status, count in overall_status_counts.items():
+            parts.append(f"- {_STATUS_STRINGS[status]}: {count}\n")
+        
+        parts.append("\n## Module Details\n\n")
+        
+        # Detailed module reports
+        for audit in self.audit_results:
+            parts.append(f"### Module {audit.module_number}: {audit.module_name}\n\n")
+            parts.append(f"**API File**: `{audit.api_file}`  \n")
+            parts.append(f"**Spec Section**: {audit.spec_section}  \n")
+            parts.append(f"**Spec Endpoints**: {len(audit.spec_endpoints)}  \n")
+            parts.append(f"**Implementation Endpoints**: {len(audit.impl_endpoints)}  \n\n")
             
-            f.write("\n## Module Details\n\n")
+            if audit.audit_results:
+                parts.append("#### Endpoint Status\n\n")
+                for endpoint, status in sorted(audit.audit_results.items()):
+                    parts.append(f"- {_STATUS_STRINGS[status]}: `{endpoint}`\n")
+                parts.append("\n")
             
-            # Detailed module reports
-            for audit in self.audit_results:
-                f.write(f"### Module {audit.module_number}: {audit.module_name}\n\n")
-                f.write(f"**API File**: `{audit.api_file}`  \n")
-                f.write(f"**Spec Section**: {audit.spec_section}  \n")
-                f.write(f"**Spec Endpoints**: {len(audit.spec_endpoints)}  \n")
-                f.write(f"**Implementation Endpoints**: {len(audit.impl_endpoints)}  \n\n")
-                
-                if audit.audit_results:
-                    f.write("#### Endpoint Status\n\n")
-                    for endpoint, status in sorted(audit.audit_results.items()):
-                        f.write(f"- {status.value}: `{endpoint}`\n")
-                    f.write("\n")
-                
-                # List implementation endpoints
-                if audit.impl_endpoints:
-                    f.write("#### Implementation Endpoints\n\n")
-                    for ep in audit.impl_endpoints:
-                        f.write(f"- `{ep.method} {ep.path}` - {ep.description}\n")
-                    f.write("\n")
+            # List implementation endpoints
+            if audit.impl_endpoints:
+                parts.append("#### Implementation Endpoints\n\n")
+                for ep in audit.impl_endpoints:
+                    parts.append(f"- `{ep.method} {ep.path}` - {ep.description}\n")
+                parts.append("\n")
+        
+        report_path.write_text("".join(parts))
         
         print(f"\n📄 Comprehensive report generated: {report_path}")
         
         # Also generate JSON report for programmatic use
         json_path = self.backend_root / "api_audit_results.json"
-        with open(json_path, 'w') as f:
-            json.dump([asdict(audit) for audit in self.audit_results], f, indent=2, default=str)
+        payload = [audit.to_dict() for audit in self.audit_results]
+        json_path.write_bytes(orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
         
         print(f"📄 JSON report generated: {json_path}")
 
@@ -14,15 +14,122 @@ Focuses on Modules 1-7 core functionality.
 
 import os
 import re
-import json
+import pickle
+import hashlib
 import asyncio
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Any
+from dataclasses import dataclass
 import asyncpg
+import orjson
 
+# Head of a single, already-split CREATE TABLE statement
+_CREATE_HEAD_RE = re.compile(r'^\s*CREATE TABLE sentinel\.(\w+)', re.MULTILINE | re.IGNORECASE)
+# Table names only, so bodies are scanned just for the tables being audited
+_TABLE_NAMES_RE = re.compile(r'CREATE TABLE sentinel\.(\w+)', re.IGNORECASE)
+_PAREN_RE = re.compile(r'[()]')
+# Column-level DEFAULT value and REFERENCES schema.table(column)
+_DEFAULT_RE = re.compile(r'DEFAULT\s+([^,\s]+)', re.IGNORECASE)
+_FK_RE = re.compile(r'REFERENCES\s+[\w.]+\.(\w+)\((\w+)\)', re.IGNORECASE)
+# Common type variations mapped to the short names used for comparison
+_TYPE_MAP = {
+    'character varying': 'varchar',
+    'timestamp with time zone': 'timestamptz',
+    'timestamp without time zone': 'timestamp',
+    'boolean': 'bool',
+    'integer': 'int'
+}
 
-@dataclass
+# Lines that are table-level constraints rather than column definitions
+_FIELD_SKIP_RE = re.compile(r'\b(?:CONSTRAINT|CHECK|UNIQUE|INDEX)\b', re.IGNORECASE)
+_FIELD_META_RE = re.compile(r'\b(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY)\b', re.IGNORECASE)
+
+# Schema-wide introspection queries; rows are grouped by table_name in Python
+TABLES_QUERY = """
+    SELECT table_name 
+    FROM information_schema.tables 
+    WHERE table_schema = 'sentinel'
+    ORDER BY table_name
+"""
+
+COLUMNS_QUERY = """
+    SELECT 
+        table_name,
+        column_name,
+        data_type,
+        is_nullable,
+        column_default,
+        udt_name
+    FROM information_schema.columns
+    WHERE table_schema = 'sentinel'
+    ORDER BY table_name, ordinal_position
+"""
+
+PRIMARY_KEYS_QUERY = """
+    SELECT kcu.table_name, kcu.column_name
+    FROM information_schema.key_column_usage kcu
+    JOIN information_schema.table_constraints tc 
+        ON tc.constraint_name = kcu.constraint_name
+        AND tc.constraint_schema = kcu.constraint_schema
+    WHERE tc.constraint_type = 'PRIMARY KEY' 
+        AND kcu.table_schema = 'sentinel'
+"""
+
+FOREIGN_KEYS_QUERY = """
+    SELECT 
+        kcu.table_name,
+        kcu.column_name,
+        ccu.table_name AS foreign_table_name,
+        ccu.column_name AS foreign_column_name
+    FROM information_schema.key_column_usage kcu
+    JOIN information_schema.referential_constraints rc 
+        ON rc.constraint_name = kcu.constraint_name
+        AND rc.constraint_schema = kcu.constraint_schema
+    JOIN information_schema.key_column_usage ccu 
+        ON rc.unique_constraint_name = ccu.constraint_name
+        AND rc.unique_constraint_schema = ccu.constraint_schema
+    WHERE kcu.table_schema = 'sentinel'
+"""
+
+
+def _paren_body(content: str, start: int) -> Optional[str]:
+    """Return the text inside the first balanced (...) group at or after start."""
+    open_pos = content.find('(', start)
+    if open_pos == -1:
+        return None
+    depth = 0
+    for match in _PAREN_RE.finditer(content, open_pos):
+        depth += 1 if match.group() == '(' else -1
+        if depth == 0:
+            return content[open_pos + 1:match.start()]
+    return None
+
+
+try:
+    import sqlparse
+
+    def _iter_table_definitions(content: str, wanted: frozenset) -> Iterator[Tuple[str, str]]:
+        """Yield (table name, column definitions) for the wanted CREATE TABLE statements."""
+        # Tokenizing into statements is linear; only the head of each is regex-matched
+        for stmt in sqlparse.split(content):
+            match = _CREATE_HEAD_RE.search(stmt)
+            if not match or match.group(1) not in wanted:
+                continue
+            yield match.group(1), stmt[stmt.index('(', match.end()) + 1:stmt.rindex(')')]
+except ImportError:  # sqlparse is optional; fall back to locating tables by name
+    def _iter_table_definitions(content: str, wanted: frozenset) -> Iterator[Tuple[str, str]]:
+        """Yield (table name, column definitions) for the wanted CREATE TABLE statements."""
+        for match in _TABLE_NAMES_RE.finditer(content):
+            if match.group(1) not in wanted:
+                continue
+            body = _paren_body(content, match.end())
+            if body is not None:
+                yield match.group(1), body
+
+
+@dataclass(slots=True)
 class TableField:
     """Represents a database table field."""
     name: str
@@ -35,7 +142,7 @@ class TableField:
     foreign_column: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TableSchema:
     """Represents a complete table schema."""
     name: str
@@ -53,7 +160,7 @@ class TableSchema:
             self.constraints = []
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """Represents the result of schema comparison."""
     status: str  # MATCH, EXTRA_FIELD, MISSING_FIELD, TYPE_MISMATCH, EXTRA_TABLE, MISSING_TABLE
@@ -64,6 +171,11 @@ class AuditResult:
     description: str = ""
 
 
+# AuditResult fields in report order; slotted dataclasses are flat, so build dicts
+# directly instead of going through asdict()'s recursive deepcopy
+_RESULT_FIELDS = ('status', 'table', 'field', 'spec_value', 'actual_value', 'description')
+
+
 class DatabaseSchemaAuditor:
     """Main auditor class for comparing SQL spec with actual database."""
     
@@ -83,10 +195,29 @@ class DatabaseSchemaAuditor:
         "token_blacklist": "Module 1 - Authentication"
     }
     
+    _MODULES_1_7_TABLE_SET = frozenset(MODULES_1_7_TABLES)
+    
+    # Audit/metadata columns commonly added during implementation
+    _COMMON_ADDED_FIELDS = frozenset({
+        'created_at', 'updated_at', 'created_by', 'updated_by',
+        'version', 'last_modified_by', 'deleted_at', 'is_deleted'
+    })
+    
+    # Table name fragments of advanced features (not Modules 1-7), as one alternation
+    _ADVANCED_RE = re.compile('|'.join(map(re.escape, [
+        'ai_', 'ml_', 'behavioral_', 'biometric', 'anomaly', 'compliance_monitoring',
+        'nlp_', 'permission_optimization', 'permission_prediction', 'user_behavior',
+        'audit_', 'menu_', 'approval', 'access_request', 'active_session',
+        'password_reset'  # This might be Module 1 enhancement
+    ])))
+    
     def __init__(self):
         self.backend_root = Path(__file__).parent.parent
         self.sql_spec_file = self.backend_root / "docs" / "Sentinel_Schema_All_Tables.sql"
+        self.cache_dir = Path.home() / ".cache" / "sentinel"
         self.audit_results: List[AuditResult] = []
+        # Matching fields per table; only the count is reported, so no per-field results
+        self.match_counts: Dict[str, int] = defaultdict(int)
         
         # Database connection config
         self.db_config = {
@@ -102,40 +233,56 @@ class DatabaseSchemaAuditor:
         if not self.sql_spec_file.exists():
             raise FileNotFoundError(f"SQL spec file not found: {self.sql_spec_file}")
         
+        # The parsed spec is cached on disk, keyed by the spec file's mtime and size.
+        # This script's own mtime is part of the key so parser changes invalidate it.
+        spec_stat = self.sql_spec_file.stat()
+        cache_file = self.cache_dir / (
+            f"spec_{spec_stat.st_mtime_ns}_{spec_stat.st_size}_{Path(__file__).stat().st_mtime_ns}.pkl"
+        )
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    tables = pickle.load(f)
+                print(f"📖 Loaded SQL specification from cache: {cache_file}")
+                print(f"📊 Parsed {len(tables)} tables from specification")
+                return tables
+            except Exception as e:
+                print(f"⚠️ Ignoring unreadable spec cache {cache_file}: {e}")
+        
         print(f"📖 Parsing SQL specification: {self.sql_spec_file}")
         content = self.sql_spec_file.read_text()
         
         tables = {}
         
-        # Find all CREATE TABLE statements for sentinel schema
-        table_pattern = r'CREATE TABLE sentinel\.(\w+)\s*\((.*?)\);'
-        
-        for match in re.finditer(table_pattern, content, re.DOTALL | re.IGNORECASE):
-            table_name = match.group(1)
-            table_definition = match.group(2)
-            
-            # Only process tables relevant to Modules 1-7
-            if table_name in self.MODULES_1_7_TABLES:
-                schema = self._parse_table_definition(table_name, table_definition)
-                tables[table_name] = schema
-                print(f"  ✅ Parsed table: {table_name} ({len(schema.fields)} fields)")
+        # Find the CREATE TABLE statements for Modules 1-7 tables in the sentinel schema
+        for table_name, table_definition in _iter_table_definitions(content, self._MODULES_1_7_TABLE_SET):
+            schema = self._parse_table_definition(table_name, table_definition)
+            tables[table_name] = schema
+            print(f"  ✅ Parsed table: {table_name} ({len(schema.fields)} fields)")
         
         print(f"📊 Parsed {len(tables)} tables from specification")
+        
+        try:
+            payload = pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(payload)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"⚠️ Could not write spec cache {cache_file}: {e}")
+        
         return tables
     
     def _parse_table_definition(self, table_name: str, definition: str) -> TableSchema:
         """Parse individual table definition from SQL."""
         schema = TableSchema(name=table_name)
         
-        # Split definition into lines and clean them
-        lines = [line.strip().rstrip(',') for line in definition.split('\n') if line.strip()]
-        
-        for line in lines:
+        # Clean each line as it is visited rather than building an intermediate list
+        for raw in definition.split('\n'):
+            line = raw.strip().rstrip(',')
             if not line or line.startswith('--'):
                 continue
             
             # Skip constraints for now (could be enhanced later)
-            if any(keyword in line.upper() for keyword in ['CONSTRAINT', 'CHECK', 'UNIQUE', 'INDEX']):
+            if _FIELD_SKIP_RE.search(line):
                 schema.constraints.append(line)
                 continue
             
@@ -151,7 +298,7 @@ class DatabaseSchemaAuditor:
         # Basic field pattern: field_name TYPE [NOT NULL] [DEFAULT value]
         line = line.strip().rstrip(',')
         
-        if not line or any(keyword in line.upper() for keyword in ['CONSTRAINT', 'PRIMARY KEY', 'FOREIGN KEY']):
+        if not line or _FIELD_META_RE.search(line):
             return None
         
         parts = line.split()
@@ -161,26 +308,28 @@ class DatabaseSchemaAuditor:
         field_name = parts[0]
         data_type = parts[1]
         
+        upper_line = line.upper()
+        
         # Check for NOT NULL
-        is_nullable = 'NOT NULL' not in line.upper()
+        is_nullable = 'NOT NULL' not in upper_line
         
         # Check for DEFAULT
         default_value = None
-        if 'DEFAULT' in line.upper():
-            default_match = re.search(r'DEFAULT\s+([^,\s]+)', line, re.IGNORECASE)
+        if 'DEFAULT' in upper_line:
+            default_match = _DEFAULT_RE.search(line)
             if default_match:
                 default_value = default_match.group(1)
         
         # Check for PRIMARY KEY
-        is_primary_key = 'PRIMARY KEY' in line.upper()
+        is_primary_key = 'PRIMARY KEY' in upper_line
         
         # Check for REFERENCES (foreign key)
-        is_foreign_key = 'REFERENCES' in line.upper()
+        is_foreign_key = 'REFERENCES' in upper_line
         foreign_table = None
         foreign_column = None
         
         if is_foreign_key:
-            fk_match = re.search(r'REFERENCES\s+[\w.]+\.(\w+)\((\w+)\)', line, re.IGNORECASE)
+            fk_match = _FK_RE.search(line)
             if fk_match:
                 foreign_table = fk_match.group(1)
                 foreign_column = fk_match.group(2)
@@ -200,27 +349,51 @@ class DatabaseSchemaAuditor:
         """Query the actual database to get current schema."""
         print(f"🔍 Connecting to database: {self.db_config['database']}@{self.db_config['host']}")
         
-        conn = await asyncpg.connect(**self.db_config)
+        # One connection per introspection query so they run concurrently.
+        # Each query runs once, so skip JIT planning and prepared-statement caching.
+        pool = await asyncpg.create_pool(
+            **self.db_config,
+            min_size=4,
+            max_size=4,
+            statement_cache_size=0,
+            server_settings={'jit': 'off'}
+        )
         
         try:
-            # Get all tables in sentinel schema
-            tables_query = """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'sentinel'
-                ORDER BY table_name
-            """
-            
-            table_names = await conn.fetch(tables_query)
+            table_names, columns, pk_rows, fk_rows = await asyncio.gather(
+                self._fetch(pool, TABLES_QUERY),
+                self._fetch(pool, COLUMNS_QUERY),
+                self._fetch(pool, PRIMARY_KEYS_QUERY),
+                self._fetch(pool, FOREIGN_KEYS_QUERY)
+            )
             print(f"📊 Found {len(table_names)} tables in database")
             
+            # Group schema-wide rows by table
+            columns_by_table = defaultdict(list)
+            for row in columns:
+                columns_by_table[row['table_name']].append(row)
+            
+            pk_columns_by_table = defaultdict(set)
+            for row in pk_rows:
+                pk_columns_by_table[row['table_name']].add(row['column_name'])
+            
+            fk_info_by_table = defaultdict(dict)
+            for row in fk_rows:
+                fk_info_by_table[row['table_name']][row['column_name']] = (
+                    row['foreign_table_name'], row['foreign_column_name']
+                )
+            
             schemas = {}
             
             for row in table_names:
                 table_name = row['table_name']
                 
-                # Get table schema
-                schema = await self._get_table_schema_from_db(conn, table_name)
+                schema = self._build_table_schema(
+                    table_name,
+                    columns_by_table[table_name],
+                    pk_columns_by_table[table_name],
+                    fk_info_by_table[table_name]
+                )
                 schemas[table_name] = schema
                 
                 print(f"  ✅ Retrieved schema: {table_name} ({len(schema.fields)} fields)")
@@ -228,57 +401,19 @@ class DatabaseSchemaAuditor:
             return schemas
         
         finally:
-            await conn.close()
+            await pool.close()
+    
+    @staticmethod
+    async def _fetch(pool, query: str) -> List[Any]:
+        """Run a single introspection query on its own pooled connection."""
+        async with pool.acquire() as conn:
+            return await conn.fetch(query)
     
-    async def _get_table_schema_from_db(self, conn, table_name: str) -> TableSchema:
-        """Get detailed schema for a specific table from database."""
+    def _build_table_schema(self, table_name: str, columns: List[Any], pk_columns: Set[str],
+                            fk_info: Dict[str, Tuple[str, str]]) -> TableSchema:
+        """Build a table schema from its introspected column, PK and FK rows."""
         schema = TableSchema(name=table_name)
         
-        # Get column information
-        columns_query = """
-            SELECT 
-                column_name,
-                data_type,
-                is_nullable,
-                column_default,
-                udt_name
-            FROM information_schema.columns
-            WHERE table_schema = 'sentinel' AND table_name = $1
-            ORDER BY ordinal_position
-        """
-        
-        columns = await conn.fetch(columns_query, table_name)
-        
-        # Get primary key information
-        pk_query = """
-            SELECT column_name
-            FROM information_schema.key_column_usage kcu
-            JOIN information_schema.table_constraints tc 
-                ON tc.constraint_name = kcu.constraint_name
-            WHERE tc.constraint_type = 'PRIMARY KEY' 
-                AND kcu.table_schema = 'sentinel' 
-                AND kcu.table_name = $1
-        """
-        
-        pk_columns = {row['column_name'] for row in await conn.fetch(pk_query, table_name)}
-        
-        # Get foreign key information
-        fk_query = """
-            SELECT 
-                kcu.column_name,
-                ccu.table_name AS foreign_table_name,
-                ccu.column_name AS foreign_column_name
-            FROM information_schema.key_column_usage kcu
-            JOIN information_schema.referential_constraints rc 
-                ON rc.constraint_name = kcu.constraint_name
-            JOIN information_schema.key_column_usage ccu 
-                ON rc.unique_constraint_name = ccu.constraint_name
-            WHERE kcu.table_schema = 'sentinel' AND kcu.table_name = $1
-        """
-        
-        fk_info = {row['column_name']: (row['foreign_table_name'], row['foreign_column_name']) 
-                  for row in await conn.fetch(fk_query, table_name)}
-        
         # Build field definitions
         for col in columns:
             field_name = col['column_name']
@@ -336,22 +471,28 @@ class DatabaseSchemaAuditor:
             spec_schema = spec_schemas[table]
             actual_schema = actual_schemas[table]
             
+            # Identical fingerprints mean every field matches; skip the per-field walk
+            if self._fingerprint(spec_schema) == self._fingerprint(actual_schema):
+                self.match_counts[table] += len({f.name for f in spec_schema.fields})
+                continue
+            
             table_results = self._compare_table_schemas(spec_schema, actual_schema)
             results.extend(table_results)
         
         print(f"📊 Generated {len(results)} audit findings")
         return results
     
+    def _fingerprint(self, schema: TableSchema) -> bytes:
+        """Digest of a table's (name, normalized type, nullable) field tuples."""
+        fields = sorted(
+            (f.name, self._normalize_data_type(f.data_type), f.is_nullable)
+            for f in schema.fields
+        )
+        return hashlib.blake2b(repr(fields).encode(), digest_size=16).digest()
+    
     def _is_advanced_feature_table(self, table_name: str) -> bool:
         """Check if a table belongs to advanced features (not Modules 1-7)."""
-        advanced_patterns = [
-            'ai_', 'ml_', 'behavioral_', 'biometric', 'anomaly', 'compliance_monitoring',
-            'nlp_', 'permission_optimization', 'permission_prediction', 'user_behavior',
-            'audit_', 'menu_', 'approval', 'access_request', 'active_session',
-            'password_reset'  # This might be Module 1 enhancement
-        ]
-        
-        return any(pattern in table_name for pattern in advanced_patterns)
+        return self._ADVANCED_RE.search(table_name) is not None
     
     def _compare_table_schemas(self, spec_schema: TableSchema, 
                               actual_schema: TableSchema) -> List[AuditResult]:
@@ -363,35 +504,19 @@ class DatabaseSchemaAuditor:
         spec_fields = {field.name: field for field in spec_schema.fields}
         actual_fields = {field.name: field for field in actual_schema.fields}
         
-        # Check for fields in spec but missing from actual
-        missing_fields = set(spec_fields.keys()) - set(actual_fields.keys())
-        for field_name in missing_fields:
-            results.append(AuditResult(
-                status="MISSING_FIELD",
-                table=table,
-                field=field_name,
-                spec_value=spec_fields[field_name].data_type,
-                description=f"Field defined in spec but missing from database"
-            ))
-        
-        # Check for fields in actual but not in spec
-        extra_fields = set(actual_fields.keys()) - set(spec_fields.keys())
-        for field_name in extra_fields:
-            # Skip common audit/metadata fields that are typically added
-            if not self._is_common_added_field(field_name):
+        # Single pass over the spec fields: each is either missing or compared
+        for field_name, spec_field in spec_fields.items():
+            actual_field = actual_fields.get(field_name)
+            
+            if actual_field is None:
                 results.append(AuditResult(
-                    status="EXTRA_FIELD",
+                    status="MISSING_FIELD",
                     table=table,
                     field=field_name,
-                    actual_value=actual_fields[field_name].data_type,
-                    description=f"Field exists in database but not in spec"
+                    spec_value=spec_field.data_type,
+                    description=f"Field defined in spec but missing from database"
                 ))
-        
-        # Compare common fields
-        common_fields = set(spec_fields.keys()) & set(actual_fields.keys())
-        for field_name in common_fields:
-            spec_field = spec_fields[field_name]
-            actual_field = actual_fields[field_name]
+                continue
             
             # Compare data types (normalize for comparison)
             spec_type = self._normalize_data_type(spec_field.data_type)
@@ -408,51 +533,43 @@ class DatabaseSchemaAuditor:
                 ))
             else:
                 # Field matches specification
+                self.match_counts[table] += 1
+        
+        # Check for fields in actual but not in spec
+        for field_name, actual_field in actual_fields.items():
+            # Skip common audit/metadata fields that are typically added
+            if field_name not in spec_fields and not self._is_common_added_field(field_name):
                 results.append(AuditResult(
-                    status="SPEC_MATCH",
+                    status="EXTRA_FIELD",
                     table=table,
                     field=field_name,
-                    description=f"Field matches specification"
+                    actual_value=actual_field.data_type,
+                    description=f"Field exists in database but not in spec"
                 ))
         
         return results
     
     def _is_common_added_field(self, field_name: str) -> bool:
         """Check if field is commonly added during implementation."""
-        common_added = [
-            'created_at', 'updated_at', 'created_by', 'updated_by',
-            'version', 'last_modified_by', 'deleted_at', 'is_deleted'
-        ]
-        return field_name in common_added
+        return field_name in self._COMMON_ADDED_FIELDS
     
-    def _normalize_data_type(self, data_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_data_type(data_type: str) -> str:
         """Normalize data type names for comparison."""
-        # Map common type variations
-        type_mapping = {
-            'character varying': 'varchar',
-            'timestamp with time zone': 'timestamptz',
-            'timestamp without time zone': 'timestamp',
-            'boolean': 'bool',
-            'integer': 'int',
-            'uuid': 'uuid',
-            'text': 'text',
-            'jsonb': 'jsonb'
-        }
-        
-        normalized = data_type.lower()
-        for original, mapped in type_mapping.items():
-            if original in normalized:
-                return mapped
-        
-        return normalized
+        # information_schema reports canonical names, so strip any length/precision
+        # suffix ("VARCHAR(255)") and map the long forms with one lookup
+        normalized = data_type.lower().split('(', 1)[0].strip()
+        return _TYPE_MAP.get(normalized, normalized)
     
     def generate_audit_report(self, results: List[AuditResult]) -> None:
         """Generate comprehensive audit report."""
         print("📄 Generating audit report...")
         
-        # Categorize results
+        spec_matches = sum(self.match_counts.values())
+        
+        # Categorize results (matching fields are only counted, see match_counts)
         categorized = {
-            "SPEC_MATCH": [],
             "EXTRA_FIELD": [],
             "MISSING_FIELD": [],
             "TYPE_MISMATCH": [],
@@ -460,74 +577,88 @@ class DatabaseSchemaAuditor:
             "MISSING_TABLE": []
         }
         
+        # Statuses seen per table, built once for the core table summary below
+        table_statuses: Dict[str, Set[str]] = defaultdict(set)
         for result in results:
             categorized[result.status].append(result)
+            table_statuses[result.table].add(result.status)
         
         # Generate markdown report
         report_path = self.backend_root / "DATABASE_SCHEMA_AUDIT.md"
         
-        with open(report_path, 'w') as f:
-            f.write("# Database Schema Audit Report\n\n")
-            f.write("## Overview\n\n")
-            f.write("This report compares the SQL specification with the actual PostgreSQL database\n")
-            f.write("for Modules 1-7 core functionality.\n\n")
-            
-            # Summary statistics
-            f.write("## Summary Statistics\n\n")
-            for status, items in categorized.items():
-                f.write(f"- **{status}**: {len(items)} findings\n")
-            f.write(f"- **Total Findings**: {len(results)}\n\n")
-            
-            # Core Tables Analysis
-            f.write("## Modules 1-7 Core Tables\n\n")
-            f.write("| Table | Status | Description |\n")
-            f.write("|-------|--------|-------------|\n")
+        # Build the report in memory and write it in one call
+        parts: List[str] = []
+        append = parts.append
+        append(
+            "# Database Schema Audit Report\n\n"
+            "## Overview\n\n"
+            "This report compares the SQL specification with the actual PostgreSQL database\n"
+            "for Modules 1-7 core functionality.\n\n"
+        )
+        
+        # Summary statistics
+        append("## Summary Statistics\n\n")
+        append(f"- **SPEC_MATCH**: {spec_matches} findings\n")
+        for status, items in categorized.items():
+            append(f"- **{status}**: {len(items)} findings\n")
+        append(f"- **Total Findings**: {len(results) + spec_matches}\n\n")
+        
+        # Core Tables Analysis
+        append(
+            "## Modules 1-7 Core Tables\n\n"
+            "| Table | Status | Description |\n"
+            "|-------|--------|-------------|\n"
+        )
+        
+        for table_name, module in self.MODULES_1_7_TABLES.items():
+            statuses = table_statuses.get(table_name, ())
+            if "MISSING_TABLE" in statuses:
+                status = "❌ Missing"
+            elif "EXTRA_FIELD" in statuses or "TYPE_MISMATCH" in statuses:
+                status = "⚠️ Modified"
+            else:
+                status = "✅ Match"
             
-            for table_name, module in self.MODULES_1_7_TABLES.items():
-                table_results = [r for r in results if r.table == table_name]
-                if any(r.status == "MISSING_TABLE" for r in table_results):
-                    status = "❌ Missing"
-                elif any(r.status in ["EXTRA_FIELD", "TYPE_MISMATCH"] for r in table_results):
-                    status = "⚠️ Modified"
-                else:
-                    status = "✅ Match"
-                
-                f.write(f"| {table_name} | {status} | {module} |\n")
+            append(f"| {table_name} | {status} | {module} |\n")
+        
+        append("\n")
+        
+        # Detailed findings by category
+        for status, items in categorized.items():
+            if not items:
+                continue
             
-            f.write("\n")
+            append(f"## {status.replace('_', ' ').title()} ({len(items)} findings)\n\n")
             
-            # Detailed findings by category
-            for status, items in categorized.items():
-                if not items:
-                    continue
-                
-                f.write(f"## {status.replace('_', ' ').title()} ({len(items)} findings)\n\n")
-                
-                for item in items:
-                    if item.field:
-                        f.write(f"### {item.table}.{item.field}\n")
-                    else:
-                        f.write(f"### {item.table}\n")
-                    
-                    f.write(f"- **Status**: {item.status}\n")
-                    f.write(f"- **Description**: {item.description}\n")
-                    
-                    if item.spec_value:
-                        f.write(f"- **Spec Definition**: {item.spec_value}\n")
-                    if item.actual_value:
-                        f.write(f"- **Actual Definition**: {item.actual_value}\n")
-                    
-                    f.write("\n")
+            for item in items:
+                heading = f"{item.table}.{item.field}" if item.field else item.table
+                spec_line = f"- **Spec Definition**: {item.spec_value}\n" if item.spec_value else ""
+                actual_line = f"- **Actual Definition**: {item.actual_value}\n" if item.actual_value else ""
+                append(
+                    f"### {heading}\n"
+                    f"- **Status**: {item.status}\n"
+                    f"- **Description**: {item.description}\n"
+                    f"{spec_line}{actual_line}\n"
+                )
+        
+        with open(report_path, 'w') as f:
+            f.write(''.join(parts))
         
         # Generate JSON report for programmatic use
         json_path = self.backend_root / "database_schema_audit.json"
-        with open(json_path, 'w') as f:
-            json_data = {
-                "summary": {status: len(items) for status, items in categorized.items()},
-                "results": [asdict(result) for result in results],
-                "modules_1_7_tables": self.MODULES_1_7_TABLES
-            }
-            json.dump(json_data, f, indent=2)
+        summary = {"SPEC_MATCH": spec_matches, **{status: len(items) for status, items in categorized.items()}}
+        
+        # Stream the document one result at a time rather than materializing it whole
+        with open(json_path, 'wb') as f:
+            f.write(b'{\n  "summary": ')
+            f.write(orjson.dumps(summary))
+            f.write(b',\n  "results": [')
+            for i, result in enumerate(results):
+                f.write(b'\n    ' if i == 0 else b',\n    ')
+                f.write(orjson.dumps({k: getattr(result, k) for k in _RESULT_FIELDS}))
+            f.write(b'\n  ],\n  "modules_1_7_tables": ')
+            f.write(orjson.dumps(self.MODULES_1_7_TABLES))
+            f.write(b'\n}\n')
         
         print(f"📄 Reports generated:")
         print(f"  - {report_path}")
@@ -535,7 +666,7 @@ class DatabaseSchemaAuditor:
         
         # Print summary to console
         print(f"\n📊 AUDIT SUMMARY:")
-        print(f"  ✅ Matching specifications: {len(categorized['SPEC_MATCH'])}")
+        print(f"  ✅ Matching specifications: {spec_matches}")
         print(f"  ➕ Extra fields/tables: {len(categorized['EXTRA_FIELD']) + len(categorized['EXTRA_TABLE'])}")
         print(f"  ❌ Missing from database: {len(categorized['MISSING_FIELD']) + len(categorized['MISSING_TABLE'])}")
         print(f"  ⚠️ Type mismatches: {len(categorized['TYPE_MISMATCH'])}")
@@ -5,7 +5,6 @@ Creates 3 tenant companies with 4 users each for RBAC testing
 """
 
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
@@ -14,41 +13,61 @@ from pathlib import Path
 backend_root = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_root))
 
+import orjson
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
-from src.database import engine
-from src.models import *
 from src.utils.password import password_manager
 
+from _seed_common import (
+    SeedSession, seed_engine, bulk_upsert_tenants, bulk_upsert_users,
+    drop_secondary_indexes, recreate_indexes
+)
+
+# Above this many rows, rebuilding secondary indexes once beats maintaining them per row
+INDEX_REBUILD_THRESHOLD = 10_000
+
+# Logistics company tenants
+TENANT_DATA = [
+    {
+        "name": "Maritime Port Operations",
+        "code": "MARITIME",
+        "domain": "maritime.logistics.com",
+        "industry": "Maritime Logistics",
+        "headquarters": "Singapore"
+    },
+    {
+        "name": "AirCargo Express", 
+        "code": "AIRCARGO",
+        "domain": "aircargo.express.com",
+        "industry": "Air Cargo",
+        "headquarters": "Frankfurt"
+    },
+    {
+        "name": "GroundLink Logistics",
+        "code": "GROUNDLINK", 
+        "domain": "groundlink.logistics.com",
+        "industry": "Ground Logistics",
+        "headquarters": "Memphis"
+    }
+]
+
+# Tenant metadata is constant, so it is encoded once at import rather than inside
+# the seeding transaction
+TENANT_METADATA_JSON = {
+    data["code"]: orjson.dumps({
+        "domain": data["domain"],
+        "industry": data["industry"],
+        "headquarters": data["headquarters"],
+        "currency": "USD",
+        "timezone": "UTC"
+    }).decode()
+    for data in TENANT_DATA
+}
+
+
 async def seed_logistics_data():
     """Create 3 logistics tenants with 4 users each."""
     print("🌱 Starting simple logistics data seeding...")
     
-    # Tenant data
-    tenant_data = [
-        {
-            "name": "Maritime Port Operations",
-            "code": "MARITIME",
-            "domain": "maritime.logistics.com",
-            "industry": "Maritime Logistics",
-            "headquarters": "Singapore"
-        },
-        {
-            "name": "AirCargo Express", 
-            "code": "AIRCARGO",
-            "domain": "aircargo.express.com",
-            "industry": "Air Cargo",
-            "headquarters": "Frankfurt"
-        },
-        {
-            "name": "GroundLink Logistics",
-            "code": "GROUNDLINK", 
-            "domain": "groundlink.logistics.com",
-            "industry": "Ground Logistics",
-            "headquarters": "Memphis"
-        }
-    ]
-    
     # User data for each tenant
     user_templates = {
         "MARITIME": [
@@ -72,118 +91,95 @@ async def seed_logistics_data():
     }
     
     password = "LogisticsTest2024!"
-    hashed_password = password_manager.hash_password(password)
+    # Hash in a worker thread so the tenant queries below aren't blocked behind it
+    hash_task = asyncio.create_task(asyncio.to_thread(password_manager.hash_password, password))
+    
+    # Flatten the user templates and build their payloads once, before any I/O
+    user_rows = []
+    for tenant_code, users_data in user_templates.items():
+        for user_data in users_data:
+            name_parts = user_data["name"].split()
+            user_rows.append((
+                tenant_code,
+                user_data["email"],
+                user_data["email"].split("@")[0],
+                # SQLAlchemy's asyncpg json codec takes pre-encoded text; orjson encodes in C
+                orjson.dumps({
+                    "first_name": name_parts[0],
+                    "last_name": name_parts[-1],
+                    "display_name": user_data["name"],
+                    "email_verified": True,
+                    "role": user_data["role"],
+                    "test_account": True,
+                    "default_password": password
+                }).decode()
+            ))
+    
+    users_by_email = {
+        user_data["email"]: user_data for users_data in user_templates.values() for user_data in users_data
+    }
     
-    async with AsyncSession(engine) as session:
+    async with SeedSession() as session:
         try:
-            created_tenants = {}
-            
-            # Get existing tenants or create if missing
-            print("🏢 Processing logistics company tenants...")
-            for data in tenant_data:
-                # Check if tenant exists
-                result = await session.execute(
-                    text("SELECT id FROM sentinel.tenants WHERE code = :code"),
-                    {"code": data["code"]}
-                )
-                tenant_id = result.scalar()
-                
-                if tenant_id:
-                    created_tenants[data["code"]] = tenant_id
-                    print(f"  ✅ Found existing tenant: {data['name']} ({data['code']})")
-                else:
-                    # Create new tenant
-                    await session.execute(
-                        text("""
-                            INSERT INTO sentinel.tenants (
-                                name, code, type, isolation_mode, is_active, 
-                                tenant_metadata, created_at, updated_at
-                            )
-                            VALUES (:name, :code, 'root', 'shared', true, :metadata, NOW(), NOW())
-                        """),
+            dropped_indexes = []
+            try:
+                # Tenants and users are written in one transaction, committed once at the end
+                async with session.begin():
+                    print("🏢 Processing logistics company tenants...")
+                    tenants = await bulk_upsert_tenants(session, [
                         {
                             "name": data["name"],
                             "code": data["code"],
-                            "metadata": json.dumps({
-                                "domain": data["domain"],
-                                "industry": data["industry"],
-                                "headquarters": data["headquarters"],
-                                "currency": "USD",
-                                "timezone": "UTC"
-                            })
+                            "metadata_json": TENANT_METADATA_JSON[data["code"]]
                         }
-                    )
+                        for data in TENANT_DATA
+                    ])
                     
-                    # Get the created tenant ID
-                    result = await session.execute(
-                        text("SELECT id FROM sentinel.tenants WHERE code = :code"),
-                        {"code": data["code"]}
-                    )
-                    tenant_id = result.scalar()
-                    created_tenants[data["code"]] = tenant_id
+                    for data in TENANT_DATA:
+                        if tenants[data["code"]][1]:
+                            print(f"  ✅ Created tenant: {data['name']} ({data['code']})")
+                        else:
+                            print(f"  ✅ Found existing tenant: {data['name']} ({data['code']})")
                     
-                    print(f"  ✅ Created tenant: {data['name']} ({data['code']})")
-            
-            await session.commit()
-            
-            # Create users (skip if already exists)
-            print("👨‍💼 Creating test users...")
-            for tenant_code, tenant_id in created_tenants.items():
-                users_data = user_templates[tenant_code]
-                
-                for user_data in users_data:
-                    # Check if user exists
-                    existing_user = await session.execute(
-                        text("SELECT email FROM sentinel.users WHERE email = :email"),
-                        {"email": user_data["email"]}
-                    )
+                    # Create users (skip if already exists)
+                    print("👨‍💼 Creating test users...")
+                    hashed_password = await hash_task
                     
-                    if existing_user.scalar():
-                        print(f"    ✅ User already exists: {user_data['name']} ({user_data['email']})")
-                    else:
-                        await session.execute(
-                            text("""
-                                INSERT INTO sentinel.users (
-                                    tenant_id, email, username, password_hash, is_active,
-                                    attributes, created_at, updated_at
-                                )
-                                VALUES (:tenant_id, :email, :username, :password_hash, true, :attributes, NOW(), NOW())
-                            """),
-                            {
-                                "tenant_id": tenant_id,
-                                "email": user_data["email"],
-                                "username": user_data["email"].split("@")[0],
-                                "password_hash": hashed_password,
-                                "attributes": json.dumps({
-                                    "first_name": user_data["name"].split()[0],
-                                    "last_name": user_data["name"].split()[-1],
-                                    "display_name": user_data["name"],
-                                    "email_verified": True,
-                                    "role": user_data["role"],
-                                    "test_account": True,
-                                    "default_password": password
-                                })
-                            }
-                        )
-                        print(f"    ✅ Created user: {user_data['name']} ({user_data['email']}) - {user_data['role']}")
-            
-            await session.commit()
+                    # For very large seeds, drop secondary indexes for the load and rebuild them after
+                    if len(user_rows) > INDEX_REBUILD_THRESHOLD:
+                        dropped_indexes = await drop_secondary_indexes(session, "users")
+                    
+                    created_emails = await bulk_upsert_users(session, user_rows, hashed_password)
+                    for email, user_data in users_by_email.items():
+                        if email in created_emails:
+                            print(f"    ✅ Created user: {user_data['name']} ({email}) - {user_data['role']}")
+                        else:
+                            print(f"    ✅ User already exists: {user_data['name']} ({email})")
+                
+            finally:
+                # Rebuild even if the load failed; a rolled-back DROP left the
+                # indexes in place, so this is then a no-op
+                if dropped_indexes:
+                    print(f"🔧 Rebuilding {len(dropped_indexes)} users index(es)...")
+                    await recreate_indexes(dropped_indexes)
             
             # Generate summary
             print("\n" + "="*60)
             print("📊 LOGISTICS INDUSTRY SEED DATA SUMMARY")
             print("="*60)
             
-            # Count entities
-            tenant_count = await session.execute(text("SELECT COUNT(*) FROM sentinel.tenants"))
-            user_count = await session.execute(text("SELECT COUNT(*) FROM sentinel.users"))
+            # Count entities in one round-trip
+            counts = (await session.execute(text("""
+                SELECT (SELECT COUNT(*) FROM sentinel.tenants) AS tenants,
+                       (SELECT COUNT(*) FROM sentinel.users) AS users
+            """))).one()
             
             print(f"\n📈 Entity Counts:")
-            print(f"  Tenants: {tenant_count.scalar()}")
-            print(f"  Users: {user_count.scalar()}")
+            print(f"  Tenants: {counts.tenants}")
+            print(f"  Users: {counts.users}")
             
             print(f"\n🏢 Tenants Created:")
-            for data in tenant_data:
+            for data in TENANT_DATA:
                 print(f"  {data['name']} ({data['code']}) - {data['industry']}")
             
             print(f"\n👥 User Credentials (Password: {password}):")
@@ -197,11 +193,11 @@ async def seed_logistics_data():
             print("Ready for RBAC testing with realistic logistics scenarios.")
             
         except Exception as e:
+            # session.begin() has already rolled back any partial seed
             print(f"❌ Error: {e}")
-            await session.rollback()
             raise
     
-    await engine.dispose()
+    await seed_engine.dispose()
 
 async def main():
     """Main entry point."""
@@ -11,15 +11,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import uuid
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
 
 from src.config import settings
-from src.database import SessionLocal, init_db
+from src.database import init_db
 from src.models.tenant import Tenant, TenantType, IsolationMode
-from src.services.tenant_service import TenantService
 from src.schemas.tenant import TenantCreate, SubTenantCreate
 
+from _seed_common import SeedSession, seed_engine, bulk_upsert_tenants
+
 # Sample tenant data
 SAMPLE_TENANTS = [
     {
@@ -129,108 +129,93 @@ SAMPLE_SUB_TENANTS = [
 
 async def seed_tenants():
     """Create sample tenants"""
-    db = SessionLocal()
-    service = TenantService(db)
-    
-    try:
-        print("🌱 Seeding tenants...")
-        
-        # Check if platform tenant exists
-        platform_tenant = db.query(Tenant).filter(Tenant.code == "PLATFORM").first()
-        if not platform_tenant:
-            print("❌ Platform tenant not found. Run migrations first!")
-            return
-        
-        # Create root tenants
-        for tenant_data in SAMPLE_TENANTS:
-            existing = db.query(Tenant).filter(Tenant.code == tenant_data["code"]).first()
-            if existing:
-                print(f"⏭️  Tenant {tenant_data['code']} already exists, skipping...")
-                continue
-            
-            tenant = Tenant(
-                id=uuid.UUID(tenant_data["id"]),
-                name=tenant_data["name"],
-                code=tenant_data["code"],
-                type=tenant_data["type"],
-                isolation_mode=tenant_data["isolation_mode"],
-                settings=tenant_data["settings"],
-                features=tenant_data["features"],
-                metadata=tenant_data["metadata"],  # Will be mapped to tenant_metadata in __init__
-                is_active=True
-            )
+    async with SeedSession() as db:
+        try:
+            print("🌱 Seeding tenants...")
             
-            db.add(tenant)
-            print(f"✅ Created tenant: {tenant.code} - {tenant.name}")
-        
-        db.commit()
-        
-        # Create sub-tenants
-        for sub_tenant_data in SAMPLE_SUB_TENANTS:
-            parent = db.query(Tenant).filter(Tenant.code == sub_tenant_data["parent_code"]).first()
-            if not parent:
-                print(f"⚠️  Parent tenant {sub_tenant_data['parent_code']} not found, skipping sub-tenant...")
-                continue
+            async with db.begin():
+                # Check if platform tenant exists
+                result = await db.execute(select(Tenant.id).where(Tenant.code == "PLATFORM"))
+                if result.scalar_one_or_none() is None:
+                    print("❌ Platform tenant not found. Run migrations first!")
+                    return
+                
+                # Create root tenants in one statement
+                roots = await bulk_upsert_tenants(db, [
+                    {
+                        "id": uuid.UUID(tenant_data["id"]),
+                        "name": tenant_data["name"],
+                        "code": tenant_data["code"],
+                        "type": tenant_data["type"].value,
+                        "isolation_mode": tenant_data["isolation_mode"].value,
+                        "settings": tenant_data["settings"],
+                        "features": tenant_data["features"],
+                        "metadata": tenant_data["metadata"]
+                    }
+                    for tenant_data in SAMPLE_TENANTS
+                ])
+                for tenant_data in SAMPLE_TENANTS:
+                    if roots[tenant_data["code"]][1]:
+                        print(f"✅ Created tenant: {tenant_data['code']} - {tenant_data['name']}")
+                    else:
+                        print(f"⏭️  Tenant {tenant_data['code']} already exists, skipping...")
+                
+                # Create sub-tenants; parents are resolved by code in the same statement
+                subs = await bulk_upsert_tenants(db, [
+                    {
+                        "name": sub_tenant_data["name"],
+                        "code": sub_tenant_data["code"],
+                        "type": TenantType.SUB_TENANT.value,
+                        "parent_code": sub_tenant_data["parent_code"],
+                        "isolation_mode": sub_tenant_data["isolation_mode"].value,
+                        "settings": sub_tenant_data["settings"],
+                        "features": sub_tenant_data["features"],
+                        "metadata": sub_tenant_data["metadata"]
+                    }
+                    for sub_tenant_data in SAMPLE_SUB_TENANTS
+                ])
+                for sub_tenant_data in SAMPLE_SUB_TENANTS:
+                    if sub_tenant_data["code"] not in subs:
+                        print(f"⚠️  Parent tenant {sub_tenant_data['parent_code']} not found, skipping sub-tenant...")
+                    elif subs[sub_tenant_data["code"]][1]:
+                        print(f"✅ Created sub-tenant: {sub_tenant_data['code']} under {sub_tenant_data['parent_code']}")
+                    else:
+                        print(f"⏭️  Sub-tenant {sub_tenant_data['code']} already exists, skipping...")
             
-            existing = db.query(Tenant).filter(Tenant.code == sub_tenant_data["code"]).first()
-            if existing:
-                print(f"⏭️  Sub-tenant {sub_tenant_data['code']} already exists, skipping...")
-                continue
+            # Display summary
+            result = await db.execute(select(Tenant.type, func.count()).group_by(Tenant.type))
+            counts = dict(result.all())
             
-            sub_tenant = Tenant(
-                id=uuid.uuid4(),
-                name=sub_tenant_data["name"],
-                code=sub_tenant_data["code"],
-                type=TenantType.SUB_TENANT,
-                parent_tenant_id=parent.id,
-                isolation_mode=sub_tenant_data["isolation_mode"],
-                settings=sub_tenant_data["settings"],
-                features=sub_tenant_data["features"],
-                metadata=sub_tenant_data["metadata"],  # Will be mapped to tenant_metadata in __init__
-                is_active=True
-            )
+            print("\n📊 Seeding Summary:")
+            print(f"   Total tenants: {sum(counts.values())}")
+            print(f"   Root tenants: {counts.get(TenantType.ROOT, 0)}")
+            print(f"   Sub-tenants: {counts.get(TenantType.SUB_TENANT, 0)}")
             
-            db.add(sub_tenant)
-            print(f"✅ Created sub-tenant: {sub_tenant.code} under {parent.code}")
-        
-        db.commit()
-        
-        # Display summary
-        total_tenants = db.query(Tenant).count()
-        root_tenants = db.query(Tenant).filter(Tenant.type == TenantType.ROOT).count()
-        sub_tenants = db.query(Tenant).filter(Tenant.type == TenantType.SUB_TENANT).count()
-        
-        print("\n📊 Seeding Summary:")
-        print(f"   Total tenants: {total_tenants}")
-        print(f"   Root tenants: {root_tenants}")
-        print(f"   Sub-tenants: {sub_tenants}")
-        
-    except Exception as e:
-        print(f"❌ Error seeding tenants: {str(e)}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            print(f"❌ Error seeding tenants: {str(e)}")
+            raise
 
 async def clear_tenants():
     """Clear all tenants except platform tenant"""
-    db = SessionLocal()
-    
-    try:
-        print("🗑️  Clearing non-platform tenants...")
-        
-        # Delete all non-platform tenants
-        deleted = db.query(Tenant).filter(Tenant.code != "PLATFORM").delete()
-        db.commit()
-        
-        print(f"✅ Deleted {deleted} tenants")
-        
-    except Exception as e:
-        print(f"❌ Error clearing tenants: {str(e)}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    async with SeedSession() as db:
+        try:
+            print("🗑️  Clearing non-platform tenants...")
+            
+            # Delete all non-platform tenants in one statement. No ORM objects are loaded,
+            # so skip session synchronization. TRUNCATE can't keep the platform row.
+            result = await db.execute(
+                delete(Tenant)
+                .where(Tenant.code != "PLATFORM")
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            
+            print(f"✅ Deleted {result.rowcount} tenants")
+            
+        except Exception as e:
+            print(f"❌ Error clearing tenants: {str(e)}")
+            await db.rollback()
+            raise
 
 async def main():
     """Main function"""
@@ -249,6 +234,8 @@ async def main():
         await seed_tenants()
     else:
         await seed_tenants()
+    
+    await seed_engine.dispose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
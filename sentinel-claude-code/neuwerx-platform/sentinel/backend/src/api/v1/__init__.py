@@ -1,33 +1,28 @@
+from importlib import import_module
+
 from fastapi import APIRouter
-from src.api.v1.tenants import router as tenants_router
-from src.api.v1.auth import router as auth_router
-from src.api.v1.users import router as users_router
-from src.api.v1.service_accounts import router as service_accounts_router
-from src.api.v1.password_reset import router as password_reset_router
-from src.api.v1.avatars import router as avatars_router
-from src.api.v1.roles import router as roles_router
-from src.api.v1.groups import router as groups_router
-from src.api.v1.permissions import router as permissions_router
-from src.api.v1.resources import router as resources_router
-from src.api.v1.field_definitions import router as field_definitions_router
-from src.api.v1.navigation import router as navigation_router
-from src.api.v1.terminology import router as terminology_router
+
+# Router modules in mount order; each exposes a module-level ``router``
+ROUTER_MODULES = (
+    "auth",
+    "password_reset",
+    "avatars",
+    "tenants",
+    "terminology",
+    "users",
+    "service_accounts",
+    "roles",
+    "groups",
+    "permissions",
+    "resources",
+    "field_definitions",
+    "navigation",
+)
 
 api_router = APIRouter(prefix="/api/v1")
 
 # Include routers
-api_router.include_router(auth_router)
-api_router.include_router(password_reset_router)
-api_router.include_router(avatars_router)
-api_router.include_router(tenants_router)
-api_router.include_router(terminology_router)
-api_router.include_router(users_router)
-api_router.include_router(service_accounts_router)
-api_router.include_router(roles_router)
-api_router.include_router(groups_router)
-api_router.include_router(permissions_router)
-api_router.include_router(resources_router)
-api_router.include_router(field_definitions_router)
-api_router.include_router(navigation_router)
+for module_name in ROUTER_MODULES:
+    api_router.include_router(import_module(f"{__name__}.{module_name}").router)
 
-__all__ = ["api_router"]
\ No newline at end of file
+__all__ = ["api_router"]
@@ -1,21 +1,36 @@
 """
 Avatar API endpoints for user profile pictures
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional
 import aiofiles
+import hashlib
+import mimetypes
+import os
 from pathlib import Path
 
+from src.config import settings
 from src.database import get_db
 from src.services.avatar_service import AvatarService
 from src.core.security_utils import get_current_user, CurrentUser
 from src.utils.exceptions import ValidationError
 from src.core.rate_limiting import rate_limit
+from src.utils.http_cache import etag_matches, etag_response
 
 router = APIRouter(prefix="/users", tags=["avatars"])
 
+# Resolved once; serve_avatar only has to resolve the requested file
+AVATAR_ROOT = Path("storage/avatars").resolve()
+AVATAR_ROOT_PREFIX = str(AVATAR_ROOT) + os.sep
+
+
+def _avatar_etag(*parts: str) -> str:
+    """Weak ETag for avatar metadata; parts include the file ID, which changes on every upload"""
+    digest = hashlib.blake2s(":".join(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
 
 @router.post("/{user_id}/avatar", response_model=Dict[str, Any])
 @rate_limit(calls=5, period=60)  # 5 uploads per minute
@@ -38,8 +53,13 @@ async def upload_avatar(
         # TODO: Add admin role check when roles are implemented
         raise HTTPException(status_code=403, detail="Can only update own avatar")
     
+    avatar_service = AvatarService(db)
+    
+    # Reject oversized uploads up front when the client declared a size
+    if file.size and file.size > avatar_service.max_file_size:
+        raise HTTPException(status_code=413, detail="Avatar file too large")
+    
     try:
-        avatar_service = AvatarService(db)
         result = await avatar_service.upload_avatar(user_id, file)
         return result
     except ValidationError as e:
@@ -51,6 +71,8 @@ async def upload_avatar(
 @router.get("/{user_id}/avatar", response_model=Dict[str, Any])
 async def get_avatar_info(
     user_id: str,
+    request: Request,
+    response: Response,
     size: str = "medium",
     current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -68,7 +90,10 @@ async def get_avatar_info(
         result = await avatar_service.get_avatar(user_id, size)
         if not result:
             raise HTTPException(status_code=404, detail="Avatar not found")
-        return result
+        
+        # max-age=0: clients revalidate every time, so a new upload shows up at once
+        etag = _avatar_etag(user_id, result["file_id"], size)
+        return etag_response(result, request, response, ttl=0, etag=etag) or result
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -106,34 +131,51 @@ async def delete_avatar(
 
 
 # Static file serving for avatars
-@router.get("/avatars/{filename}")
-async def serve_avatar(filename: str):
+@router.api_route("/avatars/{filename}", methods=["GET", "HEAD"])
+async def serve_avatar(filename: str, request: Request):
     """
     Serve avatar files
     
     - **filename**: Avatar filename (e.g., uuid_medium.png)
     """
-    file_path = Path("storage/avatars") / filename
+    file_path = (AVATAR_ROOT / filename).resolve()
     
-    if not file_path.exists():
+    # Security check - ensure file is within avatar directory
+    if not str(file_path).startswith(AVATAR_ROOT_PREFIX):
         raise HTTPException(status_code=404, detail="Avatar not found")
     
-    # Security check - ensure file is within avatar directory
     try:
-        file_path.resolve().relative_to(Path("storage/avatars").resolve())
-    except ValueError:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Avatar not found")
     
+    # Avatar filenames embed a fresh file ID per upload, so a URL's content never changes
+    etag = f'"{hashlib.blake2s(str(stat_result.st_mtime_ns).encode(), digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": "public, max-age=31536000, immutable", "ETag": etag}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    
+    # Behind Nginx, hand the transfer to the proxy instead of streaming it from Python
+    if settings.AVATAR_ACCEL_REDIRECT_PREFIX:
+        headers["X-Accel-Redirect"] = f"{settings.AVATAR_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{filename}"
+        return Response(status_code=200, media_type=media_type, headers=headers)
+    
     return FileResponse(
         path=file_path,
-        media_type="image/png",
-        headers={"Cache-Control": "public, max-age=3600"}  # Cache for 1 hour
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result
     )
 
 
 @router.get("/{user_id}/avatar/urls", response_model=Dict[str, str])
 async def get_avatar_urls(
     user_id: str,
+    request: Request,
+    response: Response,
     current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -149,7 +191,9 @@ async def get_avatar_urls(
         urls = await avatar_service.generate_avatar_urls(user_id)
         if not urls:
             raise HTTPException(status_code=404, detail="User has no avatar")
-        return urls
+        
+        etag = _avatar_etag(user_id, *urls.values())
+        return etag_response(urls, request, response, ttl=0, etag=etag) or urls
     except HTTPException:
         raise
     except Exception as e:
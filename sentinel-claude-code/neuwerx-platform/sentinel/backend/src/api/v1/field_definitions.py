@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.core.security_utils import get_current_user, require_scopes
+from src.core.security_utils import get_current_user, require_scope
 from src.services.field_definition_service import FieldDefinitionService
 from src.schemas.field_definition import (
     FieldDefinitionCreateRequest, FieldDefinitionUpdate, FieldDefinitionQuery,
@@ -25,11 +25,6 @@ from src.schemas import FieldDefinitionCreate
 from src.core.exceptions import ValidationError, NotFoundError, ConflictError
 
 
-# Helper function for single scope requirement
-def require_scope(scope: str):
-    return require_scopes(scope)
-
-
 router = APIRouter(prefix="/field-definitions", tags=["Field Definition Management"])
 
 
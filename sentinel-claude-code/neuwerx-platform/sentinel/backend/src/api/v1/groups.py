@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.core.security_utils import get_current_user, require_scopes
+from src.core.security_utils import get_current_user, require_scope
 from src.services.group_service import GroupService
 from src.schemas.group import (
     GroupCreate, GroupUpdate, GroupQuery, GroupResponse,
@@ -18,9 +18,6 @@ from src.core.exceptions import ValidationError, NotFoundError, ConflictError
 
 router = APIRouter(prefix="/groups", tags=["Group Management"])
 
-# Helper for single scope
-require_scope = lambda s: require_scopes(s)
-
 
 @router.post(
     "/",
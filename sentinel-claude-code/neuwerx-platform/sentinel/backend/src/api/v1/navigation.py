@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.core.security_utils import get_current_user, require_scopes
+from src.core.security_utils import get_current_user, require_scope
 from src.services.menu_service import MenuService
 from src.schemas.menu import (
     MenuItemCreateRequest, MenuItemUpdate, MenuQuery,
@@ -25,11 +25,6 @@ from src.schemas import MenuItemCreate
 from src.core.exceptions import ValidationError, NotFoundError, ConflictError
 
 
-# Helper function for single scope requirement
-def require_scope(scope: str):
-    return require_scopes(scope)
-
-
 router = APIRouter(prefix="/navigation", tags=["Navigation Management"])
 
 
@@ -68,7 +68,7 @@ async def list_permissions(
         service = PermissionService(db)
         
         # Check if user has global permission access
-        has_global_access = hasattr(current_user, 'scopes') and 'permission:global' in current_user.scopes
+        has_global_access = 'permission:global' in current_user.scopes
         tenant_id = None if has_global_access else current_user.tenant_id
         
         return await service.list_permissions(
@@ -10,23 +10,24 @@ Provides RESTful API for resource management including:
 """
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.core.security_utils import get_current_user, require_scopes
+from src.core.security_utils import get_current_user, require_scope
 from src.services.resource_service import ResourceService
 
-# Helper function for single scope requirement
-def require_scope(scope: str):
-    return require_scopes(scope)
-
+from src.models.resource import ResourceType
 from src.schemas.resource import (
-    ResourceCreateRequest, ResourceUpdate, ResourceQuery, ResourceResponse, 
+    ResourceCreate, ResourceCreateRequest, ResourceUpdate, ResourceQuery, ResourceResponse, 
     ResourceDetailResponse, ResourceListResponse, ResourceTreeResponse,
     ResourcePermissionResponse, ResourceStatistics, ResourceMoveRequest
 )
 from src.core.exceptions import ValidationError, NotFoundError, ConflictError
+from src.utils.http_cache import etag_response
+
+# Resource type values accepted by the list filter
+_RESOURCE_TYPES = {t.value: t for t in ResourceType}
 
 
 router = APIRouter(prefix="/resources", tags=["Resource Management"])
@@ -47,8 +48,6 @@ async def create_resource(
 ) -> ResourceResponse:
     """Create a new resource."""
     try:
-        from src.schemas.resource import ResourceCreate
-        
         # Convert request to internal schema with tenant_id
         resource_create = ResourceCreate(
             **resource_data.model_dump(),
@@ -78,20 +77,18 @@ async def list_resources(
     search: Optional[str] = Query(None, description="Search in name and code"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     sort_by: str = Query("name", description="Field to sort by"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> ResourceListResponse:
     """List resources with filtering and pagination."""
-    from src.models.resource import ResourceType
-    
     # Convert string type to enum if provided
     resource_type = None
     if type:
-        try:
-            resource_type = ResourceType(type)
-        except ValueError:
+        resource_type = _RESOURCE_TYPES.get(type)
+        if resource_type is None:
             raise HTTPException(status_code=400, detail=f"Invalid resource type: {type}")
     
     query = ResourceQuery(
@@ -101,6 +98,7 @@ async def list_resources(
         search=search,
         page=page,
         limit=limit,
+        cursor=cursor,
         sort_by=sort_by,
         sort_order=sort_order
     )
@@ -108,7 +106,7 @@ async def list_resources(
     service = ResourceService(db)
     
     # Check if user has global resource access
-    has_global_access = hasattr(current_user, 'scopes') and 'resource:global' in current_user.scopes
+    has_global_access = 'resource:global' in current_user.scopes
     tenant_id = None if has_global_access else current_user.tenant_id
     
     return await service.list_resources(
@@ -125,6 +123,8 @@ async def list_resources(
     description="Get hierarchical resource tree structure"
 )
 async def get_resource_tree(
+    request: Request,
+    response: Response,
     root_id: Optional[UUID] = Query(None, description="Root resource ID (optional, returns all if not specified)"),
     max_depth: Optional[int] = Query(None, ge=1, le=10, description="Maximum depth to traverse"),
     current_user=Depends(get_current_user),
@@ -135,14 +135,15 @@ async def get_resource_tree(
         service = ResourceService(db)
         
         # Check if user has global resource access
-        has_global_access = hasattr(current_user, 'scopes') and 'resource:global' in current_user.scopes
+        has_global_access = 'resource:global' in current_user.scopes
         tenant_id = None if has_global_access else current_user.tenant_id
         
-        return await service.get_resource_tree(
+        tree = await service.get_resource_tree(
             tenant_id=tenant_id,
             root_id=root_id,
             max_depth=max_depth
         )
+        return etag_response(tree, request, response) or tree
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -162,7 +163,7 @@ async def get_resource_statistics(
     service = ResourceService(db)
     
     # Check if user has global resource access
-    has_global_access = hasattr(current_user, 'scopes') and 'resource:global' in current_user.scopes
+    has_global_access = 'resource:global' in current_user.scopes
     tenant_id = None if has_global_access else current_user.tenant_id
     
     return await service.get_resource_statistics(tenant_id)
@@ -310,6 +311,7 @@ async def get_child_resources(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> ResourceListResponse:
@@ -319,7 +321,8 @@ async def get_child_resources(
         parent_id=resource_id,
         is_active=is_active,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
     
     service = ResourceService(db)
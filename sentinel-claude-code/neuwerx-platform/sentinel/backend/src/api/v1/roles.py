@@ -13,12 +13,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.core.security_utils import get_current_user, require_scopes
+from src.core.security_utils import get_current_user, require_scope
 from src.services.role_service import RoleService
 
-# Helper function for single scope requirement
-def require_scope(scope: str):
-    return require_scopes(scope)
 from src.schemas.role import (
     RoleCreate, RoleUpdate, RoleQuery, RoleResponse, RoleDetailResponse,
     RoleListResponse, UserRoleAssignmentCreate, UserRoleAssignmentResponse,
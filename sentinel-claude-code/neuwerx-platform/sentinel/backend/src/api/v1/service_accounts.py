@@ -13,7 +13,7 @@ from src.services.service_account_service import ServiceAccountService
 from src.schemas.user import (
     ServiceAccountCreate, ServiceAccountUpdate, ServiceAccountResponse,
     ServiceAccountDetailResponse, ServiceAccountListResponse, CredentialResponse,
-    CredentialRotation, UserQuery, SortField, SortOrder
+    CredentialRotation, ServiceAccountWithCredentials, UserQuery, SortField, SortOrder
 )
 from src.core.exceptions import (
     NotFoundError, ValidationError, ConflictError
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/service-accounts", tags=["service-accounts"])
 security = HTTPBearer()
 
 
-@router.post("/", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=ServiceAccountWithCredentials, status_code=status.HTTP_201_CREATED)
 async def create_service_account(
     account_data: ServiceAccountCreate,
     current_user: CurrentUser = Depends(require_scopes("service_account:admin")),
@@ -45,10 +45,10 @@ async def create_service_account(
             creator_id=current_user.user_id
         )
         
-        return {
-            "service_account": account_response,
-            "credentials": credential_response
-        }
+        return ServiceAccountWithCredentials(
+            service_account=account_response,
+            credentials=credential_response
+        )
     except ConflictError as e:
         raise HTTPException(status_code=409, detail=str(e))
     except ValidationError as e:
@@ -206,23 +206,17 @@ async def validate_service_account(
     """
     try:
         service_account_service = ServiceAccountService(db)
-        account = await service_account_service.get_service_account(
+        is_valid, client_id, is_active = await service_account_service.validate_by_id(
             account_id=account_id,
-            tenant_id=current_user.tenant_id
-        )
-        
-        # Validate the credentials
-        validated_account = await service_account_service.validate_api_key(
-            client_id=account.client_id,
             client_secret=client_secret,
             tenant_id=current_user.tenant_id
         )
         
         return {
-            "valid": validated_account is not None,
+            "valid": is_valid,
             "account_id": account_id,
-            "client_id": account.client_id,
-            "is_active": account.is_active
+            "client_id": client_id,
+            "is_active": is_active
         }
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, status, Query
+import asyncio
+from functools import lru_cache
+from fastapi import APIRouter, Depends, status, Query, Request, Response
 from typing import Dict, Any, List, Optional
 from uuid import UUID
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.database import get_db
-from src.services.terminology_service import TerminologyService
+from src.config import settings
+from src.database import get_db, get_session_factory
+from src.services.terminology_service import TerminologyService, INDUSTRY_TEMPLATES
 from src.core.security_utils import get_current_user, require_scopes, CurrentUser
 from src.schemas.terminology import (
     TerminologyResponse, 
@@ -15,15 +18,38 @@ from src.schemas.terminology import (
     TerminologyBulkOperation,
     TerminologyStats
 )
+from src.core.exceptions import NotFoundError, ValidationError
 from src.utils.exceptions import (
     NotFoundHTTPError, 
     BadRequestError, 
     ConflictHTTPError
 )
+from src.utils.http_cache import etag_response, payload_etag
 
 router = APIRouter(prefix="/terminology", tags=["Terminology"])
 
 
+@lru_cache(maxsize=1)
+def _terminology_templates() -> Dict[str, TerminologyTemplate]:
+    """Industry templates in response format; the inputs are static, so build them once"""
+    return {
+        name: TerminologyTemplate(
+            name=name,
+            display_name=name.title() + " Industry",
+            description=f"Terminology template for {name} industry",
+            industry=name,
+            terminology=terminology
+        )
+        for name, terminology in INDUSTRY_TEMPLATES.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _terminology_templates_etag() -> str:
+    """ETag of the static template payload"""
+    return payload_etag(_terminology_templates())
+
+
 @router.get(
     "/tenants/{tenant_id}",
     response_model=TerminologyResponse,
@@ -39,9 +65,9 @@ async def get_tenant_terminology(
     try:
         service = TerminologyService(db)
         return await service.get_terminology(tenant_id)
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -59,22 +85,17 @@ async def update_tenant_terminology(
 ):
     """Update terminology configuration for a tenant"""
     try:
+        # Empty keys and values are already rejected by TerminologyUpdate during request parsing
         service = TerminologyService(db)
-        
-        # Validate terminology first
-        validation = await service.validate_terminology(terminology_data.terminology)
-        if not validation["valid"]:
-            raise BadRequestError(f"Invalid terminology: {validation['errors']}")
-        
         return await service.update_terminology(
             tenant_id,
             terminology_data.terminology,
             terminology_data.inherit_parent,
             terminology_data.apply_to_children
         )
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -93,9 +114,9 @@ async def reset_tenant_terminology(
     try:
         service = TerminologyService(db)
         return await service.reset_terminology(tenant_id)
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -123,9 +144,9 @@ async def apply_terminology_to_children(
             "affected_tenant_ids": affected_tenant_ids,
             "recursive": recursive
         }
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -145,7 +166,7 @@ async def validate_terminology(
     try:
         service = TerminologyService(db)
         return await service.validate_terminology(terminology)
-    except Exception as e:
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -156,12 +177,15 @@ async def validate_terminology(
     description="Get default Sentinel terminology configuration"
 )
 async def get_default_terminology(
+    request: Request,
+    response: Response,
     current_user: CurrentUser = Depends(require_scopes("tenant:read")),
     db: AsyncSession = Depends(get_db)
 ):
     """Get default Sentinel terminology"""
     service = TerminologyService(db)
-    return service.get_default_terminology()
+    defaults = service.get_default_terminology()
+    return etag_response(defaults, request, response) or defaults
 
 
 # =====================================================
@@ -175,25 +199,15 @@ async def get_default_terminology(
     description="Get available industry terminology templates"
 )
 async def get_terminology_templates(
-    current_user: CurrentUser = Depends(require_scopes("tenant:read")),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    current_user: CurrentUser = Depends(require_scopes("tenant:read"))
 ):
     """Get available terminology templates"""
-    service = TerminologyService(db)
-    templates_data = service.get_industry_templates()
-    
-    # Convert to proper template format
-    templates = {}
-    for name, terminology in templates_data.items():
-        templates[name] = TerminologyTemplate(
-            name=name,
-            display_name=name.title() + " Industry",
-            description=f"Terminology template for {name} industry",
-            industry=name,
-            terminology=terminology
-        )
-    
-    return templates
+    templates = _terminology_templates()
+    return etag_response(
+        templates, request, response, etag=_terminology_templates_etag()
+    ) or templates
 
 
 @router.post(
@@ -216,11 +230,9 @@ async def apply_terminology_template(
             template_data.template_name,
             template_data.customizations
         )
-    except ValueError as e:
-        raise BadRequestError(str(e))
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
 
 
@@ -236,14 +248,21 @@ async def apply_terminology_template(
 async def bulk_terminology_operation(
     operation_data: TerminologyBulkOperation,
     current_user: CurrentUser = Depends(require_scopes("tenant:admin")),
-    db: AsyncSession = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_session_factory)
 ):
     """Perform bulk terminology operations"""
-    try:
-        service = TerminologyService(db)
-        results = []
-        
-        for tenant_id in operation_data.tenant_ids:
+    # Tenants are processed concurrently, each on its own session so one
+    # failed commit cannot poison the others; the semaphore caps how many pool
+    # connections a single request can hold. Recursive applies stay serial
+    # since listed tenants may share descendants and lock them in any order
+    concurrency = 1 if operation_data.recursive else min(
+        len(operation_data.tenant_ids), settings.TERMINOLOGY_BULK_CONCURRENCY
+    )
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def process_tenant(tenant_id: UUID) -> Dict[str, Any]:
+        async with semaphore, session_factory() as session:
+            service = TerminologyService(session)
             try:
                 if operation_data.operation == "apply":
                     result = await service.update_terminology(
@@ -259,29 +278,30 @@ async def bulk_terminology_operation(
                     merged = {**current, **operation_data.terminology}
                     result = await service.update_terminology(tenant_id, merged)
                 
-                results.append({
+                return {
                     "tenant_id": tenant_id,
                     "status": "success",
                     "result": result
-                })
+                }
                 
             except Exception as e:
-                results.append({
+                return {
                     "tenant_id": tenant_id,
                     "status": "error",
                     "error": str(e)
-                })
-        
-        return {
-            "operation": operation_data.operation,
-            "total_tenants": len(operation_data.tenant_ids),
-            "successful": len([r for r in results if r["status"] == "success"]),
-            "failed": len([r for r in results if r["status"] == "error"]),
-            "results": results
-        }
-        
-    except Exception as e:
-        raise BadRequestError(str(e))
+                }
+    
+    results = await asyncio.gather(
+        *(process_tenant(tenant_id) for tenant_id in operation_data.tenant_ids)
+    )
+    
+    return {
+        "operation": operation_data.operation,
+        "total_tenants": len(operation_data.tenant_ids),
+        "successful": len([r for r in results if r["status"] == "success"]),
+        "failed": len([r for r in results if r["status"] == "error"]),
+        "results": results
+    }
 
 
 # =====================================================
@@ -337,7 +357,7 @@ async def get_simple_terminology(
     try:
         service = TerminologyService(db)
         return await service.get_terminology_simple(tenant_id)
-    except Exception as e:
-        if "not found" in str(e).lower():
-            raise NotFoundHTTPError(str(e))
+    except NotFoundError as e:
+        raise NotFoundHTTPError(str(e))
+    except ValidationError as e:
         raise BadRequestError(str(e))
\ No newline at end of file
@@ -10,12 +10,20 @@ class Settings(BaseSettings):
     DATABASE_SCHEMA: str = "sentinel"
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500
+    # Sessions one bulk terminology request may hold at once; keep well below the pool size
+    TERMINOLOGY_BULK_CONCURRENCY: int = 4
     
     REDIS_ENABLED: bool = False
     REDIS_URL: Optional[str] = "redis://localhost:6379"
     CACHE_BACKEND: str = "memory"
     CACHE_TTL: int = 300
     
+    # Internal Nginx location mapped to storage/avatars (e.g. "/_avatars/");
+    # when set, avatar bytes are sent by the proxy via X-Accel-Redirect
+    AVATAR_ACCEL_REDIRECT_PREFIX: Optional[str] = None
+    
     JWT_SECRET_KEY: str = "your-secret-key-change-this-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -6,8 +6,9 @@ in production environments.
 """
 
 import asyncio
+import heapq
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +19,10 @@ class InMemoryCacheManager:
     
     def __init__(self):
         self._cache: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (expires_at, key); entries left behind by overwrites and
+        # deletes are skipped when popped, and the heap is rebuilt from the
+        # live entries once it grows past twice their number
+        self._expirations: List[Tuple[float, str]] = []
         self._cleanup_task: Optional[asyncio.Task] = None
         self._start_cleanup_task()
     
@@ -31,20 +36,14 @@ class InMemoryCacheManager:
         while True:
             try:
                 current_time = time.time()
-                expired_keys = []
+                expired_count = self._evict_expired(current_time)
                 
-                for key, entry in self._cache.items():
-                    if entry['expires_at'] <= current_time:
-                        expired_keys.append(key)
+                if expired_count:
+                    logger.debug(f"Cleaned up {expired_count} expired cache entries")
                 
-                for key in expired_keys:
-                    del self._cache[key]
-                
-                if expired_keys:
-                    logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-                
-                # Run cleanup every 60 seconds
-                await asyncio.sleep(60)
+                # Sleep until the next expiry, checking at least every 60 seconds
+                delay = self._expirations[0][0] - current_time if self._expirations else 60
+                await asyncio.sleep(min(delay, 60))
                 
             except asyncio.CancelledError:
                 break
@@ -52,6 +51,23 @@ class InMemoryCacheManager:
                 logger.error(f"Error in cache cleanup task: {e}")
                 await asyncio.sleep(60)
     
+    def _evict_expired(self, now: float) -> int:
+        """Remove entries due by ``now``, popping only those from the heap."""
+        expired_count = 0
+        while self._expirations and self._expirations[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expirations)
+            entry = self._cache.get(key)
+            if entry is not None and entry['expires_at'] == expires_at:
+                del self._cache[key]
+                expired_count += 1
+        return expired_count
+    
+    def _compact_expirations(self) -> None:
+        """Rebuild the heap from live entries once stale tuples outnumber them."""
+        if len(self._expirations) > 2 * len(self._cache):
+            self._expirations = [(entry['expires_at'], key) for key, entry in self._cache.items()]
+            heapq.heapify(self._expirations)
+    
     async def get(self, key: str) -> Optional[str]:
         """Get value from cache."""
         entry = self._cache.get(key)
@@ -72,14 +88,18 @@ class InMemoryCacheManager:
             'value': value,
             'expires_at': expires_at
         }
+        heapq.heappush(self._expirations, (expires_at, key))
+        self._compact_expirations()
     
     async def delete(self, key: str) -> None:
         """Delete key from cache."""
         self._cache.pop(key, None)
+        self._compact_expirations()
     
     async def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expirations.clear()
     
     def size(self) -> int:
         """Get number of entries in cache."""
@@ -3,11 +3,15 @@ Rate limiting utilities for API endpoints
 """
 from functools import wraps
 from typing import Dict, Optional
+import logging
 import time
 from collections import defaultdict, deque
 
+from src.config import settings
 from src.core.exceptions import RateLimitError
 
+logger = logging.getLogger(__name__)
+
 
 class InMemoryRateLimiter:
     """Simple in-memory rate limiter for development/testing"""
@@ -15,7 +19,7 @@ class InMemoryRateLimiter:
     def __init__(self):
         self.clients: Dict[str, deque] = defaultdict(deque)
     
-    def is_allowed(self, key: str, calls: int, period: int) -> bool:
+    async def is_allowed(self, key: str, calls: int, period: int) -> bool:
         """Check if request is allowed under rate limit"""
         now = time.time()
         client_calls = self.clients[key]
@@ -31,7 +35,7 @@ class InMemoryRateLimiter:
         
         return False
     
-    def get_reset_time(self, key: str, period: int) -> Optional[float]:
+    async def get_reset_time(self, key: str, period: int) -> Optional[float]:
         """Get the time when rate limit will reset"""
         client_calls = self.clients.get(key)
         if not client_calls:
@@ -40,14 +44,64 @@ class InMemoryRateLimiter:
         return client_calls[0] + period
 
 
-# Global rate limiter instance
-rate_limiter = InMemoryRateLimiter()
+class RedisRateLimiter:
+    """Fixed-window rate limiter shared by every worker through Redis"""
+    
+    # Count the call and start the window on the first one, in a single round-trip
+    INCREMENT_SCRIPT = """
+        local count = redis.call('INCR', KEYS[1])
+        if count == 1 then
+            redis.call('EXPIRE', KEYS[1], ARGV[1])
+        end
+        return count
+    """
+    
+    def __init__(self):
+        self._redis = None
+        self._increment = None
+    
+    async def _get_connection(self):
+        if not self._redis:
+            import redis.asyncio as redis
+            pool = redis.ConnectionPool.from_url(settings.REDIS_URL, decode_responses=True)
+            self._redis = redis.Redis(connection_pool=pool)
+            self._increment = self._redis.register_script(self.INCREMENT_SCRIPT)
+        return self._redis
+    
+    async def is_allowed(self, key: str, calls: int, period: int) -> bool:
+        """Check if request is allowed under rate limit"""
+        try:
+            await self._get_connection()
+            count = await self._increment(keys=[f"rl:{key}"], args=[period])
+            return count <= calls
+        except Exception as e:
+            # Fail open rather than rejecting traffic while Redis is unavailable
+            logger.error(f"Redis rate limit error: {str(e)}")
+            return True
+    
+    async def get_reset_time(self, key: str, period: int) -> Optional[float]:
+        """Get the time when rate limit will reset"""
+        try:
+            redis = await self._get_connection()
+            ttl = await redis.ttl(f"rl:{key}")
+        except Exception as e:
+            logger.error(f"Redis rate limit error: {str(e)}")
+            return None
+        
+        return time.time() + ttl if ttl > 0 else None
+
+
+# Global rate limiter instance; Redis keeps one limit across workers
+rate_limiter = RedisRateLimiter() if settings.REDIS_ENABLED else InMemoryRateLimiter()
 
 
 def rate_limit(calls: int, period: int):
     """
     Decorator for rate limiting endpoints
     
+    Limits are tracked per endpoint, keyed on the authenticated user when the
+    endpoint takes ``current_user`` and on the client IP otherwise.
+    
     Args:
         calls: Maximum number of calls allowed
         period: Time period in seconds
@@ -66,13 +120,21 @@ def rate_limit(calls: int, period: int):
                 # Look in kwargs
                 request = kwargs.get('request')
             
-            if request:
+            current_user = kwargs.get('current_user')
+            client_id = None
+            if current_user is not None:
+                client_id = f"user:{current_user.user_id}"
+            elif request:
                 # Get client identifier (IP address)
                 x_forwarded_for = request.headers.get("x-forwarded-for")
                 client_ip = x_forwarded_for.split(",")[0] if x_forwarded_for else request.client.host
+                client_id = f"ip:{client_ip}"
+            
+            if client_id:
+                key = f"{func.__name__}:{client_id}"
                 
-                if not rate_limiter.is_allowed(client_ip, calls, period):
-                    reset_time = rate_limiter.get_reset_time(client_ip, period)
+                if not await rate_limiter.is_allowed(key, calls, period):
+                    reset_time = await rate_limiter.get_reset_time(key, period)
                     retry_after = int(reset_time - time.time()) if reset_time else period
                     
                     raise RateLimitError(
@@ -82,4 +144,4 @@ def rate_limit(calls: int, period: int):
             
             return await func(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
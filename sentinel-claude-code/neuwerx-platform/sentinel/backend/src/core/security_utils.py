@@ -1,6 +1,7 @@
 """
 Security utilities and authentication dependencies
 """
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,7 +25,8 @@ class CurrentUser:
         self.tenant_id = token_info.tenant_id
         self.tenant_code = token_info.tenant_code
         self.is_service_account = token_info.is_service_account
-        self.scopes = token_info.scopes
+        # Frozen set so per-request scope checks are O(1) membership tests
+        self.scopes = frozenset(token_info.scopes)
         self.session_id = session_id
 
 
@@ -102,13 +104,16 @@ async def get_current_user_optional(
         return None
 
 
+@lru_cache(maxsize=None)
 def require_scopes(*required_scopes: str):
     """
     Dependency to require specific scopes
+    
+    Checkers are cached per scope set, so routes requiring the same scopes share
+    one dependency and FastAPI runs it at most once per request.
     """
     def scope_checker(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
-        user_scopes = set(current_user.scopes)
-        missing_scopes = [scope for scope in required_scopes if scope not in user_scopes]
+        missing_scopes = [scope for scope in required_scopes if scope not in current_user.scopes]
         
         if missing_scopes:
             raise HTTPException(
@@ -124,6 +129,11 @@ def require_scopes(*required_scopes: str):
     return scope_checker
 
 
+def require_scope(scope: str):
+    """Dependency to require a single scope"""
+    return require_scopes(scope)
+
+
 def require_service_account():
     """
     Dependency to require service account authentication
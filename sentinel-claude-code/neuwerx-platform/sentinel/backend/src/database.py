@@ -1,7 +1,7 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import MetaData, event, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import logging
@@ -32,12 +32,15 @@ if settings.DEBUG:
 else:
     engine = create_async_engine(
         database_url,
-        poolclass=QueuePool,
+        poolclass=AsyncAdaptedQueuePool,
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
         echo=settings.DEBUG,
         pool_pre_ping=True,
         connect_args={
+            # Prepared statements cached per pooled connection by the asyncpg dialect
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
             "server_settings": {
                 "search_path": f"{settings.DATABASE_SCHEMA},public"
             }
@@ -62,6 +65,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+def get_session_factory() -> async_sessionmaker:
+    """Session factory for endpoints that need several independent sessions"""
+    return AsyncSessionLocal
+
 @asynccontextmanager
 async def get_db_context():
     async with AsyncSessionLocal() as session:
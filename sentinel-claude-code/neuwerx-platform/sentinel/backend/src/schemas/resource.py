@@ -96,11 +96,12 @@ class ResourceDetailResponse(ResourceResponse):
 class ResourceListResponse(BaseModel):
     """Schema for paginated resource lists."""
     items: List[ResourceResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total matches; omitted on cursor pages")
     page: int = 1
     limit: int = 50
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class ResourceTreeNode(BaseModel):
@@ -140,6 +141,7 @@ class ResourceQuery(BaseModel):
     # Pagination
     page: int = Field(default=1, ge=1, description="Page number")
     limit: int = Field(default=50, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page; replaces page")
     
     # Sorting
     sort_by: str = Field(default="name", description="Sort field")
@@ -268,6 +268,12 @@ class CredentialResponse(BaseModel):
         }
 
 
+class ServiceAccountWithCredentials(BaseModel):
+    """Response for service account creation, carrying the one-time credentials"""
+    service_account: ServiceAccountResponse
+    credentials: CredentialResponse
+
+
 class BulkOperationResponse(BaseModel):
     """Response for bulk operations"""
     operation: BulkOperationType
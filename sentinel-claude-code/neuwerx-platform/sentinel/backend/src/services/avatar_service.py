@@ -1,6 +1,7 @@
 """
 Avatar service for handling user profile pictures
 """
+import asyncio
 import os
 import uuid
 import hashlib
@@ -13,6 +14,7 @@ from PIL import Image
 import aiofiles
 
 from src.models.user import User
+from src.services.cache_service import cache_service
 from src.utils.exceptions import ValidationError
 
 
@@ -24,6 +26,7 @@ class AvatarService:
         
         # Avatar configuration
         self.max_file_size = 5 * 1024 * 1024  # 5MB
+        self.upload_chunk_size = 64 * 1024  # 64KB
         self.allowed_formats = {'PNG', 'JPEG', 'JPG', 'WEBP'}
         self.avatar_sizes = {
             'thumbnail': (64, 64),
@@ -76,10 +79,11 @@ class AvatarService:
         # Process and save different sizes
         avatar_urls = {}
         try:
+            # Resized variants are always written as PNG, so name them accordingly
             for size_name, dimensions in self.avatar_sizes.items():
-                processed_path = self.storage_dir / f"{file_id}_{size_name}{file_extension}"
+                processed_path = self.storage_dir / f"{file_id}_{size_name}.png"
                 await self._resize_image(original_path, processed_path, dimensions)
-                avatar_urls[size_name] = f"{self.base_url}/{file_id}_{size_name}{file_extension}"
+                avatar_urls[size_name] = f"{self.base_url}/{file_id}_{size_name}.png"
             
             # Clean up old avatar if exists
             if user.avatar_file_id:
@@ -93,6 +97,7 @@ class AvatarService:
                 )
             )
             await self.db.commit()
+            await cache_service.delete(f"avatar:{user_id}")
             
             return {
                 "file_id": file_id,
@@ -120,23 +125,20 @@ class AvatarService:
         if size not in self.avatar_sizes:
             raise ValidationError(f"Invalid size. Must be one of: {list(self.avatar_sizes.keys())}")
         
-        user_result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = user_result.scalar_one_or_none()
-        if not user or not user.avatar_file_id:
+        avatar_file_id = await self._get_avatar_file_id(user_id)
+        if not avatar_file_id:
             return None
         
         # Check if file exists
         file_extension = ".png"  # Default, could be stored in DB
-        file_path = self.storage_dir / f"{user.avatar_file_id}_{size}{file_extension}"
+        file_path = self.storage_dir / f"{avatar_file_id}_{size}{file_extension}"
         
         if not file_path.exists():
             return None
         
         return {
-            "file_id": user.avatar_file_id,
-            "url": f"{self.base_url}/{user.avatar_file_id}_{size}{file_extension}",
+            "file_id": avatar_file_id,
+            "url": f"{self.base_url}/{avatar_file_id}_{size}{file_extension}",
             "size": size,
             "file_path": str(file_path)
         }
@@ -169,25 +171,38 @@ class AvatarService:
             )
         )
         await self.db.commit()
+        await cache_service.delete(f"avatar:{user_id}")
         
         return True
     
     async def generate_avatar_urls(self, user_id: str) -> Optional[Dict[str, str]]:
         """Generate all avatar URLs for a user"""
-        user_result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = user_result.scalar_one_or_none()
-        if not user or not user.avatar_file_id:
+        avatar_file_id = await self._get_avatar_file_id(user_id)
+        if not avatar_file_id:
             return None
         
         file_extension = ".png"  # Default
         urls = {}
         for size_name in self.avatar_sizes:
-            urls[size_name] = f"{self.base_url}/{user.avatar_file_id}_{size_name}{file_extension}"
+            urls[size_name] = f"{self.base_url}/{avatar_file_id}_{size_name}{file_extension}"
         
         return urls
     
+    async def _get_avatar_file_id(self, user_id: str) -> Optional[str]:
+        """Get the user's current avatar file ID, cached until the avatar changes"""
+        cache_key = f"avatar:{user_id}"
+        cached = await cache_service.get(cache_key)
+        if cached:
+            return cached
+        
+        result = await self.db.execute(
+            select(User.avatar_file_id).where(User.id == user_id)
+        )
+        avatar_file_id = result.scalar_one_or_none()
+        if avatar_file_id:
+            await cache_service.set(cache_key, str(avatar_file_id), ttl=300)
+        return avatar_file_id
+    
     async def _validate_file(self, file: UploadFile) -> None:
         """Validate uploaded file"""
         if not file.filename:
@@ -223,50 +238,65 @@ class AvatarService:
         return Path(filename).suffix.lower()
     
     async def _save_uploaded_file(self, file: UploadFile, path: Path) -> None:
-        """Save uploaded file to disk"""
+        """Stream uploaded file to disk in chunks, enforcing the size limit"""
+        written = 0
         async with aiofiles.open(path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
-            await file.seek(0)  # Reset for potential reuse
+            while chunk := await file.read(self.upload_chunk_size):
+                written += len(chunk)
+                if written > self.max_file_size:
+                    break
+                await f.write(chunk)
+        await file.seek(0)  # Reset for potential reuse
+        
+        # Clients may omit Content-Length, so the limit is also enforced while copying
+        if written > self.max_file_size:
+            path.unlink(missing_ok=True)
+            raise ValidationError(f"File too large. Maximum size: {self.max_file_size // 1024 // 1024}MB")
     
     async def _resize_image(self, input_path: Path, output_path: Path, size: tuple) -> None:
         """Resize image to specified dimensions"""
         try:
-            with Image.open(input_path) as img:
-                # Convert to RGB if necessary (for JPEG)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create white background for transparent images
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize maintaining aspect ratio with center crop
-                img_ratio = img.width / img.height
-                target_ratio = size[0] / size[1]
-                
-                if img_ratio > target_ratio:
-                    # Image is wider, crop width
-                    new_width = int(img.height * target_ratio)
-                    left = (img.width - new_width) // 2
-                    img = img.crop((left, 0, left + new_width, img.height))
-                elif img_ratio < target_ratio:
-                    # Image is taller, crop height
-                    new_height = int(img.width / target_ratio)
-                    top = (img.height - new_height) // 2
-                    img = img.crop((0, top, img.width, top + new_height))
-                
-                # Resize to target size
-                img = img.resize(size, Image.Resampling.LANCZOS)
-                
-                # Save with optimization
-                img.save(output_path, 'PNG', optimize=True)
+            # Decoding and resampling are CPU-bound, so keep them off the event loop
+            await asyncio.to_thread(self._resize_image_sync, input_path, output_path, size)
         except Exception as e:
             raise ValidationError(f"Failed to process image: {str(e)}")
     
+    @staticmethod
+    def _resize_image_sync(input_path: Path, output_path: Path, size: tuple) -> None:
+        """Blocking Pillow resize used by _resize_image"""
+        with Image.open(input_path) as img:
+            # Convert to RGB if necessary (for JPEG)
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Create white background for transparent images
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                img = background
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Resize maintaining aspect ratio with center crop
+            img_ratio = img.width / img.height
+            target_ratio = size[0] / size[1]
+            
+            if img_ratio > target_ratio:
+                # Image is wider, crop width
+                new_width = int(img.height * target_ratio)
+                left = (img.width - new_width) // 2
+                img = img.crop((left, 0, left + new_width, img.height))
+            elif img_ratio < target_ratio:
+                # Image is taller, crop height
+                new_height = int(img.width / target_ratio)
+                top = (img.height - new_height) // 2
+                img = img.crop((0, top, img.width, top + new_height))
+            
+            # Resize to target size
+            img = img.resize(size, Image.Resampling.LANCZOS)
+            
+            # Save with optimization
+            img.save(output_path, 'PNG', optimize=True)
+    
     async def _cleanup_old_avatar(self, old_file_id: str) -> None:
         """Clean up old avatar files"""
         await self._cleanup_avatar_files(old_file_id)
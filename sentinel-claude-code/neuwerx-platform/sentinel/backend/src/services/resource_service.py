@@ -1,11 +1,14 @@
 """
 ResourceService for Module 7: Hierarchical resource management
 """
+import base64
+import json
+from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID as UUID_T
-from sqlalchemy import select, and_, or_, func, text, delete, update
+from sqlalchemy import select, and_, or_, func, text, delete, update, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload, joinedload, aliased
 
 from src.models import Resource, ResourceType, Permission
 from src.schemas.resource import (
@@ -15,6 +18,40 @@ from src.schemas.resource import (
 )
 from src.core.exceptions import NotFoundError, ConflictError, ValidationError
 
+# Columns accepted by ResourceQuery.sort_by; Resource.id breaks ties
+_SORT_COLUMNS = {
+    "name": Resource.name,
+    "code": Resource.code,
+    "type": Resource.type,
+    "created_at": Resource.created_at,
+}
+
+
+def _encode_cursor(resource: Resource, sort_by: str) -> str:
+    """Encode the (sort key, id) of the last row on a page as an opaque cursor."""
+    value = getattr(resource, sort_by)
+    if isinstance(value, ResourceType):
+        value = value.value
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, value, str(resource.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, UUID_T]:
+    """Decode a cursor produced by _encode_cursor for the same sort field."""
+    try:
+        cursor_sort_by, value, resource_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort_by != sort_by:
+            raise ValueError("sort field changed")
+        if sort_by == "created_at":
+            value = datetime.fromisoformat(value)
+        elif sort_by == "type":
+            value = ResourceType(value)
+        return value, UUID_T(resource_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid cursor: {e}")
+
 
 class ResourceService:
     def __init__(self, db: AsyncSession):
@@ -97,22 +134,28 @@ class ResourceService:
 
     async def get_resource_detail(self, resource_id: UUID_T, tenant_id: UUID_T) -> ResourceDetailResponse:
         """Get detailed resource information."""
-        resource = await self.get_resource(resource_id, tenant_id)
-        
-        # Get additional details
-        resource_obj = await self.db.execute(
-            select(Resource).where(Resource.id == resource_id)
+        # Load the resource and count its children in one round-trip
+        child = aliased(Resource)
+        child_count = (
+            select(func.count(child.id))
+            .where(child.parent_id == Resource.id)
+            .scalar_subquery()
         )
-        resource_obj = resource_obj.scalar_one()
-
-        # Count children
-        child_count_result = await self.db.execute(
-            select(func.count(Resource.id)).where(Resource.parent_id == resource_id)
+        result = await self.db.execute(
+            select(Resource, child_count).where(
+                and_(
+                    Resource.id == resource_id,
+                    Resource.tenant_id == tenant_id
+                )
+            )
         )
-        child_count = child_count_result.scalar()
+        row = result.one_or_none()
+        if not row:
+            raise NotFoundError(f"Resource with ID {resource_id} not found")
+        resource_obj, child_count = row
 
         return ResourceDetailResponse(
-            **resource.model_dump(),
+            **ResourceResponse.model_validate(resource_obj).model_dump(),
             depth=resource_obj.get_depth(),
             hierarchy_level_name=resource_obj.hierarchy_level_name,
             ancestor_ids=resource_obj.get_ancestors(),
@@ -157,35 +200,41 @@ class ResourceService:
                 )
             )
 
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar()
+        order_col = _SORT_COLUMNS.get(query.sort_by, Resource.name)
+        sort_by = order_col.key
+        descending = query.sort_order == "desc"
 
-        # Apply sorting
-        if query.sort_by == "name":
-            order_col = Resource.name
-        elif query.sort_by == "code":
-            order_col = Resource.code
-        elif query.sort_by == "type":
-            order_col = Resource.type
-        elif query.sort_by == "created_at":
-            order_col = Resource.created_at
+        if query.cursor:
+            # Keyset page: seek past the previous page's last row, no COUNT or OFFSET
+            sort_value, last_id = _decode_cursor(query.cursor, sort_by)
+            sort_key = tuple_(order_col, Resource.id)
+            stmt = stmt.where(
+                sort_key < (sort_value, last_id) if descending else sort_key > (sort_value, last_id)
+            )
+            total = None
         else:
-            order_col = Resource.name
+            # Count total
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar()
 
-        if query.sort_order == "desc":
-            order_col = order_col.desc()
+            # Apply pagination
+            stmt = stmt.offset((query.page - 1) * query.limit)
 
-        stmt = stmt.order_by(order_col)
+        # Apply sorting
+        if descending:
+            stmt = stmt.order_by(order_col.desc(), Resource.id.desc())
+        else:
+            stmt = stmt.order_by(order_col, Resource.id)
 
-        # Apply pagination
-        offset = (query.page - 1) * query.limit
-        stmt = stmt.offset(offset).limit(query.limit)
+        # Fetch one extra row to learn whether another page follows
+        stmt = stmt.limit(query.limit + 1)
 
         # Execute query
         result = await self.db.execute(stmt)
         resources = result.scalars().all()
+        has_next = len(resources) > query.limit
+        resources = resources[:query.limit]
 
         # Build response
         items = [ResourceResponse.model_validate(resource) for resource in resources]
@@ -195,8 +244,9 @@ class ResourceService:
             total=total,
             page=query.page,
             limit=query.limit,
-            has_next=(query.page * query.limit) < total,
-            has_prev=query.page > 1
+            has_next=has_next,
+            has_prev=query.page > 1 or query.cursor is not None,
+            next_cursor=_encode_cursor(resources[-1], sort_by) if has_next else None
         )
 
     async def update_resource(
@@ -328,76 +378,84 @@ class ResourceService:
         root_id: Optional[UUID_T] = None,
         max_depth: Optional[int] = None
     ) -> ResourceTreeResponse:
-        """Get hierarchical resource tree."""
+        """Get hierarchical resource tree in a single recursive query."""
         
-        # Build query for tree nodes
+        # Anchor on the requested root, or on every top-level resource
         conditions = [Resource.is_active == True]
         if tenant_id is not None:
             conditions.append(Resource.tenant_id == tenant_id)
-            
-        stmt = select(Resource).where(and_(*conditions))
-
+        
+        anchor = select(Resource.id, literal(0).label("depth")).where(and_(*conditions))
         if root_id:
-            # Get subtree from specific root
-            root_conditions = [Resource.id == root_id]
-            if tenant_id is not None:
-                root_conditions.append(Resource.tenant_id == tenant_id)
-                
-            root_result = await self.db.execute(
-                select(Resource).where(and_(*root_conditions))
-            )
-            root_resource = root_result.scalar_one_or_none()
-            if not root_resource:
-                raise NotFoundError(f"Root resource with ID {root_id} not found")
-            
-            stmt = stmt.where(Resource.path.like(f"{root_resource.path}%"))
+            anchor = anchor.where(Resource.id == root_id)
         else:
-            # Get all resources for building tree
-            pass
-
-        stmt = stmt.order_by(Resource.path)
+            anchor = anchor.where(Resource.parent_id.is_(None))
+        tree_cte = anchor.cte("resource_tree", recursive=True)
+        
+        # Walk down one level per iteration, stopping at max_depth below the anchor
+        child = aliased(Resource)
+        child_conditions = [child.is_active == True]
+        if tenant_id is not None:
+            child_conditions.append(child.tenant_id == tenant_id)
+        if max_depth is not None:
+            child_conditions.append(tree_cte.c.depth < max_depth)
+        
+        tree_cte = tree_cte.union_all(
+            select(child.id, tree_cte.c.depth + 1)
+            .join(tree_cte, child.parent_id == tree_cte.c.id)
+            .where(and_(*child_conditions))
+        )
+        
+        stmt = select(Resource).join(tree_cte, Resource.id == tree_cte.c.id).order_by(Resource.path)
         result = await self.db.execute(stmt)
         resources = result.scalars().all()
-
+        
         # Build tree structure
         if root_id:
+            if not resources:
+                raise NotFoundError(f"Root resource with ID {root_id} not found")
             tree = self._build_tree_from_resources(resources, root_id)
-            total_nodes = len(resources)
         else:
-            # Build multiple trees for root resources
-            root_resources = [r for r in resources if r.parent_id is None]
-            tree = []
-            for root in root_resources:
-                subtree = self._build_tree_from_resources(resources, root.id)
-                tree.append(subtree)
-            total_nodes = len(resources)
+            root_ids = [r.id for r in resources if r.parent_id is None]
+            tree = self._build_trees_from_resources(resources, root_ids)
 
         # Calculate max depth
         max_depth_found = max([r.get_depth() for r in resources]) if resources else 0
 
         return ResourceTreeResponse(
-            tree=tree[0] if root_id and tree else tree,
-            total_nodes=total_nodes,
+            tree=tree,
+            total_nodes=len(resources),
             max_depth=max_depth_found
         )
 
     async def get_resource_permissions(self, resource_id: UUID_T, tenant_id: UUID_T) -> ResourcePermissionResponse:
         """Get permissions associated with a resource."""
         
-        # Verify resource exists
-        resource = await self.get_resource(resource_id, tenant_id)
-        
-        # Get associated permissions
-        permissions_result = await self.db.execute(
-            select(Permission).where(
+        # Fetch the resource with its active permissions outer-joined, so a
+        # resource without permissions still comes back as a single row
+        result = await self.db.execute(
+            select(Resource, Permission)
+            .outerjoin(
+                Permission,
                 and_(
-                    Permission.resource_id == resource_id,
+                    Permission.resource_id == Resource.id,
                     Permission.tenant_id == tenant_id,
                     Permission.is_active == True
                 )
             )
+            .where(
+                and_(
+                    Resource.id == resource_id,
+                    Resource.tenant_id == tenant_id
+                )
+            )
         )
-        permissions = permissions_result.scalars().all()
+        rows = result.all()
+        if not rows:
+            raise NotFoundError(f"Resource with ID {resource_id} not found")
+        
+        resource = ResourceResponse.model_validate(rows[0][0])
+        permissions = [perm for _, perm in rows if perm is not None]
         
         permissions_data = []
         for perm in permissions:
@@ -420,76 +478,27 @@ class ResourceService:
     async def get_resource_statistics(self, tenant_id: Optional[UUID_T]) -> ResourceStatistics:
         """Get resource statistics for a tenant."""
         
-        # Total resources
-        conditions = []
+        # One pass per type; the overall figures are rolled up from these rows
+        stmt = select(
+            Resource.type,
+            func.count(Resource.id).label("total"),
+            func.count(Resource.id).filter(Resource.is_active == True).label("active"),
+            func.count(Resource.id).filter(Resource.parent_id.is_(None)).label("roots"),
+            func.max(func.array_length(func.string_to_array(Resource.path, '/'), 1)).label("path_length")
+        ).group_by(Resource.type)
         if tenant_id is not None:
-            conditions.append(Resource.tenant_id == tenant_id)
+            stmt = stmt.where(Resource.tenant_id == tenant_id)
         
-        if conditions:
-            total_result = await self.db.execute(
-                select(func.count(Resource.id)).where(and_(*conditions))
-            )
-        else:
-            total_result = await self.db.execute(
-                select(func.count(Resource.id))
-            )
-        total = total_result.scalar()
-
-        # Active/inactive counts
-        active_conditions = [Resource.is_active == True]
-        if tenant_id is not None:
-            active_conditions.append(Resource.tenant_id == tenant_id)
-        
-        active_result = await self.db.execute(
-            select(func.count(Resource.id)).where(and_(*active_conditions))
-        )
-        active = active_result.scalar()
-
-        # By type
-        by_type_conditions = []
-        if tenant_id is not None:
-            by_type_conditions.append(Resource.tenant_id == tenant_id)
-        
-        if by_type_conditions:
-            by_type_result = await self.db.execute(
-                select(Resource.type, func.count(Resource.id))
-                .where(and_(*by_type_conditions))
-                .group_by(Resource.type)
-            )
-        else:
-            by_type_result = await self.db.execute(
-                select(Resource.type, func.count(Resource.id))
-                .group_by(Resource.type)
-            )
-        by_type = {str(row[0]): row[1] for row in by_type_result.fetchall()}
+        result = await self.db.execute(stmt)
+        rows = result.all()
 
-        # Max depth
-        depth_conditions = []
-        if tenant_id is not None:
-            depth_conditions.append(Resource.tenant_id == tenant_id)
-        
-        if depth_conditions:
-            max_depth_result = await self.db.execute(
-                select(func.max(func.array_length(func.string_to_array(Resource.path, '/'), 1)))
-                .where(and_(*depth_conditions))
-            )
-        else:
-            max_depth_result = await self.db.execute(
-                select(func.max(func.array_length(func.string_to_array(Resource.path, '/'), 1)))
-            )
-        max_depth = max_depth_result.scalar() or 0
+        by_type = {str(row.type): row.total for row in rows}
+        total = sum(row.total for row in rows)
+        active = sum(row.active for row in rows)
+        root_count = sum(row.roots for row in rows)
+        max_depth = max((row.path_length or 0 for row in rows), default=0)
         max_depth = max(0, max_depth - 2)  # Adjust for leading/trailing slashes
 
-        # Root resources
-        root_conditions = [Resource.parent_id.is_(None)]
-        if tenant_id is not None:
-            root_conditions.append(Resource.tenant_id == tenant_id)
-        
-        root_result = await self.db.execute(
-            select(func.count(Resource.id)).where(and_(*root_conditions))
-        )
-        root_count = root_result.scalar()
-
         return ResourceStatistics(
             total_resources=total,
             by_type=by_type,
@@ -566,6 +575,12 @@ class ResourceService:
 
     def _build_tree_from_resources(self, resources: List[Resource], root_id: UUID_T) -> ResourceTreeNode:
         """Build hierarchical tree structure from flat resource list."""
+        return self._build_trees_from_resources(resources, [root_id])[0]
+
+    def _build_trees_from_resources(
+        self, resources: List[Resource], root_ids: List[UUID_T]
+    ) -> List[Optional[ResourceTreeNode]]:
+        """Build one tree per root, indexing the flat resource list only once."""
         resources_by_id = {r.id: r for r in resources}
         children_by_parent = {}
         
@@ -598,4 +613,4 @@ class ResourceService:
                 children=children
             )
         
-        return build_node(root_id)
\ No newline at end of file
+        return [build_node(root_id) for root_id in root_ids]
@@ -425,6 +425,48 @@ class ServiceAccountService:
         
         return None
     
+    async def validate_by_id(
+        self,
+        account_id: UUID,
+        client_secret: str,
+        tenant_id: Optional[UUID] = None
+    ) -> Tuple[bool, str, bool]:
+        """
+        Validate a service account's secret in a single query
+        
+        Args:
+            account_id: Service account ID
+            client_secret: Client secret to validate
+            tenant_id: Tenant ID (from context if not provided)
+            
+        Returns:
+            Tuple[bool, str, bool]: (is_valid, client_id, is_active)
+        """
+        if not tenant_id:
+            tenant_id = get_current_tenant_id()
+        
+        result = await self.db.execute(
+            select(
+                User.id, User.username, User.email, User.is_active, User.service_account_key
+            ).where(
+                and_(
+                    User.id == account_id,
+                    User.tenant_id == tenant_id,
+                    User.is_service_account == True
+                )
+            )
+        )
+        account = result.one_or_none()
+        if not account:
+            raise NotFoundError(f"Service account {account_id} not found")
+        
+        is_valid = (
+            account.is_active
+            and account.service_account_key is not None
+            and secrets.compare_digest(account.service_account_key, client_secret)
+        )
+        return is_valid, self._generate_client_id_from_account(account), account.is_active
+    
     # Private helper methods
     
     async def _get_active_tenant(self, tenant_id: UUID) -> Tenant:
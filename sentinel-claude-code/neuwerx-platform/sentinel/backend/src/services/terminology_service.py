@@ -1,11 +1,53 @@
-from typing import Dict, Any, Optional, List
+import json
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from datetime import datetime
 
 from src.models.tenant import Tenant
-from src.utils.exceptions import NotFoundHTTPError
+from src.core.exceptions import NotFoundError, ValidationError
+
+TERMINOLOGY_CACHE_TTL = 60  # seconds
+TERMINOLOGY_CACHE_MAX_ENTRIES = 10_000
+
+# Effective terminology by tenant ID as (expires_at, data); module-level so it
+# outlives the per-request service instances
+_terminology_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+# Industry terminology templates (placeholder until templates are configurable)
+INDUSTRY_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "maritime": {
+        "tenant": "Maritime Authority",
+        "sub_tenant": "Port Organization",
+        "user": "Maritime Stakeholder",
+        "role": "Stakeholder Type",
+        "permission": "Service Clearance"
+    },
+    "healthcare": {
+        "tenant": "Health System", 
+        "sub_tenant": "Hospital",
+        "user": "Healthcare Professional",
+        "role": "Clinical Role",
+        "permission": "Clinical Access"
+    },
+    "finance": {
+        "tenant": "Financial Institution",
+        "sub_tenant": "Branch",
+        "user": "Employee",
+        "role": "Position",
+        "permission": "Transaction Authority"
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def _default_terminology() -> Dict[str, str]:
+    """Default Sentinel terminology, built once per process"""
+    return Tenant()._get_default_terminology()
 
 
 class TerminologyService:
@@ -13,8 +55,8 @@ class TerminologyService:
     
     def __init__(self, db: AsyncSession):
         self.db = db
-        # In-memory cache for performance optimization
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Shared in-memory cache for performance optimization
+        self._cache = _terminology_cache
     
     async def get_tenant(self, tenant_id: UUID) -> Tenant:
         """Get tenant by ID with error handling"""
@@ -24,7 +66,7 @@ class TerminologyService:
         tenant = result.scalar_one_or_none()
         
         if not tenant:
-            raise NotFoundHTTPError(f"Tenant not found: {tenant_id}")
+            raise NotFoundError(f"Tenant not found: {tenant_id}")
         
         return tenant
     
@@ -33,8 +75,9 @@ class TerminologyService:
         cache_key = str(tenant_id)
         
         # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
         
         # Fetch from database
         tenant = await self.get_tenant(tenant_id)
@@ -47,8 +90,10 @@ class TerminologyService:
             "tenant_code": tenant.code
         })
         
-        # Cache the result
-        self._cache[cache_key] = terminology_data
+        # Cache the result, evicting the oldest entry when full
+        if cache_key not in self._cache and len(self._cache) >= TERMINOLOGY_CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)), None)
+        self._cache[cache_key] = (time.monotonic() + TERMINOLOGY_CACHE_TTL, terminology_data)
         
         return terminology_data
     
@@ -72,15 +117,22 @@ class TerminologyService:
         tenant.set_terminology_config(terminology, metadata)
         
         # Apply to children if requested
+        affected_tenant_ids = None
         if apply_to_children:
-            tenant.apply_terminology_to_children(terminology, recursive=True)
+            affected_tenant_ids = await self._set_descendant_terminology(tenant_id, terminology, recursive=True)
         
         # Save changes
         await self.db.commit()
         await self.db.refresh(tenant)
         
-        # Invalidate cache for this tenant and children
-        await self._invalidate_cache_hierarchy(tenant_id)
+        # Invalidate cache for this tenant and children; the UPDATE already
+        # returned every descendant, so only look them up when it did not run
+        if affected_tenant_ids is None:
+            await self._invalidate_cache_hierarchy(tenant_id)
+        else:
+            self._invalidate_cache(tenant_id)
+            for child_id in affected_tenant_ids:
+                self._invalidate_cache(child_id)
         
         return await self.get_terminology(tenant_id)
     
@@ -95,8 +147,8 @@ class TerminologyService:
         await self.db.commit()
         await self.db.refresh(tenant)
         
-        # Invalidate cache
-        self._invalidate_cache(tenant_id)
+        # Invalidate cache for this tenant and the children inheriting from it
+        await self._invalidate_cache_hierarchy(tenant_id)
         
         return await self.get_terminology(tenant_id)
     
@@ -113,20 +165,8 @@ class TerminologyService:
         if terminology is None:
             terminology = tenant.get_effective_terminology()
         
-        # Get all child tenant IDs using async queries
-        affected_tenant_ids = []
-        await self._collect_child_tenant_ids_async(tenant_id, affected_tenant_ids)
-        
-        # Apply terminology to each child tenant
-        for child_id in affected_tenant_ids:
-            child_tenant = await self.get_tenant(child_id)
-            child_tenant.set_terminology_config(
-                terminology,
-                metadata={
-                    "applied_from_parent": tenant_id,
-                    "applied_at": datetime.utcnow().isoformat()
-                }
-            )
+        # Apply terminology to every descendant in a single statement
+        affected_tenant_ids = await self._set_descendant_terminology(tenant_id, terminology, recursive)
         
         # Save changes
         await self.db.commit()
@@ -137,6 +177,52 @@ class TerminologyService:
         
         return affected_tenant_ids
     
+    async def _set_descendant_terminology(
+        self,
+        tenant_id: UUID,
+        terminology: Dict[str, str],
+        recursive: bool = True
+    ) -> List[UUID]:
+        """Write terminology to a tenant's children (or all descendants) in one UPDATE"""
+        applied_at = datetime.utcnow().isoformat()
+        metadata = {
+            "last_updated": applied_at,
+            "is_inherited": False,
+            "applied_from_parent": str(tenant_id),
+            "applied_at": applied_at
+        }
+        
+        # Same settings keys as Tenant.set_terminology_config, merged server-side
+        result = await self.db.execute(
+            text("""
+                WITH RECURSIVE descendants AS (
+                    SELECT id FROM sentinel.tenants WHERE parent_tenant_id = :tenant_id
+                    UNION ALL
+                    SELECT t.id FROM sentinel.tenants t
+                    JOIN descendants d ON t.parent_tenant_id = d.id
+                    WHERE :recursive
+                )
+                UPDATE sentinel.tenants
+                SET settings = CAST(
+                        COALESCE(CAST(settings AS jsonb), CAST('{}' AS jsonb))
+                        || jsonb_build_object(
+                            'terminology_config', CAST(:terminology AS jsonb),
+                            'terminology_metadata', CAST(:metadata AS jsonb)
+                        )
+                    AS json),
+                    updated_at = now()
+                WHERE id IN (SELECT id FROM descendants)
+                RETURNING id
+            """),
+            {
+                "tenant_id": tenant_id,
+                "recursive": recursive,
+                "terminology": json.dumps(terminology),
+                "metadata": json.dumps(metadata)
+            }
+        )
+        return [row[0] for row in result.fetchall()]
+    
     async def get_terminology_simple(self, tenant_id: UUID) -> Dict[str, str]:
         """Get just the effective terminology dictionary (no metadata)"""
         tenant = await self.get_tenant(tenant_id)
@@ -144,9 +230,8 @@ class TerminologyService:
     
     def get_default_terminology(self) -> Dict[str, str]:
         """Get default Sentinel terminology"""
-        # Create a temporary tenant instance to access default terminology
-        temp_tenant = Tenant()
-        return temp_tenant._get_default_terminology()
+        # Copy so callers cannot mutate the shared default
+        return dict(_default_terminology())
     
     async def validate_terminology(self, terminology: Dict[str, str]) -> Dict[str, Any]:
         """Validate terminology configuration"""
@@ -195,34 +280,24 @@ class TerminologyService:
             del self._cache[cache_key]
     
     async def _invalidate_cache_hierarchy(self, tenant_id: UUID) -> None:
-        """Invalidate cache for tenant and all its children"""
-        # Invalidate current tenant
+        """Invalidate cache for tenant and all its descendants"""
         self._invalidate_cache(tenant_id)
         
-        # Query for all child tenants to avoid lazy loading issues
-        from sqlalchemy import select
+        # Every descendant inherits from this tenant; fetch them in one query
         result = await self.db.execute(
-            select(Tenant.id).where(Tenant.parent_tenant_id == tenant_id)
-        )
-        child_ids = [row[0] for row in result.fetchall()]
-        
-        # Recursively invalidate children
-        for child_id in child_ids:
-            self._invalidate_cache(child_id)
-            # Recursively invalidate grandchildren
-            await self._invalidate_cache_hierarchy(child_id)
-    
-    async def _collect_child_tenant_ids_async(self, tenant_id: UUID, result: List[UUID]) -> None:
-        """Recursively collect all child tenant IDs using async queries"""
-        from sqlalchemy import select
-        query_result = await self.db.execute(
-            select(Tenant.id).where(Tenant.parent_tenant_id == tenant_id)
+            text("""
+                WITH RECURSIVE descendants AS (
+                    SELECT id FROM sentinel.tenants WHERE parent_tenant_id = :tenant_id
+                    UNION ALL
+                    SELECT t.id FROM sentinel.tenants t
+                    JOIN descendants d ON t.parent_tenant_id = d.id
+                )
+                SELECT id FROM descendants
+            """),
+            {"tenant_id": tenant_id}
         )
-        child_ids = [row[0] for row in query_result.fetchall()]
-        
-        for child_id in child_ids:
-            result.append(child_id)
-            await self._collect_child_tenant_ids_async(child_id, result)
+        for row in result.fetchall():
+            self._invalidate_cache(row[0])
     
     def clear_cache(self) -> None:
         """Clear entire terminology cache"""
@@ -234,7 +309,7 @@ class TerminologyService:
             "cached_tenants": len(self._cache),
             "cache_keys": list(self._cache.keys()),
             "memory_usage_estimate": sum(
-                len(str(data)) for data in self._cache.values()
+                len(str(data)) for _, data in self._cache.values()
             )
         }
     
@@ -245,29 +320,7 @@ class TerminologyService:
     def get_industry_templates(self) -> Dict[str, Dict[str, str]]:
         """Get available industry terminology templates (placeholder)"""
         # This will be implemented in a future phase
-        return {
-            "maritime": {
-                "tenant": "Maritime Authority",
-                "sub_tenant": "Port Organization",
-                "user": "Maritime Stakeholder",
-                "role": "Stakeholder Type",
-                "permission": "Service Clearance"
-            },
-            "healthcare": {
-                "tenant": "Health System", 
-                "sub_tenant": "Hospital",
-                "user": "Healthcare Professional",
-                "role": "Clinical Role",
-                "permission": "Clinical Access"
-            },
-            "finance": {
-                "tenant": "Financial Institution",
-                "sub_tenant": "Branch",
-                "user": "Employee",
-                "role": "Position",
-                "permission": "Transaction Authority"
-            }
-        }
+        return INDUSTRY_TEMPLATES
     
     async def apply_template(
         self, 
@@ -279,7 +332,7 @@ class TerminologyService:
         templates = self.get_industry_templates()
         
         if template_name not in templates:
-            raise ValueError(f"Unknown template: {template_name}")
+            raise ValidationError(f"Unknown template: {template_name}")
         
         # Start with template
         terminology = templates[template_name].copy()
@@ -0,0 +1,56 @@
+"""
+HTTP cache validation helpers (ETag / If-None-Match) for read-only endpoints
+"""
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+def payload_etag(payload: Any) -> str:
+    """Strong ETag derived from the JSON encoding of a response payload"""
+    body = orjson.dumps(jsonable_encoder(payload), option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 7232)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def etag_response(
+    payload: Any,
+    request: Request,
+    response: Response,
+    ttl: int = 60,
+    etag: Optional[str] = None
+) -> Optional[Response]:
+    """
+    Tag a response for private client caching
+
+    Args:
+        payload: Response payload the ETag is derived from
+        request: Incoming request, checked for If-None-Match
+        response: Endpoint response the headers are set on
+        ttl: Cache-Control max-age in seconds
+        etag: Precomputed ETag for payloads that never change
+
+    Returns:
+        A 304 response when the client's copy is current, otherwise None
+    """
+    etag = etag or payload_etag(payload)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={ttl}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
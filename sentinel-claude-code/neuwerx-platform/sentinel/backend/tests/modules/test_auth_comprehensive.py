@@ -22,35 +22,48 @@ class AuthenticationTester:
         }
         self.access_token = None
         self.refresh_token = None
+        self.client = None
+    
+    async def __aenter__(self):
+        """Open one pooled client shared by every test"""
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=20),
+            transport=httpx.AsyncHTTPTransport(retries=1)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
     
     async def test_user_login(self) -> bool:
         """Test user login functionality"""
         print("\n1. Testing user login...")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.auth_url}/login",
-                    json=self.test_credentials
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ Login failed: {response.status_code}")
-                    print(f"   Response: {response.text}")
-                    return False
-                
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                self.refresh_token = token_data.get("refresh_token")
-                
-                print(f"✅ Login successful")
-                print(f"   Token type: {token_data['token_type']}")
-                print(f"   Scopes: {token_data.get('scope', 'N/A')}")
-                print(f"   Expires in: {token_data.get('expires_in', 'N/A')} seconds")
-                print(f"   Refresh token: {'Present' if self.refresh_token else 'Not provided'}")
-                
-                return True
-                
+            response = await self.client.post(
+                f"{self.auth_url}/login",
+                json=self.test_credentials
+            )
+            
+            if response.status_code != 200:
+                print(f"❌ Login failed: {response.status_code}")
+                print(f"   Response: {response.text}")
+                return False
+            
+            token_data = response.json()
+            self.access_token = token_data["access_token"]
+            self.refresh_token = token_data.get("refresh_token")
+            
+            print(f"✅ Login successful")
+            print(f"   Token type: {token_data['token_type']}")
+            print(f"   Scopes: {token_data.get('scope', 'N/A')}")
+            print(f"   Expires in: {token_data.get('expires_in', 'N/A')} seconds")
+            print(f"   Refresh token: {'Present' if self.refresh_token else 'Not provided'}")
+            
+            return True
+            
         except Exception as e:
             print(f"❌ Login test error: {e}")
             return False
@@ -64,24 +77,23 @@ class AuthenticationTester:
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.auth_url}/validate",
-                    headers={"Authorization": f"Bearer {self.access_token}"}
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ Token validation failed: {response.status_code}")
-                    return False
-                
-                validation_data = response.json()
-                print(f"✅ Token validation successful")
-                print(f"   Valid: {validation_data.get('valid', 'N/A')}")
-                print(f"   User ID: {validation_data.get('user_id', 'N/A')}")
-                print(f"   Tenant: {validation_data.get('tenant_code', 'N/A')}")
-                
-                return True
-                
+            response = await self.client.get(
+                f"{self.auth_url}/validate",
+                headers={"Authorization": f"Bearer {self.access_token}"}
+            )
+            
+            if response.status_code != 200:
+                print(f"❌ Token validation failed: {response.status_code}")
+                return False
+            
+            validation_data = response.json()
+            print(f"✅ Token validation successful")
+            print(f"   Valid: {validation_data.get('valid', 'N/A')}")
+            print(f"   User ID: {validation_data.get('user_id', 'N/A')}")
+            print(f"   Tenant: {validation_data.get('tenant_code', 'N/A')}")
+            
+            return True
+            
         except Exception as e:
             print(f"❌ Token validation error: {e}")
             return False
@@ -95,23 +107,22 @@ class AuthenticationTester:
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Test accessing tenant list (protected endpoint)
-                response = await client.get(
-                    f"{self.base_url}/tenants/",
-                    headers={"Authorization": f"Bearer {self.access_token}"}
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ Protected endpoint access failed: {response.status_code}")
-                    return False
-                
-                tenants_data = response.json()
-                print(f"✅ Protected endpoint access successful")
-                print(f"   Accessed tenant list with {tenants_data.get('total', 0)} tenants")
-                
-                return True
-                
+            # Test accessing tenant list (protected endpoint)
+            response = await self.client.get(
+                f"{self.base_url}/tenants/",
+                headers={"Authorization": f"Bearer {self.access_token}"}
+            )
+            
+            if response.status_code != 200:
+                print(f"❌ Protected endpoint access failed: {response.status_code}")
+                return False
+            
+            tenants_data = response.json()
+            print(f"✅ Protected endpoint access successful")
+            print(f"   Accessed tenant list with {tenants_data.get('total', 0)} tenants")
+            
+            return True
+            
         except Exception as e:
             print(f"❌ Protected endpoint test error: {e}")
             return False
@@ -121,27 +132,26 @@ class AuthenticationTester:
         print("\n4. Testing unauthorized access rejection...")
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Test without token
-                response = await client.get(f"{self.base_url}/tenants/")
-                
-                if response.status_code != 401:
-                    print(f"❌ Expected 401, got {response.status_code}")
-                    return False
-                
-                # Test with invalid token
-                response = await client.get(
-                    f"{self.base_url}/tenants/",
-                    headers={"Authorization": "Bearer invalid_token_123"}
-                )
-                
-                if response.status_code != 401:
-                    print(f"❌ Expected 401 for invalid token, got {response.status_code}")
-                    return False
-                
-                print("✅ Unauthorized access properly rejected")
-                return True
-                
+            # Test without token
+            response = await self.client.get(f"{self.base_url}/tenants/")
+            
+            if response.status_code != 401:
+                print(f"❌ Expected 401, got {response.status_code}")
+                return False
+            
+            # Test with invalid token
+            response = await self.client.get(
+                f"{self.base_url}/tenants/",
+                headers={"Authorization": "Bearer invalid_token_123"}
+            )
+            
+            if response.status_code != 401:
+                print(f"❌ Expected 401 for invalid token, got {response.status_code}")
+                return False
+            
+            print("✅ Unauthorized access properly rejected")
+            return True
+            
         except Exception as e:
             print(f"❌ Unauthorized access test error: {e}")
             return False
@@ -155,38 +165,37 @@ class AuthenticationTester:
             return True
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.auth_url}/refresh",
-                    json={"refresh_token": self.refresh_token}
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ Token refresh failed: {response.status_code}")
-                    print(f"   Response: {response.text}")
-                    return False
-                
-                new_token_data = response.json()
-                new_access_token = new_token_data["access_token"]
-                
-                print("✅ Token refresh successful")
-                print(f"   New access token received")
-                print(f"   Token type: {new_token_data['token_type']}")
-                
-                # Test the new token works
-                validate_response = await client.get(
-                    f"{self.auth_url}/validate",
-                    headers={"Authorization": f"Bearer {new_access_token}"}
-                )
-                
-                if validate_response.status_code == 200:
-                    print("✅ New token validated successfully")
-                    self.access_token = new_access_token
-                    return True
-                else:
-                    print("❌ New token validation failed")
-                    return False
-                
+            response = await self.client.post(
+                f"{self.auth_url}/refresh",
+                json={"refresh_token": self.refresh_token}
+            )
+            
+            if response.status_code != 200:
+                print(f"❌ Token refresh failed: {response.status_code}")
+                print(f"   Response: {response.text}")
+                return False
+            
+            new_token_data = response.json()
+            new_access_token = new_token_data["access_token"]
+            
+            print("✅ Token refresh successful")
+            print(f"   New access token received")
+            print(f"   Token type: {new_token_data['token_type']}")
+            
+            # Test the new token works
+            validate_response = await self.client.get(
+                f"{self.auth_url}/validate",
+                headers={"Authorization": f"Bearer {new_access_token}"}
+            )
+            
+            if validate_response.status_code == 200:
+                print("✅ New token validated successfully")
+                self.access_token = new_access_token
+                return True
+            else:
+                print("❌ New token validation failed")
+                return False
+            
         except Exception as e:
             print(f"❌ Token refresh test error: {e}")
             return False
@@ -200,32 +209,31 @@ class AuthenticationTester:
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.auth_url}/logout",
-                    headers={"Authorization": f"Bearer {self.access_token}"},
-                    json={"revoke_all_devices": True}
-                )
-                
-                if response.status_code not in [200, 204]:
-                    print(f"❌ Logout failed: {response.status_code}")
-                    return False
-                
-                print("✅ Logout successful")
-                
-                # Test that token is now invalid
-                validate_response = await client.get(
-                    f"{self.auth_url}/validate",
-                    headers={"Authorization": f"Bearer {self.access_token}"}
-                )
-                
-                if validate_response.status_code == 401:
-                    print("✅ Token properly invalidated after logout")
-                    return True
-                else:
-                    print(f"⚠️ Token still valid after logout: {validate_response.status_code}")
-                    return True  # Logout worked, token invalidation might not be immediate
-                
+            response = await self.client.post(
+                f"{self.auth_url}/logout",
+                headers={"Authorization": f"Bearer {self.access_token}"},
+                json={"revoke_all_devices": True}
+            )
+            
+            if response.status_code not in [200, 204]:
+                print(f"❌ Logout failed: {response.status_code}")
+                return False
+            
+            print("✅ Logout successful")
+            
+            # Test that token is now invalid
+            validate_response = await self.client.get(
+                f"{self.auth_url}/validate",
+                headers={"Authorization": f"Bearer {self.access_token}"}
+            )
+            
+            if validate_response.status_code == 401:
+                print("✅ Token properly invalidated after logout")
+                return True
+            else:
+                print(f"⚠️ Token still valid after logout: {validate_response.status_code}")
+                return True  # Logout worked, token invalidation might not be immediate
+            
         except Exception as e:
             print(f"❌ Logout test error: {e}")
             return False
@@ -235,52 +243,51 @@ class AuthenticationTester:
         print("\n7. Testing invalid credentials...")
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Test wrong password
-                response = await client.post(
-                    f"{self.auth_url}/login",
-                    json={
-                        "email": "test@example.com",
-                        "password": "wrong_password",
-                        "tenant_code": "TEST"
-                    }
-                )
-                
-                if response.status_code not in [401, 403]:
-                    print(f"❌ Expected 401/403 for wrong password, got {response.status_code}")
-                    return False
-                
-                # Test non-existent user
-                response = await client.post(
-                    f"{self.auth_url}/login",
-                    json={
-                        "email": "nonexistent@example.com",
-                        "password": "password123",
-                        "tenant_code": "TEST"
-                    }
-                )
-                
-                if response.status_code not in [401, 404]:
-                    print(f"❌ Expected 401/404 for non-existent user, got {response.status_code}")
-                    return False
-                
-                # Test invalid tenant
-                response = await client.post(
-                    f"{self.auth_url}/login",
-                    json={
-                        "email": "test@example.com",
-                        "password": "password123",
-                        "tenant_code": "INVALID"
-                    }
-                )
-                
-                if response.status_code not in [401, 404]:
-                    print(f"❌ Expected 401/404 for invalid tenant, got {response.status_code}")
-                    return False
-                
-                print("✅ Invalid credentials properly rejected")
-                return True
-                
+            # Test wrong password
+            response = await self.client.post(
+                f"{self.auth_url}/login",
+                json={
+                    "email": "test@example.com",
+                    "password": "wrong_password",
+                    "tenant_code": "TEST"
+                }
+            )
+            
+            if response.status_code not in [401, 403]:
+                print(f"❌ Expected 401/403 for wrong password, got {response.status_code}")
+                return False
+            
+            # Test non-existent user
+            response = await self.client.post(
+                f"{self.auth_url}/login",
+                json={
+                    "email": "nonexistent@example.com",
+                    "password": "password123",
+                    "tenant_code": "TEST"
+                }
+            )
+            
+            if response.status_code not in [401, 404]:
+                print(f"❌ Expected 401/404 for non-existent user, got {response.status_code}")
+                return False
+            
+            # Test invalid tenant
+            response = await self.client.post(
+                f"{self.auth_url}/login",
+                json={
+                    "email": "test@example.com",
+                    "password": "password123",
+                    "tenant_code": "INVALID"
+                }
+            )
+            
+            if response.status_code not in [401, 404]:
+                print(f"❌ Expected 401/404 for invalid tenant, got {response.status_code}")
+                return False
+            
+            print("✅ Invalid credentials properly rejected")
+            return True
+            
         except Exception as e:
             print(f"❌ Invalid credentials test error: {e}")
             return False
@@ -332,8 +339,8 @@ class AuthenticationTester:
 
 async def main():
     """Main test execution"""
-    tester = AuthenticationTester()
-    success = await tester.run_all_tests()
+    async with AuthenticationTester() as tester:
+        success = await tester.run_all_tests()
     return 0 if success else 1
 
 
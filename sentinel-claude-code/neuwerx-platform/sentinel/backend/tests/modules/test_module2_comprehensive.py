@@ -233,11 +233,26 @@ class TenantManagementTestSuite:
                 f"Status: {detail_response.status_code}"
             )
         
-        # Test 2.3: Tenant filtering by type
-        filtered_response = await self.client.get(
-            f"{self.base_url}/tenants/",
-            headers=self.get_headers(),
-            params={"type": "root"}
+        # Tests 2.3-2.5 are independent list queries, so issue them concurrently
+        filtered_response, search_response, paginated_response = await asyncio.gather(
+            # Test 2.3: Tenant filtering by type
+            self.client.get(
+                f"{self.base_url}/tenants/",
+                headers=self.get_headers(),
+                params={"type": "root"}
+            ),
+            # Test 2.4: Tenant search functionality
+            self.client.get(
+                f"{self.base_url}/tenants/",
+                headers=self.get_headers(),
+                params={"search": "test"}
+            ),
+            # Test 2.5: Pagination
+            self.client.get(
+                f"{self.base_url}/tenants/",
+                headers=self.get_headers(),
+                params={"skip": 0, "limit": 2}
+            )
         )
         
         self.record_test_result(
@@ -246,26 +261,12 @@ class TenantManagementTestSuite:
             f"Status: {filtered_response.status_code}"
         )
         
-        # Test 2.4: Tenant search functionality
-        search_response = await self.client.get(
-            f"{self.base_url}/tenants/",
-            headers=self.get_headers(),
-            params={"search": "test"}
-        )
-        
         self.record_test_result(
             "Tenant Search Functionality",
             search_response.status_code == 200,
             f"Status: {search_response.status_code}"
         )
         
-        # Test 2.5: Pagination
-        paginated_response = await self.client.get(
-            f"{self.base_url}/tenants/",
-            headers=self.get_headers(),
-            params={"skip": 0, "limit": 2}
-        )
-        
         self.record_test_result(
             "Tenant Pagination",
             paginated_response.status_code == 200,
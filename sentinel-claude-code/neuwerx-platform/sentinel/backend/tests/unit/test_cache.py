@@ -0,0 +1,84 @@
+"""
+Unit tests for the in-memory cache manager
+"""
+import time
+
+import pytest
+import pytest_asyncio
+
+from src.core.cache import InMemoryCacheManager
+
+
+class TestInMemoryCacheManager:
+    """Test cases for InMemoryCacheManager expiry"""
+
+    @pytest_asyncio.fixture
+    async def cache(self):
+        """Cache manager whose background cleanup is stopped after each test"""
+        manager = InMemoryCacheManager()
+        yield manager
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_only_due_entries(self, cache):
+        """Test a sweep evicts expired entries and leaves live ones"""
+        now = time.time()
+        await cache.set("short", "1", ttl=10)
+        await cache.set("long", "2", ttl=100)
+
+        evicted = cache._evict_expired(now + 50)
+
+        assert evicted == 1
+        assert await cache.get("short") is None
+        assert await cache.get("long") == "2"
+        assert [key for _, key in cache._expirations] == ["long"]
+
+    @pytest.mark.asyncio
+    async def test_overwrite_then_expire(self, cache):
+        """Test the stale expiry of an overwritten key does not evict the new value"""
+        now = time.time()
+        await cache.set("key", "old", ttl=10)
+        await cache.set("key", "new", ttl=100)
+
+        evicted = cache._evict_expired(now + 50)
+
+        assert evicted == 0
+        assert await cache.get("key") == "new"
+
+        assert cache._evict_expired(now + 150) == 1
+        assert cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_then_expire(self, cache):
+        """Test the expiry of a deleted key is discarded without touching other keys"""
+        now = time.time()
+        await cache.set("deleted", "1", ttl=10)
+        await cache.set("kept", "2", ttl=100)
+        await cache.delete("deleted")
+
+        evicted = cache._evict_expired(now + 50)
+
+        assert evicted == 0
+        assert await cache.get("kept") == "2"
+        assert all(key != "deleted" for _, key in cache._expirations)
+
+    @pytest.mark.asyncio
+    async def test_heap_compacted_for_hot_key(self, cache):
+        """Test rewriting one key does not grow the expiry heap without bound"""
+        for i in range(1000):
+            await cache.set("hot", str(i), ttl=300)
+
+        assert cache.size() == 1
+        assert len(cache._expirations) <= 2
+        assert await cache.get("hot") == "999"
+
+    @pytest.mark.asyncio
+    async def test_heap_compacted_after_deletes(self, cache):
+        """Test deleting keys shrinks the expiry heap with the cache"""
+        for i in range(100):
+            await cache.set(f"key{i}", "v", ttl=300)
+        for i in range(90):
+            await cache.delete(f"key{i}")
+
+        assert cache.size() == 10
+        assert len(cache._expirations) <= 2 * cache.size()
@@ -0,0 +1,192 @@
+"""
+Unit tests for ETag / If-None-Match handling on read-only endpoints
+"""
+import os
+import uuid
+from typing import Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import Request, Response
+
+from src.utils.http_cache import etag_matches, etag_response, payload_etag
+from src.api.v1.avatars import get_avatar_urls, serve_avatar
+from src.api.v1.resources import get_resource_tree
+from src.api.v1.terminology import _terminology_templates, get_terminology_templates
+from src.schemas.resource import ResourceTreeResponse
+
+
+def make_request(if_none_match: Optional[str] = None) -> Request:
+    """Minimal GET request carrying an optional If-None-Match header"""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers})
+
+
+class TestEtagResponse:
+    """Test cases for etag_response"""
+
+    payload = {"tenant": "Tenant", "user": "User"}
+
+    def test_sets_headers_on_200(self):
+        """Test a fresh request gets ETag and Cache-Control and no short-circuit"""
+        response = Response()
+
+        result = etag_response(self.payload, make_request(), response)
+
+        assert result is None
+        assert response.headers["etag"] == payload_etag(self.payload)
+        assert response.headers["cache-control"] == "private, max-age=60"
+
+    def test_custom_ttl(self):
+        """Test the max-age follows the ttl argument"""
+        response = Response()
+
+        etag_response(self.payload, make_request(), response, ttl=300)
+
+        assert response.headers["cache-control"] == "private, max-age=300"
+
+    def test_matching_etag_returns_bodyless_304(self):
+        """Test a matching If-None-Match returns an empty 304 with the validators"""
+        etag = payload_etag(self.payload)
+
+        result = etag_response(self.payload, make_request(etag), Response())
+
+        assert result.status_code == 304
+        assert result.body == b""
+        assert result.headers["etag"] == etag
+        assert result.headers["cache-control"] == "private, max-age=60"
+
+    def test_weak_etag_matches(self):
+        """Test a weak validator from the client matches the strong ETag"""
+        etag = payload_etag(self.payload)
+
+        result = etag_response(self.payload, make_request(f"W/{etag}"), Response())
+
+        assert result.status_code == 304
+
+    def test_wildcard_matches(self):
+        """Test If-None-Match: * matches any current representation"""
+        result = etag_response(self.payload, make_request("*"), Response())
+
+        assert result.status_code == 304
+
+    def test_etag_list_matches(self):
+        """Test a comma-separated If-None-Match list matches any member"""
+        etag = payload_etag(self.payload)
+
+        result = etag_response(self.payload, make_request(f'"stale", {etag}'), Response())
+
+        assert result.status_code == 304
+
+    def test_stale_etag_returns_none(self):
+        """Test a non-matching If-None-Match falls through to a full response"""
+        response = Response()
+
+        result = etag_response(self.payload, make_request('"stale"'), response)
+
+        assert result is None
+        assert response.headers["etag"] == payload_etag(self.payload)
+
+    def test_etag_changes_with_payload(self):
+        """Test a different payload produces a different ETag"""
+        assert payload_etag(self.payload) != payload_etag({**self.payload, "user": "Member"})
+
+    def test_etag_matches_without_header(self):
+        """Test a missing or empty If-None-Match never matches"""
+        assert etag_matches(None, '"abc"') is False
+        assert etag_matches("", '"abc"') is False
+
+
+class TestEtagEndpoints:
+    """Test cases for endpoints that revalidate with ETags"""
+
+    @pytest.mark.asyncio
+    async def test_terminology_templates_revalidation(self):
+        """Test templates return ETag headers and a 304 on revalidation"""
+        response = Response()
+        templates = await get_terminology_templates(make_request(), response, current_user=Mock())
+
+        assert templates == _terminology_templates()
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, max-age=60"
+
+        result = await get_terminology_templates(make_request(etag), Response(), current_user=Mock())
+
+        assert result.status_code == 304
+        assert result.body == b""
+
+    @pytest.mark.asyncio
+    async def test_resource_tree_revalidation(self):
+        """Test the resource tree returns a 304 until the tree changes"""
+        current_user = Mock(scopes=frozenset({"resource:read"}), tenant_id=uuid.uuid4())
+        tree = ResourceTreeResponse(tree=[], total_nodes=0, max_depth=0)
+
+        with patch("src.api.v1.resources.ResourceService") as service_cls:
+            service_cls.return_value.get_resource_tree = AsyncMock(return_value=tree)
+
+            response = Response()
+            result = await get_resource_tree(
+                make_request(), response, root_id=None, max_depth=None,
+                current_user=current_user, db=AsyncMock()
+            )
+            assert result == tree
+            etag = response.headers["etag"]
+
+            result = await get_resource_tree(
+                make_request(etag), Response(), root_id=None, max_depth=None,
+                current_user=current_user, db=AsyncMock()
+            )
+            assert result.status_code == 304
+            assert result.body == b""
+
+            # A changed tree no longer matches the client's copy
+            service_cls.return_value.get_resource_tree = AsyncMock(
+                return_value=ResourceTreeResponse(tree=[], total_nodes=1, max_depth=0)
+            )
+            result = await get_resource_tree(
+                make_request(etag), Response(), root_id=None, max_depth=None,
+                current_user=current_user, db=AsyncMock()
+            )
+            assert result.total_nodes == 1
+
+    @pytest.mark.asyncio
+    async def test_avatar_urls_revalidation(self):
+        """Test avatar URLs answer a weak ETag inside an If-None-Match list with a 304"""
+        urls = {"medium": "/api/v1/users/avatars/abc_medium.png"}
+
+        with patch("src.api.v1.avatars.AvatarService") as service_cls:
+            service_cls.return_value.generate_avatar_urls = AsyncMock(return_value=urls)
+
+            response = Response()
+            result = await get_avatar_urls("user-1", make_request(), response, current_user=Mock(), db=AsyncMock())
+            assert result == urls
+            etag = response.headers["etag"]
+            assert etag.startswith('W/"')
+            assert response.headers["cache-control"] == "private, max-age=0"
+
+            result = await get_avatar_urls(
+                "user-1", make_request(f'W/"stale", {etag}'), Response(), current_user=Mock(), db=AsyncMock()
+            )
+            assert result.status_code == 304
+            assert result.body == b""
+
+    @pytest.mark.asyncio
+    async def test_serve_avatar_revalidation(self, tmp_path):
+        """Test avatar files honour weak and * If-None-Match forms"""
+        (tmp_path / "abc_medium.png").write_bytes(b"png")
+
+        with patch("src.api.v1.avatars.AVATAR_ROOT", tmp_path), \
+                patch("src.api.v1.avatars.AVATAR_ROOT_PREFIX", str(tmp_path) + os.sep):
+            response = await serve_avatar("abc_medium.png", make_request())
+            etag = response.headers["etag"]
+            assert response.status_code == 200
+
+            for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+                result = await serve_avatar("abc_medium.png", make_request(if_none_match))
+                assert result.status_code == 304
+                assert result.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+            result = await serve_avatar("abc_medium.png", make_request('"stale"'))
+            assert result.status_code == 200
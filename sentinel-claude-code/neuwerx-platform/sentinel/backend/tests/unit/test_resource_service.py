@@ -238,15 +238,10 @@ class TestResourceService:
     @pytest.mark.asyncio
     async def test_get_resource_detail(self, resource_service, mock_db, sample_tenant, sample_resource):
         """Test detailed resource retrieval"""
-        # Mock resource found
-        resource_result = Mock()
-        resource_result.scalar_one_or_none.return_value = sample_resource
-        
-        # Mock child count
-        child_count_result = Mock()
-        child_count_result.scalar.return_value = 2
-        
-        mock_db.execute.side_effect = [resource_result, resource_result, child_count_result]
+        # Mock resource found together with its child count
+        detail_result = Mock()
+        detail_result.one_or_none.return_value = (sample_resource, 2)
+        mock_db.execute.return_value = detail_result
         
         # Execute
         result = await resource_service.get_resource_detail(sample_resource.id, sample_tenant.id)
@@ -255,6 +250,7 @@ class TestResourceService:
         assert isinstance(result, ResourceDetailResponse)
         assert result.id == sample_resource.id
         assert result.child_count == 2
+        assert mock_db.execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_list_resources_basic(self, resource_service, mock_db, sample_tenant):
@@ -310,6 +306,44 @@ class TestResourceService:
         # Verify filtering was applied (check call count)
         assert mock_db.execute.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_list_resources_cursor(self, resource_service, mock_db, sample_tenant, sample_resource, sample_parent_resource):
+        """Test keyset pagination skips the count query and returns a next cursor"""
+        first_page = ResourceQuery(limit=1)
+
+        first_result = Mock()
+        first_result.scalar.return_value = 2
+        resources_result = Mock()
+        resources_result.scalars.return_value.all.return_value = [sample_resource, sample_parent_resource]
+        mock_db.execute.side_effect = [first_result, resources_result]
+
+        result = await resource_service.list_resources(sample_tenant.id, first_page)
+
+        assert result.has_next is True
+        assert result.next_cursor is not None
+        assert [item.id for item in result.items] == [sample_resource.id]
+
+        # Follow the cursor
+        mock_db.execute.reset_mock()
+        next_result = Mock()
+        next_result.scalars.return_value.all.return_value = [sample_parent_resource]
+        mock_db.execute.side_effect = [next_result]
+
+        result = await resource_service.list_resources(
+            sample_tenant.id, ResourceQuery(limit=1, cursor=result.next_cursor)
+        )
+
+        assert mock_db.execute.call_count == 1
+        assert result.total is None
+        assert result.has_next is False
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_resources_invalid_cursor(self, resource_service, mock_db, sample_tenant):
+        """Test a malformed cursor is rejected"""
+        with pytest.raises(ValidationError):
+            await resource_service.list_resources(sample_tenant.id, ResourceQuery(cursor="not-a-cursor"))
+
     @pytest.mark.asyncio
     async def test_update_resource_success(self, resource_service, mock_db, sample_tenant, sample_resource):
         """Test successful resource update"""
@@ -494,15 +528,10 @@ class TestResourceService:
     @pytest.mark.asyncio
     async def test_get_resource_tree_with_root(self, resource_service, mock_db, sample_tenant, sample_resource):
         """Test getting resource subtree from specific root"""
-        # Mock root resource found
-        root_result = Mock()
-        root_result.scalar_one_or_none.return_value = sample_resource
-        
-        # Mock tree resources
+        # Mock subtree resources returned by the recursive query
         tree_result = Mock()
         tree_result.scalars.return_value.all.return_value = [sample_resource]
-        
-        mock_db.execute.side_effect = [root_result, tree_result]
+        mock_db.execute.return_value = tree_result
         
         # Execute
         result = await resource_service.get_resource_tree(
@@ -513,19 +542,30 @@ class TestResourceService:
         # Verify result
         assert isinstance(result, ResourceTreeResponse)
         assert result.total_nodes == 1
+        assert mock_db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_resource_tree_root_not_found(self, resource_service, mock_db, sample_tenant):
+        """Test getting resource subtree from a missing root"""
+        # Mock recursive query finding no root
+        tree_result = Mock()
+        tree_result.scalars.return_value.all.return_value = []
+        mock_db.execute.return_value = tree_result
+        
+        # Execute and verify
+        with pytest.raises(NotFoundError):
+            await resource_service.get_resource_tree(
+                sample_tenant.id,
+                root_id=uuid.uuid4()
+            )
 
     @pytest.mark.asyncio
     async def test_get_resource_permissions(self, resource_service, mock_db, sample_tenant, sample_resource):
         """Test getting resource permissions"""
-        # Mock resource found
-        resource_result = Mock()
-        resource_result.scalar_one_or_none.return_value = sample_resource
-        
-        # Mock permissions
+        # Mock resource found with no permissions outer-joined
         permissions_result = Mock()
-        permissions_result.scalars.return_value.all.return_value = []
-        
-        mock_db.execute.side_effect = [resource_result, permissions_result]
+        permissions_result.all.return_value = [(sample_resource, None)]
+        mock_db.execute.return_value = permissions_result
         
         # Execute
         result = await resource_service.get_resource_permissions(
@@ -542,35 +582,25 @@ class TestResourceService:
     async def test_get_resource_statistics(self, resource_service, mock_db, sample_tenant):
         """Test getting resource statistics"""
         # Mock statistics queries
-        total_result = Mock()
-        total_result.scalar.return_value = 10
-        
-        active_result = Mock()
-        active_result.scalar.return_value = 8
-        
-        type_result = Mock()
-        type_result.fetchall.return_value = [('app', 5), ('service', 3)]
-        
-        depth_result = Mock()
-        depth_result.scalar.return_value = 4
-        
-        root_result = Mock()
-        root_result.scalar.return_value = 2
-        
-        mock_db.execute.side_effect = [
-            total_result, active_result, type_result, depth_result, root_result
+        stats_result = Mock()
+        stats_result.all.return_value = [
+            Mock(type='app', total=5, active=4, roots=2, path_length=4),
+            Mock(type='service', total=3, active=2, roots=0, path_length=None)
         ]
+        mock_db.execute.return_value = stats_result
         
         # Execute
         result = await resource_service.get_resource_statistics(sample_tenant.id)
         
         # Verify result
         assert isinstance(result, ResourceStatistics)
-        assert result.total_resources == 10
-        assert result.active_resources == 8
+        assert result.total_resources == 8
+        assert result.active_resources == 6
         assert result.inactive_resources == 2
         assert result.by_type == {'app': 5, 'service': 3}
         assert result.total_root_resources == 2
+        assert result.max_hierarchy_depth == 2
+        assert mock_db.execute.call_count == 1
 
     def test_validate_hierarchy_rules_valid(self, resource_service):
         """Test valid hierarchy rules"""
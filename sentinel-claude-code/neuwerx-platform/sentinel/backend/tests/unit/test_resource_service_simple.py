@@ -292,41 +292,24 @@ async def test_get_resource_tree_basic(resource_service, mock_db, sample_tenant_
 async def test_get_resource_statistics(resource_service, mock_db, sample_tenant_id):
     """Test getting resource statistics"""
     # Mock statistics queries
-    total_result = Mock()
-    total_result.scalar.return_value = 10
-    
-    active_result = Mock()
-    active_result.scalar.return_value = 8
-    
-    type_result = Mock()
-    type_result.fetchall.return_value = [('app', 5), ('service', 3)]
-    
-    depth_result = Mock()
-    depth_result.scalar.return_value = 4
-    
-    root_result = Mock()
-    root_result.scalar.return_value = 2
-    
-    mock_db.execute.side_effect = [
-        total_result, active_result, type_result, depth_result, root_result
+    stats_result = Mock()
+    stats_result.all.return_value = [
+        Mock(type='app', total=5, active=4, roots=2, path_length=4),
+        Mock(type='service', total=3, active=2, roots=0, path_length=None)
     ]
+    mock_db.execute.return_value = stats_result
     
-    # Mock ResourceStatistics
-    with patch('src.services.resource_service.ResourceStatistics') as mock_stats:
-        expected_stats = Mock()
-        expected_stats.total_resources = 10
-        expected_stats.active_resources = 8
-        expected_stats.inactive_resources = 2
-        expected_stats.by_type = {'app': 5, 'service': 3}
-        mock_stats.return_value = expected_stats
-        
-        # Execute
-        result = await resource_service.get_resource_statistics(sample_tenant_id)
-        
-        # Verify result
-        assert result.total_resources == 10
-        assert result.active_resources == 8
-        assert result.inactive_resources == 2
+    # Execute
+    result = await resource_service.get_resource_statistics(sample_tenant_id)
+    
+    # Verify the per-type rows are rolled up
+    assert isinstance(result, ResourceStatistics)
+    assert result.total_resources == 8
+    assert result.active_resources == 6
+    assert result.inactive_resources == 2
+    assert result.by_type == {'app': 5, 'service': 3}
+    assert result.total_root_resources == 2
+    assert result.max_hierarchy_depth == 2
 
 
 def test_validate_hierarchy_rules_valid():
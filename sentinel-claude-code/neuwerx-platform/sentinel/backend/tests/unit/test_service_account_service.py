@@ -323,7 +323,42 @@ class TestServiceAccountService:
         
         # Verify
         assert result is None
-    
+
+    @pytest.mark.asyncio
+    async def test_validate_by_id(self, service_account_service, mock_db, sample_service_account):
+        """Test validating an account's secret with a single lookup"""
+        sa_result = Mock()
+        sa_result.one_or_none.return_value = sample_service_account
+        mock_db.execute.return_value = sa_result
+
+        is_valid, client_id, is_active = await service_account_service.validate_by_id(
+            sample_service_account.id,
+            sample_service_account.service_account_key,
+            tenant_id=sample_service_account.tenant_id
+        )
+
+        assert is_valid is True
+        assert client_id == service_account_service._generate_client_id_from_account(sample_service_account)
+        assert is_active is True
+        assert mock_db.execute.call_count == 1
+
+        is_valid, _, _ = await service_account_service.validate_by_id(
+            sample_service_account.id,
+            "wrong_secret",
+            tenant_id=sample_service_account.tenant_id
+        )
+        assert is_valid is False
+
+    @pytest.mark.asyncio
+    async def test_validate_by_id_not_found(self, service_account_service, mock_db):
+        """Test validating a missing service account"""
+        sa_result = Mock()
+        sa_result.one_or_none.return_value = None
+        mock_db.execute.return_value = sa_result
+
+        with pytest.raises(NotFoundError):
+            await service_account_service.validate_by_id(uuid.uuid4(), "secret", tenant_id=uuid.uuid4())
+
     def test_generate_client_id_from_account(self, service_account_service, sample_service_account):
         """Test client ID generation from service account"""
         client_id = service_account_service._generate_client_id_from_account(sample_service_account)
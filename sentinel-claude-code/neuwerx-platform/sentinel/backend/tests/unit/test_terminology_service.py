@@ -0,0 +1,168 @@
+"""
+Unit tests for the shared terminology cache in TerminologyService
+"""
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services import terminology_service
+from src.services.terminology_service import (
+    TERMINOLOGY_CACHE_TTL,
+    TerminologyService,
+    _terminology_cache,
+)
+
+
+def tenant_result(tenant_id):
+    """Result of the get_tenant query for a tenant with the given id"""
+    tenant = Mock()
+    tenant.name = f"Tenant {tenant_id}"
+    tenant.code = str(tenant_id)[:8]
+    tenant.get_terminology_with_metadata.side_effect = lambda: {"terminology": {"tenant": "Tenant"}}
+    result = Mock()
+    result.scalar_one_or_none.return_value = tenant
+    return result
+
+
+def descendants_result(*tenant_ids):
+    """Result of a statement returning descendant tenant ids"""
+    result = Mock()
+    result.fetchall.return_value = [(tenant_id,) for tenant_id in tenant_ids]
+    return result
+
+
+class TestTerminologyCache:
+    """Test cases for the module-level terminology cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Each test starts and ends with an empty shared cache"""
+        _terminology_cache.clear()
+        yield
+        _terminology_cache.clear()
+
+    @pytest.fixture
+    def mock_db(self):
+        """Mock database session"""
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture
+    def mock_time(self):
+        """Controllable monotonic clock for the service module"""
+        with patch.object(terminology_service, "time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            yield mock_time
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_across_instances(self, mock_db, mock_time):
+        """Test a per-request service reuses entries cached by an earlier one"""
+        tenant_id = uuid4()
+        mock_db.execute.return_value = tenant_result(tenant_id)
+
+        first = await TerminologyService(mock_db).get_terminology(tenant_id)
+        second = await TerminologyService(mock_db).get_terminology(tenant_id)
+
+        assert second is first
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, mock_db, mock_time):
+        """Test a cached entry is served until the TTL and refetched after it"""
+        tenant_id = uuid4()
+        mock_db.execute.return_value = tenant_result(tenant_id)
+        service = TerminologyService(mock_db)
+
+        first = await service.get_terminology(tenant_id)
+
+        mock_time.monotonic.return_value = 1000.0 + TERMINOLOGY_CACHE_TTL - 1
+        assert await service.get_terminology(tenant_id) is first
+        assert mock_db.execute.await_count == 1
+
+        mock_time.monotonic.return_value = 1000.0 + TERMINOLOGY_CACHE_TTL
+        refreshed = await service.get_terminology(tenant_id)
+        assert refreshed is not first
+        assert mock_db.execute.await_count == 2
+        assert _terminology_cache[str(tenant_id)][0] == 1000.0 + 2 * TERMINOLOGY_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_evicted_when_full(self, mock_db, mock_time):
+        """Test the cache stays within its bound by evicting the oldest entry"""
+        tenant_ids = [uuid4() for _ in range(4)]
+        mock_db.execute.side_effect = [tenant_result(tenant_id) for tenant_id in tenant_ids]
+        service = TerminologyService(mock_db)
+
+        with patch.object(terminology_service, "TERMINOLOGY_CACHE_MAX_ENTRIES", 3):
+            for tenant_id in tenant_ids:
+                await service.get_terminology(tenant_id)
+
+        assert len(_terminology_cache) == 3
+        assert list(_terminology_cache) == [str(tenant_id) for tenant_id in tenant_ids[1:]]
+
+    @pytest.mark.asyncio
+    async def test_refreshing_existing_entry_does_not_evict(self, mock_db, mock_time):
+        """Test refetching an expired key at the bound replaces it in place"""
+        tenant_ids = [uuid4() for _ in range(3)]
+        mock_db.execute.side_effect = [tenant_result(tenant_id) for tenant_id in tenant_ids] + [
+            tenant_result(tenant_ids[2])
+        ]
+        service = TerminologyService(mock_db)
+
+        with patch.object(terminology_service, "TERMINOLOGY_CACHE_MAX_ENTRIES", 3):
+            for tenant_id in tenant_ids:
+                await service.get_terminology(tenant_id)
+            mock_time.monotonic.return_value = 1000.0 + TERMINOLOGY_CACHE_TTL
+            await service.get_terminology(tenant_ids[2])
+
+        assert set(_terminology_cache) == {str(tenant_id) for tenant_id in tenant_ids}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_hierarchy_removes_descendants(self, mock_db, mock_time):
+        """Test invalidating a tenant drops its children and grandchildren only"""
+        root_id, child_id, grandchild_id, other_id = uuid4(), uuid4(), uuid4(), uuid4()
+        for tenant_id in (root_id, child_id, grandchild_id, other_id):
+            _terminology_cache[str(tenant_id)] = (2000.0, {"tenant_id": tenant_id})
+        mock_db.execute.return_value = descendants_result(child_id, grandchild_id)
+
+        await TerminologyService(mock_db)._invalidate_cache_hierarchy(root_id)
+
+        assert list(_terminology_cache) == [str(other_id)]
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_terminology_invalidates_descendants(self, mock_db, mock_time):
+        """Test resetting a parent drops the cached terminology its descendants inherit"""
+        root_id, child_id, grandchild_id = uuid4(), uuid4(), uuid4()
+        for tenant_id in (root_id, child_id, grandchild_id):
+            _terminology_cache[str(tenant_id)] = (2000.0, {"tenant_id": tenant_id})
+        mock_db.execute.side_effect = [
+            tenant_result(root_id),                          # get_tenant
+            descendants_result(child_id, grandchild_id),     # recursive descendant lookup
+            tenant_result(root_id),                          # get_terminology refetch
+        ]
+
+        await TerminologyService(mock_db).reset_terminology(root_id)
+
+        assert list(_terminology_cache) == [str(root_id)]
+        assert _terminology_cache[str(root_id)][0] == 1000.0 + TERMINOLOGY_CACHE_TTL
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_with_children_pops_returned_ids(self, mock_db, mock_time):
+        """Test applying to children invalidates the ids the UPDATE returned without another lookup"""
+        root_id, child_id, grandchild_id, other_id = uuid4(), uuid4(), uuid4(), uuid4()
+        for tenant_id in (root_id, child_id, grandchild_id, other_id):
+            _terminology_cache[str(tenant_id)] = (2000.0, {"tenant_id": tenant_id})
+        mock_db.execute.side_effect = [
+            tenant_result(root_id),                          # get_tenant
+            descendants_result(child_id, grandchild_id),     # UPDATE ... RETURNING id
+            tenant_result(root_id),                          # get_terminology refetch
+        ]
+
+        await TerminologyService(mock_db).update_terminology(
+            root_id, {"tenant": "Fleet"}, apply_to_children=True
+        )
+
+        assert set(_terminology_cache) == {str(root_id), str(other_id)}
+        assert mock_db.execute.await_count == 3